@@ -0,0 +1,59 @@
+"""
+HTTP caching helpers (ETag / If-None-Match / Cache-Control)
+
+Read endpoints serve pre-rendered bodies whose content never changes during a
+deployment, so clients can revalidate with If-None-Match and receive
+304 Not Modified instead of downloading the body again.
+"""
+
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+from .config import get_settings
+from .structures import RenderedStructure
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Uses the weak comparison required by RFC 9110 for If-None-Match:
+    'W/' prefixes are ignored and '*' matches any current representation.
+    """
+    if not if_none_match:
+        return False
+
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque_tag:
+            return True
+    return False
+
+
+def cached_response(request: Request, rendered: RenderedStructure) -> Response:
+    """
+    Build the response for a pre-rendered body, honouring If-None-Match.
+
+    Args:
+        request: Incoming request
+        rendered: Pre-rendered body and its ETag
+
+    Returns:
+        304 Not Modified if the client already holds the current representation,
+        otherwise a 200 response with the encoded body
+    """
+    headers = {
+        "ETag": rendered.etag,
+        "Cache-Control": get_settings().cache_control
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), rendered.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=rendered.body, media_type="application/json", headers=headers)
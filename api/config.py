@@ -0,0 +1,89 @@
+"""
+Runtime configuration for the API
+
+Every setting can be overridden with an environment variable named after the
+field and prefixed with QUESTIONNAIRES_ (e.g. QUESTIONNAIRES_CACHE_CONTROL).
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+ENV_PREFIX = "QUESTIONNAIRES_"
+
+
+class Settings(BaseModel):
+    """API settings."""
+    cache_control: str = Field(
+        "public, no-cache",
+        description="Cache-Control header sent with questionnaire list, metadata and structure responses"
+    )
+    max_batch_size: int = Field(
+        1000,
+        description="Maximum number of submissions accepted by a submit-batch request"
+    )
+    max_stream_line_bytes: int = Field(
+        1_048_576,
+        description="Maximum size of one NDJSON record accepted by a submit-stream request"
+    )
+    fast_responses: bool = Field(
+        False,
+        description="Encode scoring results once with the fastest available JSON encoder (orjson if installed) instead of re-validating them through the response models"
+    )
+    preload_questionnaires: bool = Field(
+        False,
+        description="Import and render every questionnaire at startup instead of on first use"
+    )
+    stage_timing: bool = Field(
+        False,
+        description="Time each stage of validate/submit requests and aggregate per-questionnaire histograms (GET /timings)"
+    )
+    server_timing: bool = Field(
+        False,
+        description="Also return the per-stage breakdown in a Server-Timing response header (implies stage_timing)"
+    )
+    slow_request_ms: Optional[float] = Field(
+        None,
+        description="Log validate/submit requests slower than this many milliseconds, with their stage timings and answer shapes (never values) (unset disables the log)"
+    )
+    metrics_enabled: bool = Field(
+        True,
+        description="Count questionnaire requests and outcomes and observe their latency (GET /metrics)"
+    )
+    metrics_dir: Optional[str] = Field(
+        None,
+        description="Directory shared by the workers of one server where each writes its metrics snapshot; /metrics aggregates all of them"
+    )
+    profile_sample_rate: float = Field(
+        0.0,
+        description="Fraction of validate/submit requests profiled with cProfile (0 disables sampling)"
+    )
+    profile_header: Optional[str] = Field(
+        None,
+        description="Profile validate/submit requests carrying this header with a non-empty value (e.g. X-Profile)"
+    )
+    profile_questionnaires: Optional[str] = Field(
+        None,
+        description="Comma-separated questionnaire ids whose validate/submit requests are always profiled"
+    )
+    profile_dir: Optional[str] = Field(
+        None,
+        description="Directory request profiles are written to (default: questionnaires-profiles in the system temp directory)"
+    )
+    profile_max_files: int = Field(
+        200,
+        description="Number of most recent request profiles kept in profile_dir"
+    )
+
+
+@lru_cache()
+def get_settings() -> Settings:
+    """Load settings from the environment (cached for the process lifetime)."""
+    overrides = {
+        name: os.environ[ENV_PREFIX + name.upper()]
+        for name in Settings.model_fields
+        if ENV_PREFIX + name.upper() in os.environ
+    }
+    return Settings(**overrides)
@@ -1,75 +1,136 @@
 """
 Dependencies and Questionnaire Registry for the API
+
+The registry is built from questionnaire manifests (see api.discovery), so it
+knows every questionnaire's id, location and listing metadata without
+importing any of them. Each questionnaire module is imported, instantiated
+and rendered the first time it is used, unless
+QUESTIONNAIRES_PRELOAD_QUESTIONNAIRES is set (see QuestionnaireRegistry.warm()).
 """
 
-from typing import Dict, Optional, Any
-from questionnaires import (
-    QIDSSR16, QIDSError,
-    MDQ, MDQError,
-    ASRM, ASRMError,
-    Epworth, EpworthError,
-    EQ5D5L, EQ5D5LError,
-    Fagerstrom, FagerstromError,
-    MARS, MARSError,
-    MAThyS, MAThySError,
-    PRISEM, PRISEMError,
-    PSQI, PSQIError,
-    STAIYA, STAIYAError,
-    AIMShort, AIMShortError,
-    ALSShort, ALSShortError,
-    AQ12, AQ12Error,
-    ASRS, ASRSError,
-    BIS10, BIS10Error,
-    CSM, CSMError,
-    CTQ, CTQError,
-    CTI, CTIError,
-    WURS25, WURS25Error
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Any, Tuple
+
+from .config import get_settings
+from .discovery import CATEGORIES, QuestionnaireDescriptor, discover_questionnaires
+from .scoring import ScoringAdapter
+from .structures import (
+    RenderedStructure,
+    normalize_gender,
+    render_listing,
+    render_json,
+    render_metadata,
+    render_variants
 )
 
 
+class LoadedQuestionnaire(NamedTuple):
+    """A questionnaire instance with everything derived from it at load time."""
+    instance: Any
+    adapter: ScoringAdapter
+    metadata: RenderedStructure
+    structures: Dict[Optional[str], RenderedStructure]
+
+
 class QuestionnaireRegistry:
     """
     Registry for managing questionnaire instances.
     Provides centralized access to all questionnaires organized by category.
+    
+    Questionnaires are loaded on first use: the module is imported, the class
+    instantiated, its scoring dispatch resolved and its metadata and
+    structures rendered once. Loading is thread-safe; concurrent first
+    requests for the same questionnaire load it exactly once.
     """
     
-    def __init__(self):
-        """Initialize the registry with all available questionnaires."""
-        # Auto questionnaires (self-report)
-        self.auto_questionnaires: Dict[str, Any] = {
-            "QIDS-SR16.fr": QIDSSR16(),
-            "MDQ.fr": MDQ(),
-            "ASRM.fr": ASRM(),
-            "Epworth.fr": Epworth(),
-            "EQ-5D-5L.fr": EQ5D5L(),
-            "Fagerstrom.fr": Fagerstrom(),
-            "MARS.fr": MARS(),
-            "MAThyS.fr": MAThyS(),
-            "PRISE-M.fr": PRISEM(),
-            "PSQI.fr": PSQI(),
-            "STAI-YA.fr": STAIYA(),
-            "AIM-Short.fr": AIMShort(),
-            "ALS-Short.fr": ALSShort(),
-            "AQ12.fr": AQ12(),
-            "ASRS.fr": ASRS(),
-            "BIS10.fr": BIS10(),
-            "CSM.fr": CSM(),
-            "CTQ.fr": CTQ(),
-            "CTI.fr": CTI(),
-            "WURS25.fr": WURS25()
-        }
+    def __init__(
+        self,
+        descriptors: Optional[Iterable[QuestionnaireDescriptor]] = None,
+        preload: bool = False
+    ):
+        """
+        Initialize the registry from questionnaire descriptors.
         
-        # Hetero questionnaires (clinician-rated)
-        from questionnaires import ALDA, CGI, EGF, EtatPatient, FAST, MADRS, YMRS
-        self.hetero_questionnaires: Dict[str, Any] = {
-            "Alda.fr": ALDA(),
-            "CGI.fr": CGI(),
-            "EGF.fr": EGF(),
-            "EtatPatient.fr": EtatPatient(),
-            "FAST.fr": FAST(),
-            "MADRS.fr": MADRS(),
-            "YMRS.fr": YMRS()
+        Args:
+            descriptors: Questionnaires to serve (nothing is imported yet);
+                discovered from the installed manifests by default
+            preload: Load every questionnaire immediately (see warm())
+        """
+        if descriptors is None:
+            descriptors = discover_questionnaires()
+        self._descriptors: Dict[str, Dict[str, QuestionnaireDescriptor]] = {
+            category: {} for category in CATEGORIES
         }
+        for descriptor in descriptors:
+            self._descriptors[descriptor.category][descriptor.questionnaire_id] = descriptor
+        
+        self._loaded: Dict[Tuple[str, str], LoadedQuestionnaire] = {}
+        self._listings: Dict[str, RenderedStructure] = {}
+        self._profile_tables: Dict[Tuple[str, str, Optional[str]], RenderedStructure] = {}
+        self._lock = threading.Lock()
+        
+        if preload:
+            self.warm()
+    
+    def _load(self, category: str, questionnaire_id: str) -> Optional[LoadedQuestionnaire]:
+        """Get a loaded questionnaire, loading it on first use (None if unknown)."""
+        key = (category, questionnaire_id)
+        loaded = self._loaded.get(key)
+        if loaded is not None:
+            return loaded
+        
+        descriptor = self._descriptors.get(category, {}).get(questionnaire_id)
+        if descriptor is None:
+            return None
+        
+        with self._lock:
+            loaded = self._loaded.get(key)
+            if loaded is None:
+                instance = descriptor.load()
+                loaded = LoadedQuestionnaire(
+                    instance=instance,
+                    adapter=ScoringAdapter(instance),
+                    metadata=render_metadata(instance),
+                    structures=render_variants(instance)
+                )
+                self._loaded[key] = loaded
+        return loaded
+    
+    def warm(self) -> None:
+        """Load every questionnaire and render every listing up front."""
+        for category in CATEGORIES:
+            self.list_questionnaires(category)
+            self.get_listing(category)
+    
+    def is_loaded(self, category: str, questionnaire_id: str) -> bool:
+        """Whether a questionnaire has already been imported and instantiated."""
+        return (category, questionnaire_id) in self._loaded
+    
+    def questionnaire_ids(self, category: str) -> List[str]:
+        """
+        Get the identifiers of a category's questionnaires without loading them.
+        
+        Args:
+            category: 'auto' or 'hetero'
+            
+        Returns:
+            Questionnaire identifiers (empty for an unknown category)
+        """
+        return list(self._descriptors.get(category, {}))
+    
+    def is_known(self, category: str, questionnaire_id: str) -> bool:
+        """Whether a category serves a questionnaire id (without loading it)."""
+        return questionnaire_id in self._descriptors.get(category, {})
+    
+    @property
+    def auto_questionnaires(self) -> Dict[str, Any]:
+        """All auto questionnaire instances (loads them)."""
+        return self.list_questionnaires("auto")
+    
+    @property
+    def hetero_questionnaires(self) -> Dict[str, Any]:
+        """All hetero questionnaire instances (loads them)."""
+        return self.list_questionnaires("hetero")
     
     def get_questionnaire(self, category: str, questionnaire_id: str) -> Optional[Any]:
         """
@@ -82,15 +143,12 @@ class QuestionnaireRegistry:
         Returns:
             Questionnaire instance or None if not found
         """
-        if category == "auto":
-            return self.auto_questionnaires.get(questionnaire_id)
-        elif category == "hetero":
-            return self.hetero_questionnaires.get(questionnaire_id)
-        return None
+        loaded = self._load(category, questionnaire_id)
+        return loaded.instance if loaded is not None else None
     
     def list_questionnaires(self, category: str) -> Dict[str, Any]:
         """
-        Get all questionnaires for a category.
+        Get all questionnaires for a category, loading any not loaded yet.
         
         Args:
             category: 'auto' or 'hetero'
@@ -98,11 +156,123 @@ class QuestionnaireRegistry:
         Returns:
             Dictionary of questionnaire_id -> instance
         """
-        if category == "auto":
-            return self.auto_questionnaires
-        elif category == "hetero":
-            return self.hetero_questionnaires
-        return {}
+        return {
+            q_id: self.get_questionnaire(category, q_id)
+            for q_id in self.questionnaire_ids(category)
+        }
+    
+    def get_adapter(self, category: str, questionnaire_id: str) -> Optional[ScoringAdapter]:
+        """
+        Get the scoring adapter of a questionnaire.
+        
+        Args:
+            category: 'auto' or 'hetero'
+            questionnaire_id: The questionnaire identifier
+            
+        Returns:
+            ScoringAdapter or None if not found
+        """
+        loaded = self._load(category, questionnaire_id)
+        return loaded.adapter if loaded is not None else None
+    
+    def get_listing(self, category: str) -> Optional[RenderedStructure]:
+        """
+        Get the pre-rendered summary list of a category.
+        
+        Args:
+            category: 'auto' or 'hetero'
+            
+        Returns:
+            RenderedStructure (encoded JSON body and ETag) or None for an unknown category
+        """
+        rendered = self._listings.get(category)
+        if rendered is not None or category not in self._descriptors:
+            return rendered
+        
+        # Rendered from manifest metadata: no questionnaire is loaded
+        with self._lock:
+            rendered = self._listings.get(category)
+            if rendered is None:
+                rendered = render_listing(category, {
+                    q_id: descriptor.metadata
+                    for q_id, descriptor in self._descriptors[category].items()
+                })
+                self._listings[category] = rendered
+        return rendered
+    
+    def get_rendered_metadata(self, category: str, questionnaire_id: str) -> Optional[RenderedStructure]:
+        """
+        Get the pre-rendered metadata of a questionnaire.
+        
+        Args:
+            category: 'auto' or 'hetero'
+            questionnaire_id: The questionnaire identifier
+            
+        Returns:
+            RenderedStructure (encoded JSON body and ETag) or None if not found
+        """
+        loaded = self._load(category, questionnaire_id)
+        return loaded.metadata if loaded is not None else None
+    
+    def get_profile_table(
+        self,
+        category: str,
+        questionnaire_id: str,
+        value_set: Optional[str] = None
+    ) -> Optional[RenderedStructure]:
+        """
+        Get the pre-rendered table of precomputed per-profile values.
+        
+        Only questionnaires with a finite profile space provide one (EQ-5D-5L,
+        get_profile_table()); it is rendered on the first request.
+        
+        Args:
+            category: 'auto' or 'hetero'
+            questionnaire_id: The questionnaire identifier
+            value_set: Optional value set of the utility index
+            
+        Returns:
+            RenderedStructure (encoded JSON body and ETag) or None if the
+            questionnaire is unknown or has no profile table
+            
+        Raises:
+            ValueError: If the questionnaire rejects the value set
+        """
+        key = (category, questionnaire_id, value_set)
+        rendered = self._profile_tables.get(key)
+        if rendered is not None:
+            return rendered
+        questionnaire = self.get_questionnaire(category, questionnaire_id)
+        if questionnaire is None or not hasattr(questionnaire, "get_profile_table"):
+            return None
+        rendered = render_json(questionnaire.get_profile_table(value_set))
+        return self._profile_tables.setdefault(key, rendered)
+    
+    def get_structure(
+        self,
+        category: str,
+        questionnaire_id: str,
+        gender: Optional[str] = None
+    ) -> Optional[RenderedStructure]:
+        """
+        Get the pre-rendered structure of a questionnaire.
+        
+        Args:
+            category: 'auto' or 'hetero'
+            questionnaire_id: The questionnaire identifier
+            gender: Optional gender for questionnaires with branching logic
+            
+        Returns:
+            RenderedStructure (encoded JSON body and ETag) or None if not found
+        """
+        loaded = self._load(category, questionnaire_id)
+        if loaded is None:
+            return None
+        rendered = loaded.structures.get(normalize_gender(gender))
+        if rendered is None:
+            # Questionnaire has no gender variants
+            rendered = loaded.structures[None]
+        return rendered
     
     def get_questionnaire_metadata(self, category: str, questionnaire_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -122,7 +292,7 @@ class QuestionnaireRegistry:
 
 
 # Global registry instance
-registry = QuestionnaireRegistry()
+registry = QuestionnaireRegistry(preload=get_settings().preload_questionnaires)
 
 
 def get_registry() -> QuestionnaireRegistry:
@@ -0,0 +1,159 @@
+"""
+Questionnaire discovery from manifests
+
+A manifest is a JSON file named manifest.json at the root of a package. It
+lists every questionnaire the package provides, with the module and class to
+import and the metadata shown in questionnaire lists, so the registry can be
+built without importing any instrument module:
+
+    {"questionnaires": [
+        {"id": "QIDS-SR16.fr", "category": "auto",
+         "module": "questionnaires.auto.qids", "class": "QIDSSR16",
+         "name": "...", "abbreviation": "QIDS-SR16", "language": "fr-FR",
+         "description": "..."}
+    ]}
+
+The built-in instruments are described by questionnaires/manifest.json.
+Separately installed instrument packages register their own manifest with an
+entry point in the "questionnaires_api.manifests" group whose value is the
+package containing manifest.json:
+
+    [project.entry-points."questionnaires_api.manifests"]
+    my_instruments = "my_instruments"
+
+Regenerate the built-in manifest after adding or editing an instrument with:
+
+    python -m api.discovery > questionnaires/manifest.json
+"""
+
+import importlib
+import json
+import sys
+from importlib import metadata as importlib_metadata
+from importlib import resources
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+
+ENTRY_POINT_GROUP = "questionnaires_api.manifests"
+MANIFEST_NAME = "manifest.json"
+BUILTIN_PACKAGE = "questionnaires"
+
+# Categories served by the API routes
+CATEGORIES: Tuple[str, ...] = ("auto", "hetero")
+
+# Metadata fields stored in manifests (those used by questionnaire lists)
+LISTING_FIELDS: Tuple[str, ...] = ("name", "abbreviation", "language", "description")
+
+
+class ManifestError(Exception):
+    """Raised when a manifest is malformed or declares a duplicate questionnaire."""
+    pass
+
+
+class QuestionnaireDescriptor(NamedTuple):
+    """Where to find a questionnaire and how to list it, without importing it."""
+    questionnaire_id: str
+    category: str
+    module: str
+    class_name: str
+    metadata: Dict[str, Any]
+
+    def load(self) -> Any:
+        """Import the questionnaire module and instantiate its class."""
+        return getattr(importlib.import_module(self.module), self.class_name)()
+
+
+def parse_manifest(data: Dict[str, Any], source: str) -> List[QuestionnaireDescriptor]:
+    """
+    Build descriptors from a decoded manifest.
+
+    Args:
+        data: Decoded manifest document
+        source: Where the manifest came from (for error messages)
+
+    Returns:
+        One descriptor per questionnaire entry
+
+    Raises:
+        ManifestError: If an entry lacks id, category, module or class, or
+            names an unknown category
+    """
+    descriptors = []
+    for index, entry in enumerate(data.get("questionnaires", [])):
+        missing = [key for key in ("id", "category", "module", "class") if not entry.get(key)]
+        if missing:
+            raise ManifestError(f"{source}: entry {index} is missing {', '.join(missing)}")
+        if entry["category"] not in CATEGORIES:
+            raise ManifestError(f"{source}: entry {index} has unknown category '{entry['category']}'")
+        descriptors.append(QuestionnaireDescriptor(
+            questionnaire_id=entry["id"],
+            category=entry["category"],
+            module=entry["module"],
+            class_name=entry["class"],
+            metadata={key: entry.get(key) for key in LISTING_FIELDS}
+        ))
+    return descriptors
+
+
+def read_manifest(package: str) -> List[QuestionnaireDescriptor]:
+    """
+    Read the manifest.json shipped at the root of a package.
+
+    Only the package itself is imported (to locate it), not its instruments.
+    """
+    text = resources.files(package).joinpath(MANIFEST_NAME).read_text(encoding="utf-8")
+    return parse_manifest(json.loads(text), f"{package}/{MANIFEST_NAME}")
+
+
+def discover_questionnaires() -> List[QuestionnaireDescriptor]:
+    """
+    Collect descriptors from the built-in manifest and installed plugins.
+
+    Returns:
+        Descriptors in discovery order (built-in first)
+
+    Raises:
+        ManifestError: If two manifests declare the same category and id
+    """
+    packages = [BUILTIN_PACKAGE]
+    for entry_point in importlib_metadata.entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.value not in packages:
+            packages.append(entry_point.value)
+
+    descriptors = []
+    seen: Dict[Tuple[str, str], str] = {}
+    for package in packages:
+        for descriptor in read_manifest(package):
+            key = (descriptor.category, descriptor.questionnaire_id)
+            if key in seen:
+                raise ManifestError(
+                    f"{package}: questionnaire '{descriptor.questionnaire_id}' "
+                    f"({descriptor.category}) is already provided by {seen[key]}"
+                )
+            seen[key] = package
+            descriptors.append(descriptor)
+    return descriptors
+
+
+def build_manifest(descriptors: Iterable[QuestionnaireDescriptor]) -> Dict[str, Any]:
+    """
+    Build a manifest from live questionnaire metadata.
+
+    Every questionnaire is loaded so that the listing fields are copied from
+    its own get_metadata().
+    """
+    entries = []
+    for descriptor in descriptors:
+        live_metadata = descriptor.load().get_metadata()
+        entries.append({
+            "id": descriptor.questionnaire_id,
+            "category": descriptor.category,
+            "module": descriptor.module,
+            "class": descriptor.class_name,
+            **{key: live_metadata.get(key) for key in LISTING_FIELDS}
+        })
+    return {"questionnaires": entries}
+
+
+if __name__ == "__main__":
+    manifest = build_manifest(read_manifest(BUILTIN_PACKAGE))
+    sys.stdout.write(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n")
@@ -0,0 +1,324 @@
+"""
+Import-time and memory footprint of the questionnaire packages
+
+Every measurement runs in a fresh interpreter, after the shared dependencies
+(pydantic and the questionnaires package itself) are imported, so each row
+is the marginal cost of one instrument:
+
+    import ms / MiB   importing the instrument module (and any module it pulls in)
+    init ms / MiB     instantiating the questionnaire class
+    instance KiB      deep size of the instance (question and option objects,
+                      cached dicts)
+    class KiB         deep size of the class-level data (item texts, tables)
+    questions/options number of questions and answer options
+    largest table     biggest module- or class-level dict/list/tuple the
+                      import created (e.g. a scoring crosswalk)
+
+The "package" row is the shared cost (pydantic plus `import questionnaires`),
+and the "registry" row loads and renders every questionnaire in one process
+as a preloaded worker does (QUESTIONNAIRES_PRELOAD_QUESTIONNAIRES=1).
+Resident memory is read from /proc (Linux); sizes are approximate (objects
+shared with other instances, such as interned strings, are included).
+
+Track releases by saving a report and comparing later runs against it; a
+comparison exits with status 1 when a time or memory figure grows by more
+than the threshold:
+
+    python -m api.footprint
+    python -m api.footprint --output footprint.json
+    python -m api.footprint --compare footprint.json --threshold 20
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+import types
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+# Shared dependencies imported before any measurement
+SHARED_MODULES: Tuple[str, ...] = ("pydantic", "questionnaires")
+
+# Fields compared against a saved report, with the absolute growth ignored as noise
+COMPARED_FIELDS: Dict[str, float] = {
+    "import_ms": 1.0,
+    "import_mib": 0.25,
+    "init_ms": 0.5,
+    "init_mib": 0.25,
+    "instance_kib": 1.0,
+    "class_data_kib": 1.0
+}
+
+# Objects that belong to code, not to an instance's data
+_SKIPPED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    types.FrameType
+)
+
+_MIB = 1024 * 1024
+
+
+def resident_bytes() -> int:
+    """Current resident set size of this process (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def deep_size(root: Any) -> Tuple[int, Counter]:
+    """
+    Size of an object and everything it references, excluding code.
+
+    Returns:
+        Total bytes, and the number of objects per type name
+    """
+    seen = set()
+    stack = [root]
+    total = 0
+    counts: Counter = Counter()
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIPPED_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        counts[type(obj).__name__] += 1
+        stack.extend(gc.get_referents(obj))
+    return total, counts
+
+
+def largest_table(
+    module_names: List[str],
+    class_attributes: Dict[str, Any],
+    class_name: str
+) -> Optional[Tuple[str, int]]:
+    """The biggest module- or class-level dict, list, tuple or set, with its size."""
+    candidates = [(f"{class_name}.{name}", value) for name, value in class_attributes.items()]
+    for module_name in module_names:
+        module = sys.modules.get(module_name)
+        for name, value in vars(module).items() if module else ():
+            if not name.startswith("_"):
+                candidates.append((f"{module_name.rsplit('.', 1)[-1]}.{name}", value))
+
+    largest: Optional[Tuple[str, int]] = None
+    for name, value in candidates:
+        if isinstance(value, (dict, list, tuple, set, frozenset)):
+            size = deep_size(value)[0]
+            if largest is None or size > largest[1]:
+                largest = (name, size)
+    return largest
+
+
+def import_shared() -> None:
+    """Import the shared dependencies."""
+    for shared in SHARED_MODULES:
+        importlib.import_module(shared)
+    # The first model class loads pydantic's plugin machinery
+    from pydantic import create_model
+    create_model("FootprintWarmup", value=(int, 0))
+
+
+def class_data(cls: type) -> Dict[str, Any]:
+    """Data attributes defined on a class (item texts, scoring tables, ...)."""
+    return {
+        name: value
+        for klass in cls.__mro__ if klass is not object
+        for name, value in vars(klass).items()
+        if not name.startswith("_") and not callable(value) and not isinstance(value, (property, staticmethod, classmethod))
+    }
+
+
+def probe(module_name: str, class_name: str) -> Dict[str, Any]:
+    """Measure one questionnaire in this (fresh) interpreter."""
+    import_shared()
+    gc.collect()
+
+    before_modules = set(sys.modules)
+    rss = resident_bytes()
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    import_s = time.perf_counter() - start
+    import_rss = resident_bytes()
+    new_modules = sorted(set(sys.modules) - before_modules)
+
+    start = time.perf_counter()
+    instance = getattr(module, class_name)()
+    init_s = time.perf_counter() - start
+    init_rss = resident_bytes()
+
+    size = deep_size(instance)[0]
+    tables = class_data(type(instance))
+    table = largest_table([name for name in new_modules if name.startswith("questionnaires.")], tables, class_name)
+    questions = instance.get_questions()
+    return {
+        "import_ms": import_s * 1e3,
+        "import_mib": (import_rss - rss) / _MIB,
+        "modules": len(new_modules),
+        "init_ms": init_s * 1e3,
+        "init_mib": (init_rss - import_rss) / _MIB,
+        "instance_kib": size / 1024,
+        "class_data_kib": deep_size(tables)[0] / 1024,
+        "questions": len(questions),
+        "options": sum(len(question.get("options") or ()) for question in questions),
+        "largest_table": table[0] if table else None,
+        "largest_table_kib": table[1] / 1024 if table else 0.0
+    }
+
+
+def probe_shared() -> Dict[str, Any]:
+    """Measure the shared dependencies in this (fresh) interpreter."""
+    rss = resident_bytes()
+    start = time.perf_counter()
+    import_shared()
+    return {
+        "import_ms": (time.perf_counter() - start) * 1e3,
+        "import_mib": (resident_bytes() - rss) / _MIB,
+        "modules": len(sys.modules)
+    }
+
+
+def probe_registry() -> Dict[str, Any]:
+    """Measure loading every questionnaire through the registry in this (fresh) interpreter."""
+    from .dependencies import QuestionnaireRegistry
+
+    import_shared()
+    gc.collect()
+    rss = resident_bytes()
+    start = time.perf_counter()
+    QuestionnaireRegistry(preload=True)
+    return {
+        "init_ms": (time.perf_counter() - start) * 1e3,
+        "init_mib": (resident_bytes() - rss) / _MIB,
+        "modules": sum(1 for name in sys.modules if name.startswith("questionnaires."))
+    }
+
+
+def run_probe(call: str) -> Dict[str, Any]:
+    """Run a probe call (e.g. "probe_shared()") in a child interpreter."""
+    code = f"import json; from api import footprint; print(json.dumps(footprint.{call}))"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        check=True,
+        text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def best_of(call: str, repeat: int) -> Dict[str, Any]:
+    """Run a probe repeatedly, keeping the lowest value of every numeric field."""
+    runs = [run_probe(call) for _ in range(repeat)]
+    best = dict(runs[-1])
+    for key, value in best.items():
+        if isinstance(value, float):
+            best[key] = min(run[key] for run in runs)
+    return best
+
+
+def collect_report(repeat: int, only: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Footprint rows keyed by "package", "registry" and "category/questionnaire_id"."""
+    from .discovery import discover_questionnaires
+
+    report = {"package": best_of("probe_shared()", repeat)}
+    for descriptor in discover_questionnaires():
+        if only and descriptor.questionnaire_id not in only:
+            continue
+        call = f"probe({descriptor.module!r}, {descriptor.class_name!r})"
+        report[f"{descriptor.category}/{descriptor.questionnaire_id}"] = best_of(call, repeat)
+    if not only:
+        report["registry"] = best_of("probe_registry()", repeat)
+    return report
+
+
+def compare_reports(report: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], threshold: float) -> List[str]:
+    """
+    Regressions against a saved report.
+
+    Returns:
+        One message per figure that grew by more than threshold percent (and
+        by more than its noise floor)
+    """
+    regressions = []
+    for key, row in report.items():
+        reference = baseline.get(key, {})
+        for field, noise in COMPARED_FIELDS.items():
+            if field not in row or field not in reference:
+                continue
+            growth = row[field] - reference[field]
+            if growth > noise and growth > abs(reference[field]) * threshold / 100:
+                regressions.append(f"{key} {field}: {reference[field]:.2f} -> {row[field]:.2f}")
+    return regressions
+
+
+def _cell(row: Dict[str, Any], field: str, width: int, precision: int = 1) -> str:
+    value = row.get(field)
+    if value is None:
+        return f"{'':>{width}}"
+    if isinstance(value, float):
+        return f"{value:>{width}.{precision}f}"
+    return f"{value:>{width}}"
+
+
+def print_report(report: Dict[str, Dict[str, Any]]) -> None:
+    """Print the report as an aligned table."""
+    print(
+        f"{'questionnaire':<26}{'import ms':>10}{'MiB':>7}{'modules':>9}{'init ms':>9}{'MiB':>7}"
+        f"{'inst KiB':>10}{'class KiB':>10}{'questions':>10}{'options':>9}  largest table"
+    )
+    for key, row in report.items():
+        table = f"{row['largest_table']} ({row['largest_table_kib']:.0f} KiB)" if row.get("largest_table") else ""
+        print(
+            f"{key:<26}{_cell(row, 'import_ms', 10)}{_cell(row, 'import_mib', 7, 2)}{_cell(row, 'modules', 9)}"
+            f"{_cell(row, 'init_ms', 9)}{_cell(row, 'init_mib', 7, 2)}{_cell(row, 'instance_kib', 10)}"
+            f"{_cell(row, 'class_data_kib', 10)}"
+            f"{_cell(row, 'questions', 10)}{_cell(row, 'options', 9)}  {table}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import-time and memory footprint of the questionnaire packages")
+    parser.add_argument("--questionnaire", nargs="+", help="Only measure these questionnaire ids")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per measurement (lowest value is kept)")
+    parser.add_argument("--output", metavar="PATH", help="Save the report as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a saved report")
+    parser.add_argument("--threshold", type=float, default=20.0, help="Regression threshold in percent")
+    args = parser.parse_args()
+
+    report = collect_report(args.repeat, args.questionnaire)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "report": report}, f, indent=2)
+        print(f"\nReport written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["report"]
+        regressions = compare_reports(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:g}%:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"\nNo regression above {args.threshold:g}%")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
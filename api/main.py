@@ -4,9 +4,15 @@ Main FastAPI application for Questionnaires API
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from .routes import auto, hetero
+from .config import get_settings
 from .dependencies import get_registry
+from .metrics import MetricsMiddleware, collect, render_prometheus
+from .profiling import ProfilingMiddleware
 from .schemas import HealthResponse, APIInfoResponse
+from .slowlog import SlowRequestMiddleware
+from .timing import StageTimingMiddleware, stage_histograms
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -45,8 +51,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+# Opt-in cProfile profiles of selected validate/submit requests (enabled by settings)
+app.add_middleware(ProfilingMiddleware)
+
+# Log of validate/submit requests over the latency budget (inside stage timing, whose breakdown it reports)
+app.add_middleware(SlowRequestMiddleware)
+
+# Per-stage timing of validate/submit requests (enabled by settings)
+app.add_middleware(StageTimingMiddleware)
+
+# Request counters and latency histograms (outermost: covers the whole request)
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(
     auto.router, 
@@ -96,20 +115,44 @@ def health_check():
         status="healthy",
         version="1.0.0",
         questionnaires={
-            "auto": len(registry.auto_questionnaires),
-            "hetero": len(registry.hetero_questionnaires)
+            "auto": len(registry.questionnaire_ids("auto")),
+            "hetero": len(registry.questionnaire_ids("hetero"))
         }
     )
 
 
+@app.get(
+    "/timings",
+    summary="Submit pipeline timings",
+    description="Per-stage duration histograms (milliseconds) of validate, submit and submit-batch requests, grouped by questionnaire and endpoint. Empty unless QUESTIONNAIRES_STAGE_TIMING or QUESTIONNAIRES_SERVER_TIMING is set."
+)
+def get_timings():
+    """Stage timing histograms endpoint."""
+    return stage_histograms.snapshot()
+
+
+@app.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus metrics",
+    description="Request, outcome and latency metrics in the Prometheus text exposition format, aggregated over every worker when QUESTIONNAIRES_METRICS_DIR is set."
+)
+def get_metrics():
+    """Prometheus metrics endpoint."""
+    return PlainTextResponse(
+        render_prometheus(collect(get_settings().metrics_dir)),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 # Optional: Add startup and shutdown events
 @app.on_event("startup")
 async def startup_event():
     """Executed when the application starts."""
     registry = get_registry()
     print(f"🚀 Questionnaires API started")
-    print(f"📋 Loaded {len(registry.auto_questionnaires)} auto questionnaires")
-    print(f"📋 Loaded {len(registry.hetero_questionnaires)} hetero questionnaires")
+    print(f"📋 Registered {len(registry.questionnaire_ids('auto'))} auto questionnaires")
+    print(f"📋 Registered {len(registry.questionnaire_ids('hetero'))} hetero questionnaires")
 
 
 @app.on_event("shutdown")
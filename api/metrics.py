@@ -0,0 +1,343 @@
+"""
+Prometheus-compatible metrics
+
+MetricsMiddleware counts every questionnaire request and observes its latency,
+labelled by category, questionnaire id, endpoint and status; scoring adapters
+count outcomes (scored, failed, valid, invalid, malformed) for the request in
+progress. GET /metrics renders everything in the Prometheus text exposition
+format (version 0.0.4), together with the stage timings of api.timing when
+stage timing is enabled.
+
+Counters and histograms live in process memory behind one lock. With several
+workers (see gunicorn.conf.py) set QUESTIONNAIRES_METRICS_DIR to a directory
+shared by the workers: each worker writes a snapshot there about once per
+second (and before answering a scrape), and /metrics sums the snapshots of
+every worker, so any worker can answer a scrape for the whole server.
+"""
+
+import atexit
+import json
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .config import get_settings
+from .timing import BUCKETS_MS, known_questionnaire, stage_histograms
+
+# Upper bounds of request latency buckets, in seconds
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Stage timing buckets (api.timing records milliseconds)
+STAGE_BUCKETS: Tuple[float, ...] = tuple(bound / 1e3 for bound in BUCKETS_MS)
+
+# Label value of questionnaire ids the registry does not serve, whatever the
+# status code (keeps label cardinality bounded)
+UNKNOWN_QUESTIONNAIRE = "_unknown"
+
+# Seconds between snapshots written to QUESTIONNAIRES_METRICS_DIR
+FLUSH_INTERVAL = 1.0
+
+QUESTIONNAIRE_PATH = re.compile(
+    r"^/api/(auto|hetero)/questionnaires"
+    r"(?:/([^/]+)(?:/(metadata|profiles|validate|submit|submit-batch|submit-stream))?)?/?$"
+)
+
+# name -> (type, help, label names)
+METRICS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "questionnaires_http_requests_total": (
+        "counter",
+        "Questionnaire API requests by category, questionnaire, endpoint and status code.",
+        ("category", "questionnaire_id", "endpoint", "status")
+    ),
+    "questionnaires_http_request_duration_seconds": (
+        "histogram",
+        "Questionnaire API request latency, from request received to last response byte.",
+        ("category", "questionnaire_id", "endpoint")
+    ),
+    "questionnaires_scoring_outcomes_total": (
+        "counter",
+        "Scoring and validation outcomes (scored, failed, valid, invalid, malformed) per answer set.",
+        ("category", "questionnaire_id", "endpoint", "outcome")
+    ),
+    "questionnaires_stage_duration_seconds": (
+        "histogram",
+        "Submit pipeline stage durations (QUESTIONNAIRES_STAGE_TIMING).",
+        ("category", "questionnaire_id", "endpoint", "stage")
+    ),
+}
+
+
+class MetricsStore:
+    """
+    Process-local counters and histograms keyed by (metric name, label values).
+
+    Histogram values are [bucket counts..., +Inf count, sum]; bucket counts
+    are per bucket (not cumulative) so snapshots can simply be added up.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Tuple[str, ...]], float] = {}
+        self._histograms: Dict[Tuple[str, Tuple[str, ...]], List[float]] = {}
+        self._pid = os.getpid()
+
+    def inc(self, name: str, labels: Tuple[str, ...], value: float = 1.0) -> None:
+        """Increment a counter."""
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, labels: Tuple[str, ...], value: float, buckets: Tuple[float, ...]) -> None:
+        """Record one observation in a histogram."""
+        key = (name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0.0] * (len(buckets) + 2)
+            histogram[bisect_left(buckets, value)] += 1
+            histogram[-1] += value
+
+    def snapshot(self) -> Dict[str, List[List[Any]]]:
+        """JSON-compatible copy of every counter and histogram."""
+        with self._lock:
+            return {
+                "counters": [[name, list(labels), value] for (name, labels), value in self._counters.items()],
+                "histograms": [[name, list(labels), list(values)] for (name, labels), values in self._histograms.items()]
+            }
+
+    def reset(self) -> None:
+        """Discard every recorded value."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def reset_after_fork(self) -> None:
+        """
+        Start from empty metrics in a forked child (the parent's values are
+        reported by the parent's own snapshot).
+        """
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._lock = threading.Lock()
+            self._counters.clear()
+            self._histograms.clear()
+
+
+# Process-wide store
+metrics = MetricsStore()
+
+# (category, questionnaire_id, endpoint) of the request in progress
+_current_labels: ContextVar[Optional[Tuple[str, str, str]]] = ContextVar("metrics_labels", default=None)
+
+
+def record_outcome(outcome: str, count: int = 1) -> None:
+    """Count scoring/validation outcomes for the request in progress (no-op outside one)."""
+    labels = _current_labels.get()
+    if labels is not None:
+        metrics.inc("questionnaires_scoring_outcomes_total", (*labels, outcome), count)
+
+
+def _merge(snapshots: Iterable[Dict[str, List[List[Any]]]]) -> Tuple[Dict[Tuple[str, Tuple[str, ...]], float], Dict[Tuple[str, Tuple[str, ...]], List[float]]]:
+    counters: Dict[Tuple[str, Tuple[str, ...]], float] = {}
+    histograms: Dict[Tuple[str, Tuple[str, ...]], List[float]] = {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot.get("counters", []):
+            key = (name, tuple(labels))
+            counters[key] = counters.get(key, 0.0) + value
+        for name, labels, values in snapshot.get("histograms", []):
+            key = (name, tuple(labels))
+            total = histograms.get(key)
+            if total is None:
+                histograms[key] = list(values)
+            else:
+                histograms[key] = [a + b for a, b in zip(total, values)]
+    return counters, histograms
+
+
+def process_snapshot() -> Dict[str, List[List[Any]]]:
+    """Snapshot of this process: its metrics plus the api.timing stage histograms (in seconds)."""
+    snapshot = metrics.snapshot()
+    for labels, histogram in stage_histograms.items():
+        snapshot["histograms"].append([
+            "questionnaires_stage_duration_seconds",
+            list(labels),
+            [*histogram.counts, histogram.sum / 1e3]
+        ])
+    return snapshot
+
+
+def write_snapshot(metrics_dir: str) -> None:
+    """Write this process's snapshot to metrics_dir (atomically)."""
+    os.makedirs(metrics_dir, exist_ok=True)
+    path = os.path.join(metrics_dir, f"metrics-{os.getpid()}.json")
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(process_snapshot(), f)
+    os.replace(f"{path}.tmp", path)
+
+
+def _write_forever(metrics_dir: str) -> None:
+    pid = os.getpid()
+    while os.getpid() == pid:
+        time.sleep(FLUSH_INTERVAL)
+        try:
+            write_snapshot(metrics_dir)
+        except OSError:
+            pass
+
+
+# Process whose snapshot writer is running (writers do not survive fork)
+_writer_pid: Optional[int] = None
+_writer_lock = threading.Lock()
+
+
+def start_snapshot_writer(metrics_dir: Optional[str]) -> None:
+    """
+    Prepare metrics for the current process.
+
+    Resets the metrics inherited through a fork and, when a shared metrics
+    directory is configured, starts this process's snapshot writer.
+    """
+    global _writer_pid
+    metrics.reset_after_fork()
+    if not metrics_dir or _writer_pid == os.getpid():
+        return
+    with _writer_lock:
+        if _writer_pid != os.getpid():
+            _writer_pid = os.getpid()
+            threading.Thread(target=_write_forever, args=(metrics_dir,), daemon=True).start()
+            atexit.register(write_snapshot, metrics_dir)
+
+
+def collect(metrics_dir: Optional[str] = None) -> List[Dict[str, List[List[Any]]]]:
+    """
+    Gather the snapshots to expose.
+
+    Args:
+        metrics_dir: Shared directory of worker snapshots (None: this process only)
+
+    Returns:
+        Snapshots of every worker (or of this process alone)
+    """
+    if not metrics_dir:
+        return [process_snapshot()]
+
+    # Publish this process's latest values, then read every worker's
+    write_snapshot(metrics_dir)
+    snapshots = []
+    for filename in sorted(os.listdir(metrics_dir)):
+        if not (filename.startswith("metrics-") and filename.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(metrics_dir, filename), encoding="utf-8") as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return snapshots
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_prometheus(snapshots: Iterable[Dict[str, List[List[Any]]]]) -> str:
+    """
+    Render merged snapshots in the Prometheus text exposition format.
+
+    Args:
+        snapshots: Snapshots as returned by collect()
+
+    Returns:
+        Exposition text (one HELP/TYPE block per metric)
+    """
+    counters, histograms = _merge(snapshots)
+    lines: List[str] = []
+    for name, (metric_type, help_text, label_names) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        if metric_type == "counter":
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f"{name}{_labels(label_names, labels)} {_format_value(value)}")
+            continue
+
+        buckets = STAGE_BUCKETS if name == "questionnaires_stage_duration_seconds" else LATENCY_BUCKETS
+        for (metric, labels), values in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0.0
+            for bound, count in zip(buckets, values):
+                cumulative += count
+                bucket_labels = _labels(label_names, labels, f'le="{bound}"')
+                lines.append(f"{name}_bucket{bucket_labels} {_format_value(cumulative)}")
+            cumulative += values[len(buckets)]
+            bucket_labels = _labels(label_names, labels, 'le="+Inf"')
+            lines.append(f"{name}_bucket{bucket_labels} {_format_value(cumulative)}")
+            lines.append(f"{name}_sum{_labels(label_names, labels)} {_format_value(values[-1])}")
+            lines.append(f"{name}_count{_labels(label_names, labels)} {_format_value(cumulative)}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """ASGI middleware counting questionnaire requests and observing their latency."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        match = QUESTIONNAIRE_PATH.match(scope["path"])
+        settings = get_settings()
+        if match is None or not settings.metrics_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        category, questionnaire_id, endpoint = match.groups()
+        if questionnaire_id is None:
+            questionnaire_id, endpoint = "", "list"
+        elif endpoint is None:
+            endpoint = "structure"
+        start_snapshot_writer(settings.metrics_dir)
+
+        start = perf_counter()
+        status = 500
+        token = _current_labels.set((category, questionnaire_id, endpoint))
+
+        async def send_with_metrics(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            _current_labels.reset(token)
+            if endpoint != "list" and not known_questionnaire(category, questionnaire_id):
+                questionnaire_id = UNKNOWN_QUESTIONNAIRE
+            metrics.inc("questionnaires_http_requests_total", (category, questionnaire_id, endpoint, str(status)))
+            metrics.observe(
+                "questionnaires_http_request_duration_seconds",
+                (category, questionnaire_id, endpoint),
+                perf_counter() - start,
+                LATENCY_BUCKETS
+            )
@@ -0,0 +1,220 @@
+"""
+Opt-in request profiling
+
+ProfilingMiddleware selects validate, submit, submit-batch and submit-stream
+requests to profile when any of these settings is set:
+
+    QUESTIONNAIRES_PROFILE_SAMPLE_RATE      fraction of requests profiled at random
+    QUESTIONNAIRES_PROFILE_HEADER           requests carrying this header (any
+                                            non-empty value) are profiled
+    QUESTIONNAIRES_PROFILE_QUESTIONNAIRES   comma-separated questionnaire ids whose
+                                            requests are always profiled
+
+A selected request runs its validation and scoring calls under cProfile (the
+profiler is switched on in whichever thread does the work). The profile is
+reduced to the functions of the api and questionnaires packages, plus the
+functions they call directly (e.g. strptime, re), and written in the standard
+pstats format to QUESTIONNAIRES_PROFILE_DIR, named after the time, the
+questionnaire, the endpoint and the request duration. Only the newest
+QUESTIONNAIRES_PROFILE_MAX_FILES profiles are kept.
+
+View a profile with the standard library or any pstats viewer:
+
+    python -m pstats profiles/<file>.prof
+    snakeviz profiles/<file>.prof
+
+Profiles record code locations and timings only, never answer values. When no
+trigger is configured the middleware passes requests through and the scoring
+calls only check a context variable.
+"""
+
+import cProfile
+import functools
+import itertools
+import os
+import pstats
+import random
+import re
+import tempfile
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from .config import Settings, get_settings
+
+# Packages whose functions are kept in written profiles
+PROFILED_PACKAGES: Tuple[str, ...] = ("api", "questionnaires")
+
+PROFILED_PATH = re.compile(r"^/api/(auto|hetero)/questionnaires/([^/]+)/(validate|submit|submit-batch|submit-stream)$")
+
+PROFILE_SUFFIX = ".prof"
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Stats key: (filename, line number, function name)
+StatsKey = Tuple[str, int, str]
+
+
+class RequestProfile:
+    """cProfile profiler of one request, enabled around its scoring calls."""
+
+    __slots__ = ("profiler", "active", "ran")
+
+    def __init__(self) -> None:
+        self.profiler = cProfile.Profile()
+        self.active = False
+        self.ran = False
+
+    def call(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call a function with the profiler enabled in the current thread."""
+        if self.active:
+            return function(*args, **kwargs)
+        try:
+            self.profiler.enable()
+        except ValueError:
+            # Another profiler is active (Python 3.12+ allows one at a time)
+            return function(*args, **kwargs)
+        self.active = self.ran = True
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.profiler.disable()
+            self.active = False
+
+
+_current: ContextVar[Optional[RequestProfile]] = ContextVar("request_profile", default=None)
+
+
+def profiled(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a method so that it runs under the current request's profiler, if any."""
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profile = _current.get()
+        if profile is None:
+            return method(*args, **kwargs)
+        return profile.call(method, *args, **kwargs)
+    return wrapper
+
+
+def package_directories(packages: Tuple[str, ...] = PROFILED_PACKAGES) -> Tuple[str, ...]:
+    """Source directories of the profiled packages, with a trailing separator."""
+    return tuple(os.path.join(_ROOT, package) + os.sep for package in packages)
+
+
+def filter_stats(stats: Dict[StatsKey, Tuple[Any, ...]], directories: Tuple[str, ...]) -> Dict[StatsKey, Tuple[Any, ...]]:
+    """
+    Restrict pstats data to functions defined under the given directories.
+
+    Functions defined elsewhere are kept when package code calls them
+    directly, with their counts and times limited to those calls; anything
+    they call in turn is dropped (its time stays in their cumulative time).
+    """
+    def inside(key: StatsKey) -> bool:
+        return os.path.abspath(key[0]).startswith(directories) if key[0] != "~" else False
+
+    kept = {key for key in stats if inside(key)}
+    filtered: Dict[StatsKey, Tuple[Any, ...]] = {}
+    for key, (cc, nc, tt, ct, callers) in stats.items():
+        callers = {caller: values for caller, values in callers.items() if caller in kept}
+        if key in kept:
+            filtered[key] = (cc, nc, tt, ct, callers)
+        elif callers:
+            # Caller values are (nc, cc, tt, ct)
+            totals = [sum(values[index] for values in callers.values()) for index in range(4)]
+            filtered[key] = (totals[1], totals[0], totals[2], totals[3], callers)
+    return filtered
+
+
+def profile_directory(settings: Settings) -> str:
+    """Directory profiles are written to."""
+    return settings.profile_dir or os.path.join(tempfile.gettempdir(), "questionnaires-profiles")
+
+
+def profiled_questionnaires(settings: Settings) -> FrozenSet[str]:
+    """Questionnaire ids whose requests are always profiled."""
+    return frozenset(filter(None, (part.strip() for part in (settings.profile_questionnaires or "").split(","))))
+
+
+def rotate(directory: str, max_files: int) -> None:
+    """Delete the oldest profiles beyond max_files."""
+    paths = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(PROFILE_SUFFIX)]
+    if len(paths) <= max_files:
+        return
+    paths.sort(key=lambda path: os.stat(path).st_mtime)
+    for path in paths[:len(paths) - max_files]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass  # Removed by another worker
+
+
+_sequence = itertools.count()
+
+
+def write_profile(profile: RequestProfile, directory: str, max_files: int, name: str) -> str:
+    """
+    Write a request profile (filtered to the profiled packages) and rotate.
+
+    Returns:
+        Path of the written file
+    """
+    stats = pstats.Stats(profile.profiler)
+    stats.stats = filter_stats(stats.stats, package_directories())
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(
+        directory,
+        f"{time.strftime('%Y%m%dT%H%M%S')}-{name}-{os.getpid()}-{next(_sequence)}{PROFILE_SUFFIX}"
+    )
+    stats.dump_stats(path)
+    rotate(directory, max_files)
+    return path
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling selected validate and submit requests."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    def _selected(self, scope: Dict[str, Any], questionnaire_id: str, settings: Settings) -> bool:
+        if settings.profile_sample_rate and random.random() < settings.profile_sample_rate:
+            return True
+        if settings.profile_questionnaires and questionnaire_id in profiled_questionnaires(settings):
+            return True
+        if settings.profile_header:
+            header = settings.profile_header.lower().encode("latin-1")
+            return any(name == header and value for name, value in scope["headers"])
+        return False
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        settings = get_settings()
+        if not (settings.profile_sample_rate or settings.profile_header or settings.profile_questionnaires):
+            await self.app(scope, receive, send)
+            return
+
+        match = PROFILED_PATH.match(scope["path"])
+        if match is None or not self._selected(scope, match.group(2), settings):
+            await self.app(scope, receive, send)
+            return
+
+        category, questionnaire_id, endpoint = match.groups()
+        profile = RequestProfile()
+        token = _current.set(profile)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+
+        # Nothing to write when the request never reached scoring (404, 422, ...)
+        if profile.ran:
+            name = f"{category}-{questionnaire_id}-{endpoint}-{(time.perf_counter() - start) * 1e3:.0f}ms"
+            await run_in_threadpool(
+                write_profile, profile, profile_directory(settings), settings.profile_max_files, name
+            )
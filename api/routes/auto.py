@@ -3,13 +3,19 @@ API routes for auto (self-report) questionnaires
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from ..caching import cached_response
+from ..config import get_settings
 from ..dependencies import QuestionnaireRegistry, get_registry
+from ..encoding import FastJSONResponse, dumps, fast_dumps
+from ..streaming import NDJSON_MEDIA_TYPE, NDJSONStreamingResponse, score_ndjson_stream
 from ..schemas import (
     QuestionnaireListItem,
     QuestionnaireMetadata,
     QuestionnaireDetail,
     AnswersRequest,
+    BatchAnswersRequest,
+    BatchScoreResponse,
     ValidationResponse,
     ScoreResponse,
     ErrorResponse
@@ -21,34 +27,25 @@ router = APIRouter()
 @router.get(
     "/questionnaires",
     response_model=List[QuestionnaireListItem],
+    responses={
+        304: {"description": "Not modified (If-None-Match matched the current ETag)"}
+    },
     summary="List all auto questionnaires",
     description="Returns a list of all available self-report questionnaires with summary information."
 )
 def list_auto_questionnaires(
+    request: Request,
     registry: QuestionnaireRegistry = Depends(get_registry)
 ):
     """List all auto (self-report) questionnaires."""
-    questionnaires = registry.list_questionnaires("auto")
-    
-    result = []
-    for q_id, q_instance in questionnaires.items():
-        metadata = q_instance.get_metadata()
-        result.append(QuestionnaireListItem(
-            id=q_id,
-            name=metadata.get("name", ""),
-            abbreviation=metadata.get("abbreviation", ""),
-            language=metadata.get("language", ""),
-            category="auto",
-            description=metadata.get("description")
-        ))
-    
-    return result
+    return cached_response(request, registry.get_listing("auto"))
 
 
 @router.get(
     "/questionnaires/{questionnaire_id}/metadata",
     response_model=QuestionnaireMetadata,
     responses={
+        304: {"description": "Not modified (If-None-Match matched the current ETag)"},
         404: {"model": ErrorResponse, "description": "Questionnaire not found"}
     },
     summary="Get questionnaire metadata",
@@ -56,25 +53,26 @@ def list_auto_questionnaires(
 )
 def get_auto_questionnaire_metadata(
     questionnaire_id: str,
+    request: Request,
     registry: QuestionnaireRegistry = Depends(get_registry)
 ):
     """Get metadata for a specific auto questionnaire."""
-    questionnaire = registry.get_questionnaire("auto", questionnaire_id)
+    metadata = registry.get_rendered_metadata("auto", questionnaire_id)
     
-    if not questionnaire:
+    if not metadata:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Questionnaire '{questionnaire_id}' not found in auto category"
         )
     
-    metadata = questionnaire.get_metadata()
-    return QuestionnaireMetadata(**metadata)
+    return cached_response(request, metadata)
 
 
 @router.get(
     "/questionnaires/{questionnaire_id}",
     response_model=QuestionnaireDetail,
     responses={
+        304: {"description": "Not modified (If-None-Match matched the current ETag)"},
         404: {"model": ErrorResponse, "description": "Questionnaire not found"}
     },
     summary="Get complete questionnaire",
@@ -82,37 +80,53 @@ def get_auto_questionnaire_metadata(
 )
 def get_auto_questionnaire(
     questionnaire_id: str,
+    request: Request,
     gender: Optional[str] = None,
     registry: QuestionnaireRegistry = Depends(get_registry)
 ):
     """Get complete questionnaire structure for a specific auto questionnaire."""
-    questionnaire = registry.get_questionnaire("auto", questionnaire_id)
+    # Structures are pre-rendered at startup; for questionnaires with branching
+    # logic (like PRISE-M) each gender variant is rendered separately
+    structure = registry.get_structure("auto", questionnaire_id, gender=gender)
     
-    if not questionnaire:
+    if not structure:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Questionnaire '{questionnaire_id}' not found in auto category"
         )
     
-    # Get full questionnaire structure
-    # For questionnaires with branching logic (like PRISE-M), pass gender parameter
-    if hasattr(questionnaire, 'get_full_questionnaire'):
-        # Try to pass gender parameter if the method accepts it
-        import inspect
-        sig = inspect.signature(questionnaire.get_full_questionnaire)
-        if 'gender' in sig.parameters:
-            full_structure = questionnaire.get_full_questionnaire(gender=gender)
-        else:
-            full_structure = questionnaire.get_full_questionnaire()
-    else:
-        # Fallback for questionnaires without this method
-        full_structure = {
-            "metadata": questionnaire.get_metadata(),
-            "sections": questionnaire.get_sections(),
-            "questions": questionnaire.get_questions()
-        }
+    return cached_response(request, structure)
+
+
+@router.get(
+    "/questionnaires/{questionnaire_id}/profiles",
+    responses={
+        304: {"description": "Not modified (If-None-Match matched the current ETag)"},
+        400: {"model": ErrorResponse, "description": "Unknown value set"},
+        404: {"model": ErrorResponse, "description": "Questionnaire not found or without profile table"}
+    },
+    summary="Get the precomputed profile table",
+    description="Returns, for questionnaires with a finite set of health state profiles (EQ-5D-5L), everything derived from each profile: levels, problem counts, level sum, misery index, interpretation sentence and utility index under the requested value set (France by default). Intended for offline analytics."
+)
+def get_auto_questionnaire_profiles(
+    questionnaire_id: str,
+    request: Request,
+    value_set: Optional[str] = None,
+    registry: QuestionnaireRegistry = Depends(get_registry)
+):
+    """Get the precomputed per-profile table of a specific auto questionnaire."""
+    try:
+        table = registry.get_profile_table("auto", questionnaire_id, value_set)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    if not table:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Questionnaire '{questionnaire_id}' not found in auto category or has no profile table"
+        )
     
-    return QuestionnaireDetail(**full_structure)
+    return cached_response(request, table)
 
 
 @router.post(
@@ -131,22 +145,18 @@ def validate_auto_questionnaire_answers(
     registry: QuestionnaireRegistry = Depends(get_registry)
 ):
     """Validate answers for a specific auto questionnaire without calculating scores."""
-    questionnaire = registry.get_questionnaire("auto", questionnaire_id)
+    adapter = registry.get_adapter("auto", questionnaire_id)
     
-    if not questionnaire:
+    if not adapter:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Questionnaire '{questionnaire_id}' not found in auto category"
         )
     
-    # Validate answers
-    validation_result = questionnaire.validate_answers(answers_request.answers)
+    # Validate answers (context such as gender is passed where accepted)
+    validation_result = adapter.validate_submission(answers_request)
     
-    return ValidationResponse(
-        valid=validation_result.valid,
-        errors=validation_result.errors,
-        warnings=validation_result.warnings
-    )
+    return ValidationResponse(**validation_result)
 
 
 @router.post(
@@ -157,7 +167,7 @@ def validate_auto_questionnaire_answers(
         400: {"model": ErrorResponse, "description": "Invalid answers"}
     },
     summary="Submit answers and calculate score",
-    description="Validates and calculates scores/results for submitted answers. The structure of score_data varies by questionnaire type. For questionnaires with branching logic, demographics (e.g., gender) should be included."
+    description="Validates and calculates scores/results for submitted answers. The structure of score_data varies by questionnaire type. For questionnaires with branching logic, demographics (e.g., gender) should be included. For EQ-5D-5L, value_set selects the value set(s) of the utility index."
 )
 def submit_auto_questionnaire_answers(
     questionnaire_id: str,
@@ -165,49 +175,23 @@ def submit_auto_questionnaire_answers(
     registry: QuestionnaireRegistry = Depends(get_registry)
 ):
     """Submit answers and calculate scores for a specific auto questionnaire."""
-    questionnaire = registry.get_questionnaire("auto", questionnaire_id)
+    adapter = registry.get_adapter("auto", questionnaire_id)
     
-    if not questionnaire:
+    if not adapter:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Questionnaire '{questionnaire_id}' not found in auto category"
         )
     
-    try:
-        # Extract demographics if provided
-        demographics = answers_request.demographics or {}
-        gender = demographics.get('gender')
-        
-        # Some questionnaires use calculate_score(), others use calculate_screening()
-        if hasattr(questionnaire, 'calculate_score'):
-            # Check if calculate_score accepts gender parameter (for branching logic)
-            import inspect
-            sig = inspect.signature(questionnaire.calculate_score)
-            if 'gender' in sig.parameters and gender:
-                result = questionnaire.calculate_score(answers_request.answers, gender=gender)
-            else:
-                result = questionnaire.calculate_score(answers_request.answers)
-        elif hasattr(questionnaire, 'calculate_screening'):
-            result = questionnaire.calculate_screening(answers_request.answers)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Questionnaire '{questionnaire_id}' does not support scoring"
-            )
-        
-        # Convert result to dict (using model_dump for Pydantic v2 with mode='json' for proper serialization)
-        if hasattr(result, 'model_dump'):
-            score_data = result.model_dump(mode='json')
-        elif hasattr(result, 'dict'):
-            score_data = result.dict()
-        else:
-            score_data = result
-        
-        return ScoreResponse(
-            questionnaire_id=questionnaire_id,
-            score_data=score_data
+    if not adapter.supports_scoring:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Questionnaire '{questionnaire_id}' does not support scoring"
         )
-        
+    
+    try:
+        # Scoring method and accepted context parameters were resolved at registration
+        score_data = adapter.score_submission(answers_request)
     except (ValueError, Exception) as e:
         # Handle validation errors and other exceptions
         error_message = str(e)
@@ -215,4 +199,118 @@ def submit_auto_questionnaire_answers(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=error_message
         )
+    
+    if get_settings().fast_responses:
+        # score_data is already JSON-compatible: encode it once, without
+        # re-validating it through ScoreResponse
+        return FastJSONResponse({
+            "questionnaire_id": questionnaire_id,
+            "score_data": score_data,
+            "validation": None
+        })
+    
+    return ScoreResponse(
+        questionnaire_id=questionnaire_id,
+        score_data=score_data
+    )
 
+
+@router.post(
+    "/questionnaires/{questionnaire_id}/submit-batch",
+    response_model=BatchScoreResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Questionnaire not found"},
+        413: {"model": ErrorResponse, "description": "Too many submissions in one batch"}
+    },
+    summary="Submit many answer sets and calculate their scores",
+    description="Scores a list of submissions in one pass. Each item gets its own result or error; a failing item does not fail the batch. For questionnaires with branching logic, each item carries its own demographics (e.g., gender)."
+)
+def submit_auto_questionnaire_batch(
+    questionnaire_id: str,
+    batch_request: BatchAnswersRequest,
+    registry: QuestionnaireRegistry = Depends(get_registry)
+):
+    """Submit a batch of answer sets and calculate scores for a specific auto questionnaire."""
+    adapter = registry.get_adapter("auto", questionnaire_id)
+    
+    if not adapter:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Questionnaire '{questionnaire_id}' not found in auto category"
+        )
+    
+    settings = get_settings()
+    max_batch_size = settings.max_batch_size
+    if len(batch_request.items) > max_batch_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch contains {len(batch_request.items)} submissions (maximum {max_batch_size})"
+        )
+    
+    if not adapter.supports_scoring:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Questionnaire '{questionnaire_id}' does not support scoring"
+        )
+    
+    results = adapter.score_items(batch_request.items)
+    succeeded = sum(1 for result in results if result["success"])
+    
+    # Score data is already JSON-compatible: encode once instead of
+    # re-validating every result through BatchScoreResponse
+    content = {
+        "questionnaire_id": questionnaire_id,
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results
+    }
+    if settings.fast_responses:
+        return FastJSONResponse(content)
+    return Response(content=dumps(content), media_type="application/json")
+
+
+@router.post(
+    "/questionnaires/{questionnaire_id}/submit-stream",
+    response_class=NDJSONStreamingResponse,
+    responses={
+        200: {
+            "content": {NDJSON_MEDIA_TYPE: {}},
+            "description": "One JSON result per line: line, success, score_data, error (and id if provided)"
+        },
+        404: {"model": ErrorResponse, "description": "Questionnaire not found"}
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}}}
+        }
+    },
+    summary="Stream answer sets and scores as NDJSON",
+    description="Consumes newline-delimited JSON submissions (same fields as submit-batch items, plus an optional 'id' echoed back) and streams one result per line as records are scored. Memory use is bounded regardless of input size."
+)
+async def submit_auto_questionnaire_stream(
+    questionnaire_id: str,
+    request: Request,
+    registry: QuestionnaireRegistry = Depends(get_registry)
+):
+    """Stream answer sets and scores for a specific auto questionnaire as NDJSON."""
+    adapter = registry.get_adapter("auto", questionnaire_id)
+    
+    if not adapter:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Questionnaire '{questionnaire_id}' not found in auto category"
+        )
+    
+    if not adapter.supports_scoring:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Questionnaire '{questionnaire_id}' does not support scoring"
+        )
+    
+    settings = get_settings()
+    encode = fast_dumps if settings.fast_responses else dumps
+    return NDJSONStreamingResponse(
+        score_ndjson_stream(request, adapter, settings.max_stream_line_bytes, encode)
+    )
@@ -4,13 +4,19 @@ Currently placeholder - to be implemented in the future
 """
 
 from typing import List
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from ..caching import cached_response
+from ..config import get_settings
 from ..dependencies import QuestionnaireRegistry, get_registry
+from ..encoding import FastJSONResponse, dumps, fast_dumps
+from ..streaming import NDJSON_MEDIA_TYPE, NDJSONStreamingResponse, score_ndjson_stream
 from ..schemas import (
     QuestionnaireListItem,
     QuestionnaireMetadata,
     QuestionnaireDetail,
     AnswersRequest,
+    BatchAnswersRequest,
+    BatchScoreResponse,
     ValidationResponse,
     ScoreResponse,
     ErrorResponse
@@ -22,34 +28,25 @@ router = APIRouter()
 @router.get(
     "/questionnaires",
     response_model=List[QuestionnaireListItem],
+    responses={
+        304: {"description": "Not modified (If-None-Match matched the current ETag)"}
+    },
     summary="List all hetero questionnaires",
     description="Returns a list of all available clinician-rated questionnaires with summary information."
 )
 def list_hetero_questionnaires(
+    request: Request,
     registry: QuestionnaireRegistry = Depends(get_registry)
 ):
     """List all hetero (clinician-rated) questionnaires."""
-    questionnaires = registry.list_questionnaires("hetero")
-    
-    result = []
-    for q_id, q_instance in questionnaires.items():
-        metadata = q_instance.get_metadata()
-        result.append(QuestionnaireListItem(
-            id=q_id,
-            name=metadata.get("name", ""),
-            abbreviation=metadata.get("abbreviation", ""),
-            language=metadata.get("language", ""),
-            category="hetero",
-            description=metadata.get("description")
-        ))
-    
-    return result
+    return cached_response(request, registry.get_listing("hetero"))
 
 
 @router.get(
     "/questionnaires/{questionnaire_id}/metadata",
     response_model=QuestionnaireMetadata,
     responses={
+        304: {"description": "Not modified (If-None-Match matched the current ETag)"},
         404: {"model": ErrorResponse, "description": "Questionnaire not found"}
     },
     summary="Get questionnaire metadata",
@@ -57,25 +54,26 @@ def list_hetero_questionnaires(
 )
 def get_hetero_questionnaire_metadata(
     questionnaire_id: str,
+    request: Request,
     registry: QuestionnaireRegistry = Depends(get_registry)
 ):
     """Get metadata for a specific hetero questionnaire."""
-    questionnaire = registry.get_questionnaire("hetero", questionnaire_id)
+    metadata = registry.get_rendered_metadata("hetero", questionnaire_id)
     
-    if not questionnaire:
+    if not metadata:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Questionnaire '{questionnaire_id}' not found in hetero category"
         )
     
-    metadata = questionnaire.get_metadata()
-    return QuestionnaireMetadata(**metadata)
+    return cached_response(request, metadata)
 
 
 @router.get(
     "/questionnaires/{questionnaire_id}",
     response_model=QuestionnaireDetail,
     responses={
+        304: {"description": "Not modified (If-None-Match matched the current ETag)"},
         404: {"model": ErrorResponse, "description": "Questionnaire not found"}
     },
     summary="Get complete questionnaire",
@@ -83,21 +81,20 @@ def get_hetero_questionnaire_metadata(
 )
 def get_hetero_questionnaire(
     questionnaire_id: str,
+    request: Request,
     registry: QuestionnaireRegistry = Depends(get_registry)
 ):
     """Get complete questionnaire structure for a specific hetero questionnaire."""
-    questionnaire = registry.get_questionnaire("hetero", questionnaire_id)
+    # Structures are pre-rendered at startup
+    structure = registry.get_structure("hetero", questionnaire_id)
     
-    if not questionnaire:
+    if not structure:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Questionnaire '{questionnaire_id}' not found in hetero category"
         )
     
-    # Get full questionnaire structure
-    full_structure = questionnaire.get_full_questionnaire()
-    
-    return QuestionnaireDetail(**full_structure)
+    return cached_response(request, structure)
 
 
 @router.post(
@@ -116,22 +113,18 @@ def validate_hetero_questionnaire_answers(
     registry: QuestionnaireRegistry = Depends(get_registry)
 ):
     """Validate answers for a specific hetero questionnaire without calculating scores."""
-    questionnaire = registry.get_questionnaire("hetero", questionnaire_id)
+    adapter = registry.get_adapter("hetero", questionnaire_id)
     
-    if not questionnaire:
+    if not adapter:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Questionnaire '{questionnaire_id}' not found in hetero category"
         )
     
-    # Validate answers
-    validation_result = questionnaire.validate_answers(answers_request.answers)
+    # Validate answers (context such as gender is passed where accepted)
+    validation_result = adapter.validate_submission(answers_request)
     
-    return ValidationResponse(
-        valid=validation_result.get("valid", False),
-        errors=validation_result.get("errors", []),
-        warnings=validation_result.get("warnings", [])
-    )
+    return ValidationResponse(**validation_result)
 
 
 @router.post(
@@ -142,7 +135,7 @@ def validate_hetero_questionnaire_answers(
         400: {"model": ErrorResponse, "description": "Invalid answers"}
     },
     summary="Submit answers and calculate score",
-    description="Validates and calculates scores/results for submitted answers. The structure of score_data varies by questionnaire type."
+    description="Validates and calculates scores/results for submitted answers. The structure of score_data varies by questionnaire type. Optional baseline_score (MADRS, YMRS) and visit_type (CGI) are passed to the instruments that accept them. detail='numeric' or 'summary' skips the interpretation text (numeric also skips labels)."
 )
 def submit_hetero_questionnaire_answers(
     questionnaire_id: str,
@@ -150,41 +143,23 @@ def submit_hetero_questionnaire_answers(
     registry: QuestionnaireRegistry = Depends(get_registry)
 ):
     """Submit answers and calculate scores for a specific hetero questionnaire."""
-    questionnaire = registry.get_questionnaire("hetero", questionnaire_id)
+    adapter = registry.get_adapter("hetero", questionnaire_id)
     
-    if not questionnaire:
+    if not adapter:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Questionnaire '{questionnaire_id}' not found in hetero category"
         )
     
-    try:
-        # Some questionnaires use calculate_score(), others use calculate_screening()
-        if hasattr(questionnaire, 'calculate_score'):
-            result = questionnaire.calculate_score(answers_request.answers)
-        elif hasattr(questionnaire, 'calculate_screening'):
-            result = questionnaire.calculate_screening(answers_request.answers)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Questionnaire '{questionnaire_id}' does not support scoring"
-            )
-        
-        # Convert result to dict (using model_dump for Pydantic v2 with mode='json' for proper serialization)
-        if isinstance(result, dict):
-            score_data = result
-        elif hasattr(result, 'model_dump'):
-            score_data = result.model_dump(mode='json')
-        elif hasattr(result, 'dict'):
-            score_data = result.dict()
-        else:
-            score_data = result
-        
-        return ScoreResponse(
-            questionnaire_id=questionnaire_id,
-            score_data=score_data
+    if not adapter.supports_scoring:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Questionnaire '{questionnaire_id}' does not support scoring"
         )
-        
+    
+    try:
+        # Scoring method and accepted context parameters were resolved at registration
+        score_data = adapter.score_submission(answers_request)
     except (ValueError, Exception) as e:
         # Handle validation errors and other exceptions
         error_message = str(e)
@@ -192,4 +167,118 @@ def submit_hetero_questionnaire_answers(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=error_message
         )
+    
+    if get_settings().fast_responses:
+        # score_data is already JSON-compatible: encode it once, without
+        # re-validating it through ScoreResponse
+        return FastJSONResponse({
+            "questionnaire_id": questionnaire_id,
+            "score_data": score_data,
+            "validation": None
+        })
+    
+    return ScoreResponse(
+        questionnaire_id=questionnaire_id,
+        score_data=score_data
+    )
+
+
+@router.post(
+    "/questionnaires/{questionnaire_id}/submit-batch",
+    response_model=BatchScoreResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Questionnaire not found"},
+        413: {"model": ErrorResponse, "description": "Too many submissions in one batch"}
+    },
+    summary="Submit many answer sets and calculate their scores",
+    description="Scores a list of submissions in one pass. Each item gets its own result or error; a failing item does not fail the batch. Each item may carry its own baseline_score (MADRS, YMRS), visit_type (CGI) or detail level."
+)
+def submit_hetero_questionnaire_batch(
+    questionnaire_id: str,
+    batch_request: BatchAnswersRequest,
+    registry: QuestionnaireRegistry = Depends(get_registry)
+):
+    """Submit a batch of answer sets and calculate scores for a specific hetero questionnaire."""
+    adapter = registry.get_adapter("hetero", questionnaire_id)
+    
+    if not adapter:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Questionnaire '{questionnaire_id}' not found in hetero category"
+        )
+    
+    settings = get_settings()
+    max_batch_size = settings.max_batch_size
+    if len(batch_request.items) > max_batch_size:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch contains {len(batch_request.items)} submissions (maximum {max_batch_size})"
+        )
+    
+    if not adapter.supports_scoring:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Questionnaire '{questionnaire_id}' does not support scoring"
+        )
+    
+    results = adapter.score_items(batch_request.items)
+    succeeded = sum(1 for result in results if result["success"])
+    
+    # Score data is already JSON-compatible: encode once instead of
+    # re-validating every result through BatchScoreResponse
+    content = {
+        "questionnaire_id": questionnaire_id,
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results
+    }
+    if settings.fast_responses:
+        return FastJSONResponse(content)
+    return Response(content=dumps(content), media_type="application/json")
+
 
+@router.post(
+    "/questionnaires/{questionnaire_id}/submit-stream",
+    response_class=NDJSONStreamingResponse,
+    responses={
+        200: {
+            "content": {NDJSON_MEDIA_TYPE: {}},
+            "description": "One JSON result per line: line, success, score_data, error (and id if provided)"
+        },
+        404: {"model": ErrorResponse, "description": "Questionnaire not found"}
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}}}
+        }
+    },
+    summary="Stream answer sets and scores as NDJSON",
+    description="Consumes newline-delimited JSON submissions (same fields as submit-batch items, plus an optional 'id' echoed back) and streams one result per line as records are scored. Memory use is bounded regardless of input size."
+)
+async def submit_hetero_questionnaire_stream(
+    questionnaire_id: str,
+    request: Request,
+    registry: QuestionnaireRegistry = Depends(get_registry)
+):
+    """Stream answer sets and scores for a specific hetero questionnaire as NDJSON."""
+    adapter = registry.get_adapter("hetero", questionnaire_id)
+    
+    if not adapter:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Questionnaire '{questionnaire_id}' not found in hetero category"
+        )
+    
+    if not adapter.supports_scoring:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Questionnaire '{questionnaire_id}' does not support scoring"
+        )
+    
+    settings = get_settings()
+    encode = fast_dumps if settings.fast_responses else dumps
+    return NDJSONStreamingResponse(
+        score_ndjson_stream(request, adapter, settings.max_stream_line_bytes, encode)
+    )
@@ -2,7 +2,7 @@
 Pydantic models for API request and response schemas
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Literal, Optional, Union
 from pydantic import BaseModel, Field
 
 
@@ -94,6 +94,22 @@ class AnswersRequest(BaseModel):
         None,
         description="Optional demographic information (e.g., gender) for branching logic questionnaires"
     )
+    baseline_score: Optional[int] = Field(
+        None,
+        description="Optional baseline score for change/response calculation (MADRS, YMRS)"
+    )
+    visit_type: Optional[str] = Field(
+        None,
+        description="Optional visit type ('baseline' or 'followup') for CGI"
+    )
+    value_set: Optional[Union[str, List[str]]] = Field(
+        None,
+        description="Optional EQ-5D-5L value set(s) for the utility index (e.g. 'FR', or a list to compute the index under several value sets at once)"
+    )
+    detail: Optional[Literal["numeric", "summary", "full"]] = Field(
+        None,
+        description="Optional result detail level: 'numeric' (scores only), 'summary' (scores and labels, no interpretation) or 'full' (default) for the instruments that support it (MADRS, YMRS, CGI, FAST, EGF, ALDA, État du patient)"
+    )
     
     class Config:
         json_schema_extra = {
@@ -110,6 +126,29 @@ class AnswersRequest(BaseModel):
         }
 
 
+class BatchAnswersItem(AnswersRequest):
+    """A single submission within a batch."""
+    pass
+
+
+class BatchAnswersRequest(BaseModel):
+    """Request body for scoring many submissions at once."""
+    items: List[BatchAnswersItem] = Field(
+        ...,
+        description="Submissions to score, each with its own answers and context"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {"answers": {"q1": 0, "q2": 1, "q3": 2}},
+                    {"answers": {"q1": 2, "q2": 2, "q3": 1}, "demographics": {"gender": "M"}}
+                ]
+            }
+        }
+
+
 class ValidationResponse(BaseModel):
     """Response for answer validation."""
     valid: bool = Field(..., description="Whether the answers are valid")
@@ -146,6 +185,26 @@ class ScoreResponse(BaseModel):
         }
 
 
+class BatchItemResult(BaseModel):
+    """Result for one submission of a batch."""
+    index: int = Field(..., description="Position of the submission in the request")
+    success: bool = Field(..., description="Whether the submission was scored")
+    score_data: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Score data if successful (structure varies by questionnaire type)"
+    )
+    error: Optional[str] = Field(None, description="Error message if scoring failed")
+
+
+class BatchScoreResponse(BaseModel):
+    """Response for batch score calculation."""
+    questionnaire_id: str
+    total: int = Field(..., description="Number of submissions received")
+    succeeded: int = Field(..., description="Number of submissions scored")
+    failed: int = Field(..., description="Number of submissions that failed")
+    results: List[BatchItemResult]
+
+
 class ErrorResponse(BaseModel):
     """Standard error response."""
     detail: str = Field(..., description="Error message")
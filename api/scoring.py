@@ -0,0 +1,213 @@
+"""
+Scoring adapters: a uniform dispatch table over heterogeneous questionnaires
+
+Questionnaires expose either calculate_score() or calculate_screening() (MDQ),
+return either Pydantic models or plain dictionaries, and some accept context
+parameters (gender for PRISE-M, baseline_score for MADRS/YMRS, visit_type for
+CGI, value_set for EQ-5D-5L) or a result detail level (see
+questionnaires.detail). A ScoringAdapter resolves all of that once, when the
+questionnaire is registered, so that request handling is a direct call with
+no reflection.
+"""
+
+import inspect
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .metrics import record_outcome
+from .profiling import profiled
+from .slowlog import observe_answers
+from .timing import instrument_questionnaire, stage
+
+# Context parameters a scoring or validation method may accept besides the answers
+CONTEXT_PARAMETERS = ("gender", "baseline_score", "visit_type", "value_set")
+
+
+class ScoringNotSupportedError(Exception):
+    """Raised when a questionnaire exposes no scoring method."""
+    pass
+
+
+def to_score_data(result: Any) -> Dict[str, Any]:
+    """Convert a scoring result (Pydantic model or dict) to JSON-compatible data."""
+    if isinstance(result, dict):
+        return result
+    if hasattr(result, "model_dump"):
+        return result.model_dump(mode="json")
+    if hasattr(result, "dict"):
+        return result.dict()
+    return result
+
+
+def to_validation_data(result: Any) -> Dict[str, Any]:
+    """Convert a validation result (Pydantic model or dict) to valid/errors/warnings."""
+    if isinstance(result, dict):
+        return {
+            "valid": result.get("valid", False),
+            "errors": result.get("errors", []),
+            "warnings": result.get("warnings", [])
+        }
+    return {"valid": result.valid, "errors": result.errors, "warnings": result.warnings}
+
+
+def submission_context(submission: Any) -> Dict[str, Any]:
+    """
+    Extract the scoring context from a submission.
+
+    Args:
+        submission: AnswersRequest-like object (demographics, baseline_score,
+            visit_type, value_set)
+
+    Returns:
+        Dictionary of context parameter -> value (None when not provided)
+    """
+    demographics = submission.demographics or {}
+    return {
+        "gender": demographics.get("gender"),
+        "baseline_score": submission.baseline_score,
+        "visit_type": submission.visit_type,
+        "value_set": submission.value_set
+    }
+
+
+def accepted_context(method: Optional[Callable[..., Any]]) -> Tuple[str, ...]:
+    """
+    Context parameters a scoring or validation method accepts.
+
+    Args:
+        method: Bound method, or None
+
+    Returns:
+        Accepted parameter names, in CONTEXT_PARAMETERS order
+    """
+    if method is None:
+        return ()
+    parameters = inspect.signature(method).parameters
+    return tuple(name for name in CONTEXT_PARAMETERS if name in parameters)
+
+
+def _select(accepted: Tuple[str, ...], context: Dict[str, Any]) -> Dict[str, Any]:
+    # Only pass context the method accepts, and only when it was provided
+    return {
+        name: context[name]
+        for name in accepted
+        if context.get(name) is not None and context.get(name) != ""
+    }
+
+
+class ScoringAdapter:
+    """
+    Uniform interface to one questionnaire's scoring and validation.
+
+    Attributes:
+        questionnaire: The wrapped questionnaire instance
+        score_method: calculate_score or calculate_screening (None if unsupported)
+        score_context: Context parameters accepted by score_method
+        accepts_detail: Whether score_method accepts a detail level
+        validate_context: Context parameters accepted by validate_answers
+    """
+
+    def __init__(self, questionnaire: Any):
+        self.questionnaire = questionnaire
+        # Validation and interpretation are timed per stage (see api.timing)
+        instrument_questionnaire(questionnaire)
+
+        if hasattr(questionnaire, "calculate_score"):
+            self.score_method: Optional[Callable[..., Any]] = questionnaire.calculate_score
+        elif hasattr(questionnaire, "calculate_screening"):
+            self.score_method = questionnaire.calculate_screening
+        else:
+            self.score_method = None
+        self.score_context = accepted_context(self.score_method)
+        self.accepts_detail = self.score_method is not None and "detail" in inspect.signature(self.score_method).parameters
+
+        self.validate_method: Callable[..., Any] = questionnaire.validate_answers
+        self.validate_context = accepted_context(self.validate_method)
+
+    @property
+    def supports_scoring(self) -> bool:
+        """Whether the questionnaire can be scored."""
+        return self.score_method is not None
+
+    @profiled
+    def score(self, answers: Dict[str, Any], detail: Optional[str] = None, **context: Any) -> Dict[str, Any]:
+        """
+        Score one answer set.
+
+        Args:
+            answers: Dictionary mapping question IDs to answer values
+            detail: "numeric", "summary" or "full"; questionnaires without
+                detail levels always return their full result
+            **context: gender, baseline_score, visit_type and/or value_set; values the
+                questionnaire does not accept are ignored
+
+        Returns:
+            JSON-compatible score data
+
+        Raises:
+            ScoringNotSupportedError: If the questionnaire cannot be scored
+        """
+        if self.score_method is None:
+            raise ScoringNotSupportedError("Questionnaire does not support scoring")
+        observe_answers(answers)
+        arguments = _select(self.score_context, context)
+        if detail is not None and self.accepts_detail:
+            arguments["detail"] = detail
+        try:
+            with stage("score"):
+                result = self.score_method(answers, **arguments)
+        except Exception:
+            record_outcome("failed")
+            raise
+        record_outcome("scored")
+        with stage("serialize"):
+            return to_score_data(result)
+
+    @profiled
+    def validate(self, answers: Dict[str, Any], **context: Any) -> Dict[str, Any]:
+        """
+        Validate one answer set.
+
+        Returns:
+            Dictionary with valid, errors and warnings
+        """
+        observe_answers(answers)
+        validation = to_validation_data(self.validate_method(answers, **_select(self.validate_context, context)))
+        record_outcome("valid" if validation["valid"] else "invalid")
+        return validation
+
+    def score_submission(self, submission: Any) -> Dict[str, Any]:
+        """Score an AnswersRequest-like submission with its own context and detail level."""
+        return self.score(submission.answers, detail=submission.detail, **submission_context(submission))
+
+    def validate_submission(self, submission: Any) -> Dict[str, Any]:
+        """Validate an AnswersRequest-like submission with its own context."""
+        return self.validate(submission.answers, **submission_context(submission))
+
+    def score_item(self, item: Any) -> Dict[str, Any]:
+        """
+        Score one submission, capturing any failure as an error message.
+
+        Args:
+            item: AnswersRequest-like submission
+
+        Returns:
+            Dictionary with success, score_data and error
+        """
+        try:
+            score_data = self.score_submission(item)
+        except Exception as e:
+            return {"success": False, "score_data": None, "error": str(e)}
+        return {"success": True, "score_data": score_data, "error": None}
+
+    @profiled
+    def score_items(self, items: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Score a batch of submissions, isolating failures per item.
+
+        Args:
+            items: AnswersRequest-like submissions
+
+        Returns:
+            One result dictionary per item, with either score_data or error
+        """
+        return [{"index": index, **self.score_item(item)} for index, item in enumerate(items)]
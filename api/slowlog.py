@@ -0,0 +1,163 @@
+"""
+Slow-request log
+
+When QUESTIONNAIRES_SLOW_REQUEST_MS is set, every validate, submit and
+submit-batch request that takes longer than that budget (request received ->
+last response byte) is logged as one JSON line on the "api.slow_requests"
+logger, at WARNING level:
+
+    {"category": "auto", "questionnaire_id": "PSQI.fr", "endpoint": "submit",
+     "status": 200, "duration_ms": 31.2, "budget_ms": 25.0,
+     "stages": {"parse": 0.4, "validate": 0.2, "score": 29.8, ...},
+     "answer_sets": 1, "answers": 19, "fingerprint": "5d0c1e...",
+     "distinct_shapes": 1, "shape": {"q1": "str(9:9)", "q2": "int", ...},
+     "response_bytes": 812}
+
+Answers are described by their shape only: the type of every value and, for
+strings, their character classes (digits -> 9, letters -> a, runs collapsed),
+so "22:30" and "10h30" read as "str(9:9)" and "str(9a9)". Values never leave
+the process. The fingerprint hashes the shape, so slow requests with the same
+answer pattern can be grouped. Batches report the first item's shape and the
+number of distinct shapes.
+
+Stage timings come from api.timing, which times these requests whenever the
+slow-request log is enabled (histograms are still only kept with
+QUESTIONNAIRES_STAGE_TIMING). Requests for unknown questionnaires are not
+logged.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import get_settings
+from .timing import TIMED_PATH, current_timings
+
+logger = logging.getLogger("api.slow_requests")
+
+# Answer sets kept per request for shape statistics (counting continues beyond)
+MAX_OBSERVED_SETS = 1000
+
+_STRING_CLASSES = ((re.compile(r"\d+"), "9"), (re.compile(r"[^\W\d_]+"), "a"), (re.compile(r"\s+"), " "))
+
+# Longest string shape reported (longer shapes are truncated)
+MAX_STRING_SHAPE = 12
+
+
+def value_shape(value: Any) -> str:
+    """Shape of one answer value, without the value itself."""
+    if isinstance(value, str):
+        shape = value.strip()
+        for pattern, replacement in _STRING_CLASSES:
+            shape = pattern.sub(replacement, shape)
+        return f"str({shape[:MAX_STRING_SHAPE]})"
+    if isinstance(value, (list, tuple)):
+        return f"list[{len(value)}]"
+    if isinstance(value, dict):
+        return f"dict[{len(value)}]"
+    return type(value).__name__
+
+
+def answer_shape(answers: Dict[str, Any]) -> Dict[str, str]:
+    """Shape of an answer set: question id -> value shape."""
+    return {str(question_id): value_shape(value) for question_id, value in answers.items()}
+
+
+def shape_fingerprint(shape: Dict[str, str]) -> str:
+    """Short stable hash of an answer shape."""
+    encoded = json.dumps(shape, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:12]
+
+
+class ObservedAnswers:
+    """Answer sets handed to the scoring adapter during one request."""
+
+    __slots__ = ("count", "sets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sets: List[Dict[str, Any]] = []
+
+    def summary(self) -> Dict[str, Any]:
+        """Answer statistics of the request (shapes only)."""
+        if not self.sets:
+            return {"answer_sets": self.count}
+        shapes = [answer_shape(answers) for answers in self.sets]
+        return {
+            "answer_sets": self.count,
+            "answers": len(shapes[0]),
+            "fingerprint": shape_fingerprint(shapes[0]),
+            "distinct_shapes": len({shape_fingerprint(shape) for shape in shapes}),
+            "shape": shapes[0]
+        }
+
+
+_current: ContextVar[Optional[ObservedAnswers]] = ContextVar("observed_answers", default=None)
+
+
+def observe_answers(answers: Dict[str, Any]) -> None:
+    """Note an answer set scored or validated by the current request (no-op when not logging)."""
+    observed = _current.get()
+    if observed is None:
+        return
+    observed.count += 1
+    if len(observed.sets) < MAX_OBSERVED_SETS:
+        observed.sets.append(answers)
+
+
+class SlowRequestMiddleware:
+    """ASGI middleware logging validate and submit requests over the latency budget."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        budget_ms = get_settings().slow_request_ms
+        match = TIMED_PATH.match(scope["path"]) if budget_ms is not None else None
+        if match is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        observed = ObservedAnswers()
+        token = _current.set(observed)
+        response: Dict[str, Any] = {"status": None, "bytes": 0}
+
+        async def send_counting(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_counting)
+        finally:
+            _current.reset(token)
+
+        duration_ms = (perf_counter() - start) * 1e3
+        if duration_ms <= budget_ms or response["status"] == 404:
+            return
+
+        category, questionnaire_id, endpoint = match.groups()
+        timings = current_timings()
+        record = {
+            "category": category,
+            "questionnaire_id": questionnaire_id,
+            "endpoint": endpoint,
+            "status": response["status"],
+            "duration_ms": round(duration_ms, 3),
+            "budget_ms": budget_ms,
+            "stages": {name: round(value, 3) for name, value in (timings.durations if timings else {}).items()},
+            **observed.summary(),
+            "response_bytes": response["bytes"]
+        }
+        logger.warning(json.dumps(record))
@@ -0,0 +1,165 @@
+"""
+Streaming NDJSON scoring
+
+Consumes newline-delimited JSON submissions from the request body as it
+arrives and yields newline-delimited JSON results as they are produced.
+Only the current chunk and one partial record are held in memory, and since
+the next chunk is not read until the previous results have been sent, a slow
+client socket throttles how fast the request body is consumed.
+"""
+
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+
+from .encoding import dumps
+from .metrics import record_outcome
+from .schemas import BatchAnswersItem
+from .scoring import ScoringAdapter
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    Streaming response whose body iterator reads the request body itself.
+
+    StreamingResponse normally listens for client disconnects by calling
+    receive() concurrently, which would steal request body chunks from the
+    iterator. Here the iterator is the only consumer of receive(); a client
+    disconnect surfaces as ClientDisconnect from request.stream().
+    """
+    media_type = NDJSON_MEDIA_TYPE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+
+        if self.background is not None:
+            await self.background()
+
+
+def _error(line_number: int, message: str) -> Dict[str, Any]:
+    record_outcome("malformed")
+    return {"line": line_number, "success": False, "score_data": None, "error": message}
+
+
+def score_line(adapter: ScoringAdapter, line_number: int, line: bytes) -> Dict[str, Any]:
+    """
+    Parse and score one NDJSON record.
+
+    Args:
+        adapter: Scoring adapter of the target questionnaire
+        line_number: 1-based line number in the request body
+        line: Raw record (without the trailing newline)
+
+    Returns:
+        Result dictionary; an 'id' field in the record is echoed back
+    """
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return _error(line_number, f"Invalid JSON: {e}")
+
+    try:
+        item = BatchAnswersItem.model_validate(record)
+    except ValidationError as e:
+        details = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+        )
+        return _error(line_number, f"Invalid record: {details}")
+
+    result = {"line": line_number, **adapter.score_item(item)}
+    if "id" in record:
+        result["id"] = record["id"]
+    return result
+
+
+def score_lines(
+    adapter: ScoringAdapter,
+    lines: List[Tuple[int, Optional[bytes]]],
+    max_line_bytes: int,
+    encode: Callable[[Any], bytes] = dumps
+) -> bytes:
+    """
+    Score a group of records and encode the results as NDJSON.
+
+    Blank lines are skipped; None marks a record that exceeded max_line_bytes.
+    encode turns one result into JSON bytes (dumps or fast_dumps).
+    """
+    results = []
+    for line_number, line in lines:
+        if line is None:
+            results.append(encode(_error(line_number, f"Record exceeds {max_line_bytes} bytes")))
+        elif line.strip():
+            results.append(encode(score_line(adapter, line_number, line)))
+    return b"".join(result + b"\n" for result in results)
+
+
+async def score_ndjson_stream(
+    request: Request,
+    adapter: ScoringAdapter,
+    max_line_bytes: int,
+    encode: Callable[[Any], bytes] = dumps
+) -> AsyncIterator[bytes]:
+    """
+    Score an NDJSON request body incrementally.
+
+    Records longer than max_line_bytes are skipped (reported as an error)
+    without being buffered. Scoring runs in the threadpool so large chunks
+    do not block the event loop.
+
+    Args:
+        request: Incoming request whose body is NDJSON
+        adapter: Scoring adapter of the target questionnaire
+        max_line_bytes: Maximum size of a single record
+        encode: JSON encoder for results (dumps or fast_dumps)
+
+    Yields:
+        NDJSON-encoded results, one line per non-empty record
+    """
+    pending = b""
+    line_number = 0
+    discarding = False
+
+    chunks = request.stream().__aiter__()
+    while True:
+        try:
+            chunk = await chunks.__anext__()
+        except StopAsyncIteration:
+            break
+        except ClientDisconnect:
+            # Client went away mid-stream: nobody is left to read results
+            return
+        if not chunk:
+            continue
+        *complete, tail = (pending + chunk).split(b"\n")
+
+        lines = []
+        for line in complete:
+            line_number += 1
+            # None marks an oversized record, possibly discarded across chunks
+            oversized = discarding or len(line) > max_line_bytes
+            lines.append((line_number, None if oversized else line))
+            discarding = False
+
+        if len(tail) > max_line_bytes:
+            discarding = True
+            tail = b""
+        pending = tail
+
+        if lines:
+            results = await run_in_threadpool(score_lines, adapter, lines, max_line_bytes, encode)
+            if results:
+                yield results
+
+    line_number += 1
+    if discarding or pending.strip():
+        yield await run_in_threadpool(
+            score_lines, adapter, [(line_number, None if discarding else pending)], max_line_bytes, encode
+        )
@@ -0,0 +1,133 @@
+"""
+Pre-rendered questionnaire structures
+
+Questionnaire lists, metadata and structures never change during the lifetime
+of a deployment, so they are rendered once, validated through their response
+models and encoded to JSON bytes that can be written straight to the socket.
+"""
+
+import hashlib
+import inspect
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .encoding import dumps
+from .schemas import QuestionnaireDetail, QuestionnaireListItem, QuestionnaireMetadata
+
+# Gender variants rendered for questionnaires whose structure depends on gender
+GENDER_VARIANTS: Tuple[Optional[str], ...] = (None, "F", "M")
+
+
+class RenderedStructure(NamedTuple):
+    """An immutable, already-encoded response body and its ETag."""
+    body: bytes
+    etag: str
+
+
+def make_etag(body: bytes) -> str:
+    """Build a strong ETag from the content hash of an encoded body."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def accepts_gender(questionnaire: Any) -> bool:
+    """Whether the questionnaire's structure varies with the respondent's gender."""
+    method = getattr(questionnaire, "get_full_questionnaire", None)
+    if method is None:
+        return False
+    return "gender" in inspect.signature(method).parameters
+
+
+def build_structure(questionnaire: Any, gender: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the full structure of a questionnaire as a plain dictionary.
+
+    Args:
+        questionnaire: Questionnaire instance
+        gender: Optional gender, only used by questionnaires with branching logic
+
+    Returns:
+        Dictionary with metadata, sections, questions and optional logic
+    """
+    if hasattr(questionnaire, "get_full_questionnaire"):
+        if gender is not None:
+            return questionnaire.get_full_questionnaire(gender=gender)
+        return questionnaire.get_full_questionnaire()
+
+    # Fallback for questionnaires without get_full_questionnaire
+    return {
+        "metadata": questionnaire.get_metadata(),
+        "sections": questionnaire.get_sections(),
+        "questions": questionnaire.get_questions()
+    }
+
+
+def render_json(content: Any) -> RenderedStructure:
+    """Encode JSON-compatible content and compute its ETag."""
+    body = dumps(content)
+    return RenderedStructure(body=body, etag=make_etag(body))
+
+
+def render_structure(questionnaire: Any, gender: Optional[str] = None) -> RenderedStructure:
+    """
+    Render a questionnaire structure to encoded JSON bytes.
+
+    The structure goes through QuestionnaireDetail exactly as the endpoint
+    response model would, so the bytes match the framework's own output.
+    """
+    detail = QuestionnaireDetail(**build_structure(questionnaire, gender))
+    return render_json(detail.model_dump(mode="json"))
+
+
+def render_metadata(questionnaire: Any) -> RenderedStructure:
+    """Render a questionnaire's metadata through QuestionnaireMetadata."""
+    metadata = QuestionnaireMetadata(**questionnaire.get_metadata())
+    return render_json(metadata.model_dump(mode="json"))
+
+
+def render_listing(category: str, questionnaires: Dict[str, Dict[str, Any]]) -> RenderedStructure:
+    """
+    Render the summary list of a category's questionnaires.
+
+    Args:
+        category: 'auto' or 'hetero'
+        questionnaires: Dictionary of questionnaire_id -> metadata (name,
+            abbreviation, language, description)
+
+    Returns:
+        Rendered list of QuestionnaireListItem
+    """
+    items = []
+    for q_id, metadata in questionnaires.items():
+        items.append(QuestionnaireListItem(
+            id=q_id,
+            name=metadata.get("name", ""),
+            abbreviation=metadata.get("abbreviation", ""),
+            language=metadata.get("language", ""),
+            category=category,
+            description=metadata.get("description")
+        ).model_dump(mode="json"))
+    return render_json(items)
+
+
+def render_variants(questionnaire: Any) -> Dict[Optional[str], RenderedStructure]:
+    """
+    Render every structure variant of a questionnaire.
+
+    Returns:
+        Dictionary of gender variant (None for the default) -> rendered structure
+    """
+    if not accepts_gender(questionnaire):
+        return {None: render_structure(questionnaire)}
+    return {gender: render_structure(questionnaire, gender) for gender in GENDER_VARIANTS}
+
+
+def normalize_gender(gender: Optional[str]) -> Optional[str]:
+    """
+    Map a requested gender onto its rendered variant.
+
+    Questionnaires only filter on 'F' and 'M' (case-insensitive); any other
+    value yields the unfiltered structure.
+    """
+    if gender is None:
+        return None
+    gender_upper = gender.upper()
+    return gender_upper if gender_upper in ("F", "M") else None
@@ -0,0 +1,394 @@
+"""
+Synthetic answer sets generated from questionnaire definitions
+
+AnswerGenerator reads a questionnaire's get_questions() once and compiles
+every question into a sampler: option codes, constraints.allowed_values,
+min/max ranges (scales, integers, the EQ-5D-5L VAS) and time fields. It
+also compiles the branching rules: display_if / required_if (JSON logic,
+e.g. EtatPatient sub-items or the MDQ follow-up questions), gender_specific
+items (PRISE-M) and visit-type visibility (CGI). Each valid answer set then
+only answers the questions visible for its drawn context, and is valid by
+construction. Invalid sets are valid sets with exactly one deliberate
+defect (see MUTATIONS).
+
+Some cross-question checks cannot be read from the definitions (the PSQI
+time in bed must exceed the hours of sleep); FIELD_HINTS supplies realistic
+samplers for those fields.
+
+Submissions are shaped as AnswersRequest bodies (submit, submit-batch items,
+submit-stream records). Write NDJSON files for submit-stream with:
+
+    python -m api.synthetic PSQI.fr --count 10000 > psqi.ndjson
+    python -m api.synthetic MADRS.fr --count 1000 --invalid-rate 0.2 --seed 1 > madrs.ndjson
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from .scoring import accepted_context
+
+# Deliberate defects of invalid answer sets
+MUTATIONS: Tuple[str, ...] = (
+    "missing",       # a required answer is left out
+    "out_of_range",  # a value outside the allowed codes or range
+    "wrong_type"     # a value of the wrong type (text for a number, a number for a time)
+)
+
+GENDERS: Tuple[str, ...] = ("F", "M")
+VISIT_TYPES: Tuple[str, ...] = ("baseline", "followup")
+
+# Fields below this bound get this span when they have no maximum
+DEFAULT_SPAN = 60
+
+# Evaluation data of a branching rule: {"answers": ..., "gender": ..., "visit_type": ...}
+RuleData = Dict[str, Any]
+Sampler = Callable[[random.Random, Dict[str, Any]], Any]
+
+VISIBILITY_RULE = re.compile(r"^(\w+)\s*(==|!=)\s*'([^']*)'$")
+
+
+class Mutation(NamedTuple):
+    """The single defect introduced into an invalid answer set."""
+    kind: str
+    question_id: str
+
+
+def _clock(minutes: int) -> str:
+    minutes %= 24 * 60
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _minutes(clock: str) -> int:
+    hours, minutes = clock.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _psqi_sleep_hours(rng: random.Random, answers: Dict[str, Any]) -> str:
+    # Between 60% and 100% of the time in bed, as hours ("6.5") or HH:MM ("6:30")
+    in_bed = (_minutes(answers["q3"]) - _minutes(answers["q1"])) % (24 * 60)
+    asleep = int(in_bed * rng.uniform(0.6, 1.0)) // 15 * 15
+    if rng.random() < 0.5:
+        return f"{asleep // 60}:{asleep % 60:02d}"
+    return f"{asleep / 60:g}"
+
+
+# Questionnaire id -> question id -> sampler, for constraints the definitions do not express
+FIELD_HINTS: Dict[str, Dict[str, Sampler]] = {
+    "PSQI.fr": {
+        "q1": lambda rng, answers: _clock(rng.randrange(21 * 60, 25 * 60 + 1, 5)),  # bedtime
+        "q2": lambda rng, answers: rng.choice((5, 10, 15, 20, 30, 45, 60, 90)),   # minutes to fall asleep
+        "q3": lambda rng, answers: _clock(rng.randrange(5 * 60 + 30, 9 * 60 + 31, 5)),  # wake time
+        "q4": _psqi_sleep_hours
+    }
+}
+
+
+def compile_rule(rule: Any) -> Callable[[RuleData], Any]:
+    """
+    Compile a JSON logic expression into a function of the rule data.
+
+    Supports the operators used by questionnaire definitions (var, ==, !=,
+    <, <=, >, >=, +, and, or, !, in). Missing variables evaluate to None;
+    comparisons involving None are false and + counts None as 0.
+
+    Raises:
+        ValueError: If the expression uses an unsupported operator
+    """
+    if isinstance(rule, list):
+        items = [compile_rule(item) for item in rule]
+        return lambda data: [item(data) for item in items]
+    if not isinstance(rule, dict):
+        return lambda data: rule
+
+    (operator, arguments), = rule.items()
+    if operator == "var":
+        path = (arguments[0] if isinstance(arguments, list) else arguments).split(".")
+
+        def var(data: RuleData) -> Any:
+            value: Any = data
+            for key in path:
+                if not isinstance(value, dict):
+                    return None
+                value = value.get(key)
+            return value
+        return var
+
+    if not isinstance(arguments, list):
+        arguments = [arguments]
+    operands = [compile_rule(argument) for argument in arguments]
+
+    if operator == "+":
+        return lambda data: sum(operand(data) or 0 for operand in operands)
+    if operator == "and":
+        return lambda data: all(operand(data) for operand in operands)
+    if operator == "or":
+        return lambda data: any(operand(data) for operand in operands)
+    if operator == "!":
+        return lambda data: not operands[0](data)
+    if operator == "in":
+        return lambda data: operands[0](data) in (operands[1](data) or ())
+    if operator in ("==", "!="):
+        negate = operator == "!="
+        return lambda data: (operands[0](data) == operands[1](data)) != negate
+
+    comparisons = {
+        "<": lambda a, b: a < b,
+        "<=": lambda a, b: a <= b,
+        ">": lambda a, b: a > b,
+        ">=": lambda a, b: a >= b
+    }
+    if operator not in comparisons:
+        raise ValueError(f"Unsupported rule operator '{operator}'")
+    compare = comparisons[operator]
+
+    def comparison(data: RuleData) -> bool:
+        left, right = operands[0](data), operands[1](data)
+        return left is not None and right is not None and compare(left, right)
+    return comparison
+
+
+def compile_visibility(visibility: Optional[Dict[str, Any]]) -> Optional[Callable[[RuleData], bool]]:
+    """Compile a visibility rule such as "visit_type != 'baseline'" (None when always visible)."""
+    rule = (visibility or {}).get("rule", "always")
+    if rule == "always":
+        return None
+    match = VISIBILITY_RULE.match(rule)
+    if match is None:
+        raise ValueError(f"Unsupported visibility rule '{rule}'")
+    name, operator, value = match.groups()
+    if operator == "==":
+        return lambda data: data.get(name) == value
+    return lambda data: data.get(name) != value
+
+
+class CompiledQuestion(NamedTuple):
+    """One question reduced to what answer generation needs."""
+    question_id: str
+    sample: Sampler
+    required: bool
+    display_if: Optional[Callable[[RuleData], Any]]
+    required_if: Optional[Callable[[RuleData], Any]]
+    visible_if: Optional[Callable[[RuleData], bool]]
+    gender: Optional[str]
+    invalid_values: Dict[str, Any]
+
+
+def _allowed_values(question: Dict[str, Any]) -> List[Any]:
+    codes = [option.get("code", option.get("value")) for option in question.get("options") or []]
+    constraints = question.get("constraints") or {}
+    return codes or constraints.get("allowed_values") or question.get("allowed_values") or []
+
+
+def _sampler(question: Dict[str, Any]) -> Sampler:
+    """Draw values from the question's options, allowed values or range."""
+    allowed = tuple(_allowed_values(question))
+    if allowed:
+        return lambda rng, answers: rng.choice(allowed)
+
+    if question["type"] == "time":
+        return lambda rng, answers: _clock(rng.randrange(0, 24 * 60, 5))
+
+    constraints = question.get("constraints") or {}
+    scale = question.get("scale") or {}
+    low = constraints.get("min_value", scale.get("min_value", 0))
+    high = constraints.get("max_value", scale.get("max_value", low + DEFAULT_SPAN))
+    step = scale.get("step", 1)
+    values = tuple(low + index * step for index in range(int((high - low) / step) + 1))
+    if question["type"] == "string":
+        texts = tuple(str(value) for value in values)
+        return lambda rng, answers: rng.choice(texts)
+    return lambda rng, answers: rng.choice(values)
+
+
+def _invalid_values(question: Dict[str, Any]) -> Dict[str, Any]:
+    """A value per mutation kind that the question must reject."""
+    if question["type"] == "time":
+        return {"out_of_range": "24:75", "wrong_type": 2330}
+
+    invalid: Dict[str, Any] = {"wrong_type": "not-a-number"}
+    allowed = [value for value in _allowed_values(question) if isinstance(value, (int, float))]
+    constraints = question.get("constraints") or {}
+    if allowed:
+        invalid["out_of_range"] = max(allowed) + 1
+    elif "max_value" in constraints:
+        invalid["out_of_range"] = constraints["max_value"] + 1
+    elif "min_value" in constraints:
+        invalid["out_of_range"] = constraints["min_value"] - 1
+    if question["type"] == "string" and "out_of_range" in invalid:
+        invalid["out_of_range"] = str(invalid["out_of_range"])
+    return invalid
+
+
+class AnswerGenerator:
+    """
+    Generates valid or deliberately invalid submissions for one questionnaire.
+
+    Example:
+        generator = AnswerGenerator(PSQI(), seed=0)
+        for submission in generator.valid(1000):
+            adapter.score_submission(AnswersRequest(**submission))
+    """
+
+    def __init__(self, questionnaire: Any, seed: Optional[int] = None, optional_rate: float = 0.8):
+        """
+        Compile the questionnaire's questions.
+
+        Args:
+            questionnaire: Questionnaire instance (anything with get_questions())
+            seed: Seed for reproducible sequences
+            optional_rate: Probability of answering a visible optional question
+        """
+        self.questionnaire = questionnaire
+        self.questionnaire_id = questionnaire.get_metadata().get("id")
+        self.rng = random.Random(seed)
+        self.optional_rate = optional_rate
+
+        hints = FIELD_HINTS.get(self.questionnaire_id, {})
+        self.questions: List[CompiledQuestion] = [
+            CompiledQuestion(
+                question_id=question["id"],
+                sample=hints.get(question["id"]) or _sampler(question),
+                required=bool(question.get("required")),
+                display_if=compile_rule(question["display_if"]) if question.get("display_if") else None,
+                required_if=compile_rule(question["required_if"]) if question.get("required_if") else None,
+                visible_if=compile_visibility(question.get("visibility")),
+                gender=question.get("gender_specific"),
+                invalid_values=_invalid_values(question)
+            )
+            for question in questionnaire.get_questions()
+        ]
+
+        score_method = getattr(questionnaire, "calculate_score", None) or getattr(questionnaire, "calculate_screening", None)
+        self.context = set(accepted_context(score_method)) | set(accepted_context(questionnaire.validate_answers))
+        if any(question.gender for question in self.questions):
+            self.context.add("gender")
+
+    def _draw_context(self) -> RuleData:
+        rng = self.rng
+        return {
+            "gender": rng.choice(GENDERS) if "gender" in self.context else None,
+            "visit_type": rng.choice(VISIT_TYPES) if "visit_type" in self.context else None,
+            "baseline_score": rng.randint(15, 45) if "baseline_score" in self.context else None
+        }
+
+    def _answer(self, data: RuleData) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Answer the visible questions.
+
+        Returns:
+            The answers, and the ids of the always-required questions (the
+            ones every questionnaire validates; required_if is not always
+            enforced)
+        """
+        rng = self.rng
+        answers: Dict[str, Any] = data["answers"]
+        required: List[str] = []
+        for question in self.questions:
+            if question.gender is not None and question.gender != data["gender"]:
+                continue
+            if question.visible_if is not None and not question.visible_if(data):
+                continue
+            if question.display_if is not None and not question.display_if(data):
+                continue
+            if question.required:
+                required.append(question.question_id)
+            elif question.required_if is None or not question.required_if(data):
+                if rng.random() >= self.optional_rate:
+                    continue
+            answers[question.question_id] = question.sample(rng, answers)
+        return answers, required
+
+    def _submission(self, data: RuleData) -> Dict[str, Any]:
+        submission: Dict[str, Any] = {"answers": data["answers"]}
+        if data["gender"] is not None:
+            submission["demographics"] = {"gender": data["gender"]}
+        if data["baseline_score"] is not None:
+            submission["baseline_score"] = data["baseline_score"]
+        if data["visit_type"] is not None:
+            submission["visit_type"] = data["visit_type"]
+        return submission
+
+    def answers(self) -> Dict[str, Any]:
+        """One valid submission (answers plus the context it was drawn for)."""
+        data = {**self._draw_context(), "answers": {}}
+        self._answer(data)
+        return self._submission(data)
+
+    def invalid_answers(self) -> Tuple[Dict[str, Any], Mutation]:
+        """One submission with a single deliberate defect, and that defect."""
+        rng = self.rng
+        data = {**self._draw_context(), "answers": {}}
+        answers, required = self._answer(data)
+        by_id = {question.question_id: question for question in self.questions}
+
+        candidates = [("missing", question_id, None) for question_id in required]
+        for question_id in required:
+            for kind, value in by_id[question_id].invalid_values.items():
+                candidates.append((kind, question_id, value))
+        kind, question_id, value = rng.choice(candidates)
+        if kind == "missing":
+            del answers[question_id]
+        else:
+            answers[question_id] = value
+        return self._submission(data), Mutation(kind, question_id)
+
+    def valid(self, count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield valid submissions (endlessly when count is None)."""
+        index = 0
+        while count is None or index < count:
+            yield self.answers()
+            index += 1
+
+    def invalid(self, count: Optional[int] = None) -> Iterator[Tuple[Dict[str, Any], Mutation]]:
+        """Yield (submission, mutation) pairs (endlessly when count is None)."""
+        index = 0
+        while count is None or index < count:
+            yield self.invalid_answers()
+            index += 1
+
+
+def write_ndjson(generator: AnswerGenerator, stream: TextIO, count: int, invalid_rate: float = 0.0) -> None:
+    """
+    Write submit-stream records, one JSON object per line.
+
+    Each record carries an id: "valid-<n>", or "invalid-<n>:<kind>:<question>"
+    for records with a deliberate defect, so results can be matched back.
+    """
+    rng = generator.rng
+    for index in range(count):
+        if rng.random() < invalid_rate:
+            submission, mutation = generator.invalid_answers()
+            record = {"id": f"invalid-{index}:{mutation.kind}:{mutation.question_id}", **submission}
+        else:
+            record = {"id": f"valid-{index}", **generator.answers()}
+        stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def main() -> int:
+    from .discovery import discover_questionnaires
+
+    parser = argparse.ArgumentParser(description="Write synthetic submit-stream records as NDJSON")
+    parser.add_argument("questionnaire_id", help="Questionnaire id, e.g. PSQI.fr")
+    parser.add_argument("--count", type=int, default=1000, help="Records to write")
+    parser.add_argument("--invalid-rate", type=float, default=0.0, help="Share of records with a deliberate defect")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    descriptor = next(
+        (descriptor for descriptor in discover_questionnaires() if descriptor.questionnaire_id == args.questionnaire_id),
+        None
+    )
+    if descriptor is None:
+        parser.error(f"unknown questionnaire '{args.questionnaire_id}'")
+
+    generator = AnswerGenerator(descriptor.load(), seed=args.seed)
+    write_ndjson(generator, sys.stdout, args.count, args.invalid_rate)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
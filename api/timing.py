@@ -0,0 +1,282 @@
+"""
+Per-stage timing of the submit pipeline
+
+When QUESTIONNAIRES_STAGE_TIMING or QUESTIONNAIRES_SERVER_TIMING is set,
+StageTimingMiddleware times every validate, submit and submit-batch request
+stage by stage:
+
+    parse           request received -> first scoring stage (body, JSON, models)
+    validate        questionnaire validate_answers()
+    score           calculate_score() / calculate_screening(), excluding the
+                    nested validate and interpretation stages
+    interpretation  _generate_interpretation() / _build_interpretation()
+    serialize       score result -> JSON-compatible data (model_dump)
+    encode          last scoring stage -> response start (response model, JSON)
+    total           request received -> response start
+
+Durations are aggregated into per-questionnaire histograms (GET /timings) and,
+with QUESTIONNAIRES_SERVER_TIMING, returned in a Server-Timing header.
+Requests are also timed, without histograms, for the slow-request log
+(QUESTIONNAIRES_SLOW_REQUEST_MS, see api.slowlog).
+Streaming submits are not timed.
+"""
+
+import functools
+import re
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .config import get_settings
+
+# Upper bounds of histogram buckets, in milliseconds (a last bucket catches the rest)
+BUCKETS_MS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Stages in pipeline order (also the Server-Timing order)
+STAGES: Tuple[str, ...] = ("parse", "validate", "score", "interpretation", "serialize", "encode", "total")
+
+# Questionnaire methods timed as a stage of their own
+INSTRUMENTED_METHODS: Dict[str, str] = {
+    "validate_answers": "validate",
+    "_generate_interpretation": "interpretation",
+    "_build_interpretation": "interpretation"
+}
+
+TIMED_PATH = re.compile(r"^/api/(auto|hetero)/questionnaires/([^/]+)/(validate|submit|submit-batch)$")
+
+
+class RequestTimings:
+    """Stage durations of one request, in seconds (each stage excludes nested stages)."""
+
+    __slots__ = ("start", "stages", "first_stage_start", "last_stage_end", "nested", "durations")
+
+    def __init__(self) -> None:
+        self.start = perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.first_stage_start: Optional[float] = None
+        self.last_stage_end: Optional[float] = None
+        # Time spent in stages nested inside the one currently running
+        self.nested = 0.0
+        # Breakdown in milliseconds, once finished
+        self.durations: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add time to a stage."""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def finish(self, end: float) -> Dict[str, float]:
+        """
+        Complete the breakdown at response start.
+
+        Returns:
+            Stage -> duration in milliseconds, in pipeline order
+        """
+        if self.first_stage_start is not None:
+            self.add("parse", self.first_stage_start - self.start)
+            self.add("encode", end - self.last_stage_end)
+        self.stages["total"] = end - self.start
+        self.durations = {name: self.stages[name] * 1e3 for name in STAGES if name in self.stages}
+        return self.durations
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """Timings of the request in progress (None when not timing)."""
+    return _current.get()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a block as one stage of the current request (no-op when not timing)."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+
+    start = perf_counter()
+    if timings.first_stage_start is None:
+        timings.first_stage_start = start
+    outer_nested, timings.nested = timings.nested, 0.0
+    try:
+        yield
+    finally:
+        end = perf_counter()
+        elapsed = end - start
+        timings.add(name, elapsed - timings.nested)
+        timings.nested = outer_nested + elapsed
+        timings.last_stage_end = end
+
+
+def timed(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a method so that every call is timed as a stage."""
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _current.get() is None:
+            return method(*args, **kwargs)
+        with stage(name):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def instrument_questionnaire(questionnaire: Any) -> None:
+    """
+    Time the questionnaire's validation and interpretation methods.
+
+    The wrappers are installed on the instance, so they also apply when
+    calculate_score() calls them internally. They only record anything
+    while a timed request is in progress.
+    """
+    for method_name, stage_name in INSTRUMENTED_METHODS.items():
+        method = getattr(questionnaire, method_name, None)
+        if method is not None and not hasattr(method, "__wrapped__"):
+            setattr(questionnaire, method_name, timed(stage_name, method))
+
+
+class Histogram:
+    """Fixed-bucket histogram of durations in milliseconds."""
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one duration."""
+        self.counts[bisect_left(BUCKETS_MS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (None if empty or beyond the last bound)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(BUCKETS_MS, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible summary."""
+        return {
+            "count": self.count,
+            "mean_ms": self.sum / self.count if self.count else None,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {
+                **{str(bound): count for bound, count in zip(BUCKETS_MS, self.counts)},
+                "+Inf": self.counts[-1]
+            }
+        }
+
+
+class StageHistograms:
+    """Per-(category, questionnaire, endpoint, stage) duration histograms."""
+
+    def __init__(self) -> None:
+        self._histograms: Dict[Tuple[str, str, str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, category: str, questionnaire_id: str, endpoint: str, durations: Dict[str, float]) -> None:
+        """Record the stage durations (ms) of one request."""
+        with self._lock:
+            for name, value in durations.items():
+                key = (category, questionnaire_id, endpoint, name)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram()
+                histogram.observe(value)
+
+    def items(self) -> List[Tuple[Tuple[str, str, str, str], Histogram]]:
+        """Snapshot of (key, histogram) pairs."""
+        with self._lock:
+            return list(self._histograms.items())
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """
+        Summaries grouped as "category/questionnaire_id" -> endpoint -> stage.
+        """
+        result: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        for (category, questionnaire_id, endpoint, name), histogram in self.items():
+            endpoints = result.setdefault(f"{category}/{questionnaire_id}", {})
+            endpoints.setdefault(endpoint, {})[name] = histogram.to_dict()
+        return result
+
+    def reset(self) -> None:
+        """Discard every recorded duration."""
+        with self._lock:
+            self._histograms.clear()
+
+
+# Process-wide histograms
+stage_histograms = StageHistograms()
+
+
+def known_questionnaire(category: str, questionnaire_id: str) -> bool:
+    """
+    Whether the registry serves a questionnaire id.
+
+    Request paths can name any id, and requests rejected before the handler
+    runs (422 on a malformed body) never reach the registry's 404, so
+    per-questionnaire metrics check the id itself to keep their keys bounded.
+    """
+    # Imported here: the registry depends on the scoring adapters, which use this module
+    from .dependencies import get_registry
+
+    return get_registry().is_known(category, questionnaire_id)
+
+
+def server_timing_header(durations: Dict[str, float]) -> bytes:
+    """Format a stage breakdown (ms) as a Server-Timing header value."""
+    return ", ".join(f"{name};dur={value:.3f}" for name, value in durations.items()).encode("latin-1")
+
+
+class StageTimingMiddleware:
+    """ASGI middleware timing validate, submit and submit-batch requests."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        match = TIMED_PATH.match(scope["path"])
+        settings = get_settings()
+        histograms = settings.stage_timing or settings.server_timing
+        if match is None or not (histograms or settings.slow_request_ms is not None):
+            await self.app(scope, receive, send)
+            return
+
+        category, questionnaire_id, endpoint = match.groups()
+        timings = RequestTimings()
+        token = _current.set(timings)
+
+        async def send_with_timings(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                durations = timings.finish(perf_counter())
+                # Unknown questionnaires are not recorded (unbounded ids)
+                if histograms and known_questionnaire(category, questionnaire_id):
+                    stage_histograms.record(category, questionnaire_id, endpoint, durations)
+                if settings.server_timing:
+                    message = {
+                        **message,
+                        "headers": [*message.get("headers", []), (b"server-timing", server_timing_header(durations))]
+                    }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            _current.reset(token)
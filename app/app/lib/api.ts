@@ -35,6 +35,11 @@ async function fetchAPI<T>(endpoint: string, options?: RequestInit, retries = 3)
     console.log(`[API Client SSR] Fetching from: ${url}`);
   }
   
+  // Read endpoints send ETags: revalidate GETs (304 Not Modified) instead of
+  // re-downloading unchanged bodies; never cache submissions
+  const method = (options?.method ?? 'GET').toUpperCase();
+  const cache: RequestCache = options?.cache ?? (method === 'GET' ? 'no-cache' : 'no-store');
+
   for (let attempt = 1; attempt <= retries; attempt++) {
     try {
       const response = await fetch(url, {
@@ -43,8 +48,7 @@ async function fetchAPI<T>(endpoint: string, options?: RequestInit, retries = 3)
           'Content-Type': 'application/json',
           ...options?.headers,
         },
-        // Add timeout and cache settings
-        cache: 'no-store',
+        cache,
       });
 
       if (!response.ok) {
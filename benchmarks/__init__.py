@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the Questionnaires API
+
+Run from the repository root, e.g.: python -m benchmarks.bench_submit_batch
+"""
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: calculate_score() at each result detail level
+
+For every questionnaire whose calculate_score() accepts a detail level (see
+questionnaires.detail), generates realistic answer sets from its own question
+definitions (api.synthetic) and measures calculate_score() throughput at:
+
+    full     scores, labels, interpretation text and calculation date
+    summary  scores and labels
+    numeric  scores only
+
+and the speedup of each level over full.
+
+Usage:
+    python -m benchmarks.bench_detail
+    python -m benchmarks.bench_detail --questionnaire MADRS.fr FAST.fr --iterations 5000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from api.dependencies import registry
+from api.scoring import _select
+from api.synthetic import AnswerGenerator
+from questionnaires.detail import FULL, NUMERIC, SUMMARY
+
+LEVELS = (FULL, SUMMARY, NUMERIC)
+
+# Answers and scoring context of one generated submission
+Submission = Tuple[Dict[str, Any], Dict[str, Any]]
+
+
+def ops_per_sec(score: Callable[[Submission], Any], submissions: List[Submission], iterations: int, repeat: int) -> float:
+    """Best-of-repeat throughput, cycling through the submissions."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for index in range(iterations):
+            score(submissions[index % len(submissions)])
+        best = min(best, time.perf_counter() - start)
+    return iterations / best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--questionnaire", nargs="+", help="Only benchmark these questionnaire ids")
+    parser.add_argument("--sets", type=int, default=50, help="Generated answer sets per questionnaire")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best time is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'questionnaire':<22}" + "".join(f"{level + ' ops/s':>16}" for level in LEVELS)
+          + "".join(f"{level + ' x':>12}" for level in LEVELS[1:]))
+    for category in ("auto", "hetero"):
+        for questionnaire_id in registry.questionnaire_ids(category):
+            if args.questionnaire and questionnaire_id not in args.questionnaire:
+                continue
+            adapter = registry.get_adapter(category, questionnaire_id)
+            if not adapter.accepts_detail:
+                continue
+
+            # (answers, context) pairs, with the context the method accepts
+            method = adapter.questionnaire.calculate_score
+            accepted = adapter.score_context
+            submissions = [
+                (submission["answers"], _select(accepted, submission))
+                for submission in AnswerGenerator(adapter.questionnaire, seed=args.seed).valid(args.sets)
+            ]
+
+            throughput = {
+                level: ops_per_sec(
+                    lambda submission, level=level: method(submission[0], detail=level, **submission[1]),
+                    submissions, args.iterations, args.repeat
+                )
+                for level in LEVELS
+            }
+            print(f"{questionnaire_id:<22}" + "".join(f"{throughput[level]:>16.0f}" for level in LEVELS)
+                  + "".join(f"{throughput[level] / throughput[FULL]:>11.1f}x" for level in LEVELS[1:]))
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
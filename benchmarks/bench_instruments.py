@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark: validation, scoring and structure hot paths of every questionnaire
+
+For each questionnaire in the registry, generates realistic answer sets from
+its own question definitions (api.synthetic) and measures, in ops/sec and
+peak bytes allocated per call:
+
+    validate        validate_answers() (through the ScoringAdapter)
+    score           calculate_score() / calculate_screening() (through the ScoringAdapter)
+    structure       get_full_questionnaire()
+    http_structure  GET  /api/{category}/questionnaires/{id}
+    http_validate   POST /api/{category}/questionnaires/{id}/validate
+    http_submit     POST /api/{category}/questionnaires/{id}/submit
+
+Results can be saved as a baseline and later compared against: any operation
+whose throughput dropped, or whose allocations grew, by more than the
+threshold fails the comparison run (exit status 1). Baselines are only
+comparable on the same machine and Python version.
+
+Usage:
+    python -m benchmarks.bench_instruments
+    python -m benchmarks.bench_instruments --questionnaire PSQI.fr MADRS.fr --no-http
+    python -m benchmarks.bench_instruments --save-baseline baseline.json
+    python -m benchmarks.bench_instruments --compare baseline.json --threshold 15
+"""
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi.testclient import TestClient
+
+from api.dependencies import registry
+from api.main import app
+from api.schemas import AnswersRequest
+from api.structures import build_structure
+from api.synthetic import AnswerGenerator
+
+OPERATIONS: Tuple[str, ...] = ("validate", "score", "structure", "http_structure", "http_validate", "http_submit")
+
+
+def operations(
+    category: str,
+    questionnaire_id: str,
+    submissions: List[Dict[str, Any]],
+    client: Optional[TestClient]
+) -> Dict[str, Callable[[Dict[str, Any]], Any]]:
+    """Callables taking one submission, per operation name."""
+    adapter = registry.get_adapter(category, questionnaire_id)
+    questionnaire = adapter.questionnaire
+    url = f"/api/{category}/questionnaires/{questionnaire_id}"
+
+    # Parsed once, as the endpoints receive them
+    requests = {id(submission): AnswersRequest(**submission) for submission in submissions}
+
+    ops: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+        "validate": lambda submission: adapter.validate_submission(requests[id(submission)]),
+        "score": lambda submission: adapter.score_submission(requests[id(submission)]),
+        "structure": lambda submission: build_structure(questionnaire)
+    }
+    if client is not None:
+        ops["http_structure"] = lambda submission: client.get(url)
+        ops["http_validate"] = lambda submission: client.post(f"{url}/validate", json=submission)
+        ops["http_submit"] = lambda submission: client.post(f"{url}/submit", json=submission)
+    return ops
+
+
+def ops_per_sec(operation: Callable[[Dict[str, Any]], Any], submissions: List[Dict[str, Any]], iterations: int, repeat: int) -> float:
+    """Best-of-repeat throughput, cycling through the submissions."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for index in range(iterations):
+            operation(submissions[index % len(submissions)])
+        best = min(best, time.perf_counter() - start)
+    return iterations / best
+
+
+def allocated_bytes(operation: Callable[[Dict[str, Any]], Any], submissions: List[Dict[str, Any]]) -> float:
+    """Mean peak memory allocated during one call (traced with tracemalloc)."""
+    operation(submissions[0])  # Warm caches out of the measurement
+    tracemalloc.start()
+    try:
+        total = 0
+        for submission in submissions:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            operation(submission)
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return total / len(submissions)
+
+
+def compare(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    threshold: float
+) -> List[str]:
+    """
+    Regressions against a baseline.
+
+    Returns:
+        One message per operation slower, or allocating more, than the
+        baseline by more than threshold percent
+    """
+    regressions = []
+    for key, measured in results.items():
+        for name, current in measured.items():
+            reference = baseline.get(key, {}).get(name)
+            if reference is None:
+                continue
+            slowdown = (1 - current["ops_per_sec"] / reference["ops_per_sec"]) * 100
+            if slowdown > threshold:
+                regressions.append(f"{key} {name}: {slowdown:.1f}% fewer ops/sec")
+            if reference["bytes_per_op"]:
+                growth = (current["bytes_per_op"] / reference["bytes_per_op"] - 1) * 100
+                if growth > threshold:
+                    regressions.append(f"{key} {name}: {growth:.1f}% more bytes allocated per call")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--category", choices=["auto", "hetero"], help="Only benchmark one category")
+    parser.add_argument("--questionnaire", nargs="+", help="Only benchmark these questionnaire ids")
+    parser.add_argument("--sets", type=int, default=20, help="Generated answer sets per questionnaire")
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best time is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-http", action="store_true", help="Skip the API endpoint measurements")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+    args = parser.parse_args()
+
+    client = None if args.no_http else TestClient(app)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    print(f"{'questionnaire':<22}{'operation':<16}{'ops/s':>10}{'KiB/op':>10}" + (f"{'vs base':>10}" if baseline else ""))
+    for category in ([args.category] if args.category else ["auto", "hetero"]):
+        for questionnaire_id in registry.questionnaire_ids(category):
+            if args.questionnaire and questionnaire_id not in args.questionnaire:
+                continue
+            key = f"{category}/{questionnaire_id}"
+            generator = AnswerGenerator(registry.get_questionnaire(category, questionnaire_id), seed=args.seed)
+            submissions = list(generator.valid(args.sets))
+
+            results[key] = {}
+            for name, operation in operations(category, questionnaire_id, submissions, client).items():
+                measured = {
+                    "ops_per_sec": ops_per_sec(operation, submissions, args.iterations, args.repeat),
+                    "bytes_per_op": allocated_bytes(operation, submissions)
+                }
+                results[key][name] = measured
+
+                line = f"{questionnaire_id:<22}{name:<16}{measured['ops_per_sec']:>10.0f}{measured['bytes_per_op'] / 1024:>10.1f}"
+                reference = (baseline or {}).get(key, {}).get(name)
+                if reference:
+                    line += f"{(measured['ops_per_sec'] / reference['ops_per_sec'] - 1) * 100:>+9.1f}%"
+                print(line)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "iterations": args.iterations,
+                "results": results
+            }, f, indent=2)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:g}%:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"\nNo regression above {args.threshold:g}%")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Load test: end-to-end HTTP throughput and latency of one server
+
+Boots the API (uvicorn api.main:app) on a local port, or targets a running
+server with --url, and drives a weighted mix of list, get, validate and
+submit requests across every auto and hetero questionnaire with generated
+answer sets, from one or more client processes each running an async HTTP
+client. Reports throughput, p50/p95/p99 latency and error rate per
+operation, and optionally saves the results as JSON to compare commits.
+
+Client processes must not be the bottleneck: give them their own cores, and
+add --processes until throughput stops growing.
+
+Usage:
+    python -m benchmarks.bench_load
+    python -m benchmarks.bench_load --mix list=1,get=2,validate=2,submit=5 --concurrency 64 --duration 30
+    python -m benchmarks.bench_load --workers 4 --processes 4 --output results.json
+    python -m benchmarks.bench_load --compare results.json
+    python -m benchmarks.bench_load --url http://staging:8000
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from api.synthetic import AnswerGenerator
+from benchmarks.bench_workers import ROOT, free_port
+
+OPERATIONS: Tuple[str, ...] = ("list", "get", "validate", "submit")
+
+DEFAULT_MIX = "list=1,get=2,validate=3,submit=4"
+
+# One request: (operation, method, path, JSON body)
+Request = Tuple[str, str, str, Optional[Dict[str, Any]]]
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse "operation=weight,..." into operation -> weight."""
+    weights: Dict[str, float] = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Unknown operation '{name}' (expected one of {', '.join(OPERATIONS)})")
+        weights[name] = float(weight or 1)
+    if not any(weights.values()):
+        raise argparse.ArgumentTypeError("At least one operation needs a positive weight")
+    return weights
+
+
+def build_requests(categories: List[str], sets: int, seed: int) -> Dict[str, List[Request]]:
+    """Requests per operation, over every questionnaire of the categories."""
+    from api.dependencies import registry
+
+    requests: Dict[str, List[Request]] = {name: [] for name in OPERATIONS}
+    for category in categories:
+        requests["list"].append(("list", "GET", f"/api/{category}/questionnaires", None))
+        for questionnaire_id in registry.questionnaire_ids(category):
+            url = f"/api/{category}/questionnaires/{questionnaire_id}"
+            requests["get"].append(("get", "GET", url, None))
+            generator = AnswerGenerator(registry.get_questionnaire(category, questionnaire_id), seed=seed)
+            for submission in generator.valid(sets):
+                requests["validate"].append(("validate", "POST", f"{url}/validate", submission))
+                requests["submit"].append(("submit", "POST", f"{url}/submit", submission))
+    return requests
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    """Start uvicorn with api.main:app and wait until it answers /health."""
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "api.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning", "--no-access-log"
+        ],
+        cwd=ROOT,
+        env=dict(os.environ, QUESTIONNAIRES_PRELOAD_QUESTIONNAIRES="1"),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/health")
+            if connection.getresponse().status == 200:
+                # Give every worker time to boot
+                time.sleep(1 + workers * 0.2)
+                return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("Server did not start")
+
+
+async def drive(
+    url: str,
+    requests: Dict[str, List[Request]],
+    weights: Dict[str, float],
+    concurrency: int,
+    warmup: float,
+    duration: float,
+    seed: int
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Send requests from concurrent tasks over keep-alive connections.
+
+    Returns:
+        Operation -> latencies (seconds) and error count, for requests
+        completed after the warm-up
+    """
+    names = [name for name in weights if weights[name] and requests[name]]
+    name_weights = [weights[name] for name in names]
+    samples: Dict[str, Dict[str, Any]] = {name: {"latencies": [], "errors": 0} for name in names}
+    loop = asyncio.get_running_loop()
+    measure_from = loop.time() + warmup
+    deadline = measure_from + duration
+
+    async def user(rng: random.Random) -> None:
+        while loop.time() < deadline:
+            name = rng.choices(names, weights=name_weights)[0]
+            _, method, path, body = rng.choice(requests[name])
+            start = loop.time()
+            try:
+                response = await client.request(method, path, json=body)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            end = loop.time()
+            if start >= measure_from:
+                samples[name]["latencies"].append(end - start)
+                if failed:
+                    samples[name]["errors"] += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        await asyncio.gather(*(user(random.Random(seed * 1000 + index)) for index in range(concurrency)))
+    return samples
+
+
+def client_process(
+    url: str,
+    requests: Dict[str, List[Request]],
+    weights: Dict[str, float],
+    concurrency: int,
+    warmup: float,
+    duration: float,
+    seed: int,
+    results: "multiprocessing.Queue[Dict[str, Dict[str, Any]]]"
+) -> None:
+    """Run one async client in its own process and report its samples."""
+    results.put(asyncio.run(drive(url, requests, weights, concurrency, warmup, duration, seed)))
+
+
+def percentile(ordered: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted values."""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+
+def summarize(latencies: List[float], errors: int, duration: float) -> Dict[str, Any]:
+    """Throughput, latency percentiles (ms) and error rate of one operation."""
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "requests": count,
+        "requests_per_sec": count / duration,
+        "p50_ms": percentile(ordered, 0.50) * 1e3 if count else None,
+        "p95_ms": percentile(ordered, 0.95) * 1e3 if count else None,
+        "p99_ms": percentile(ordered, 0.99) * 1e3 if count else None,
+        "error_rate": errors / count if count else 0.0
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Current commit of the working tree (None outside a git checkout)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="Target a running server instead of starting one")
+    parser.add_argument("--workers", type=int, default=1, help="Server worker processes (started server only)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"Operation weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--category", choices=["auto", "hetero"], help="Only use one category")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent requests per client process")
+    parser.add_argument("--processes", type=int, default=1, help="Client processes")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Seconds of load before measuring")
+    parser.add_argument("--sets", type=int, default=10, help="Generated answer sets per questionnaire")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", metavar="PATH", help="Save the results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="Show changes against saved results")
+    args = parser.parse_args()
+
+    requests = build_requests([args.category] if args.category else ["auto", "hetero"], args.sets, args.seed)
+
+    server = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        server = start_server(args.workers, port)
+        url = f"http://127.0.0.1:{port}"
+
+    try:
+        queue: "multiprocessing.Queue[Dict[str, Dict[str, Any]]]" = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=client_process,
+                args=(url, requests, args.mix, args.concurrency, args.warmup, args.duration, args.seed + index, queue)
+            )
+            for index in range(args.processes)
+        ]
+        for process in processes:
+            process.start()
+        samples = [queue.get() for _ in processes]
+        for process in processes:
+            process.join()
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    results: Dict[str, Dict[str, Any]] = {}
+    everything: List[float] = []
+    total_errors = 0
+    for name in OPERATIONS:
+        latencies = [latency for sample in samples for latency in sample.get(name, {}).get("latencies", [])]
+        errors = sum(sample.get(name, {}).get("errors", 0) for sample in samples)
+        if latencies:
+            results[name] = summarize(latencies, errors, args.duration)
+            everything.extend(latencies)
+            total_errors += errors
+    results["total"] = summarize(everything, total_errors, args.duration)
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+
+    header = f"{'operation':<10}{'requests':>10}{'req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>9}"
+    print(header + (f"{'vs req/s':>10}{'vs p99':>9}" if previous else ""))
+    for name, summary in results.items():
+        line = (
+            f"{name:<10}{summary['requests']:>10}{summary['requests_per_sec']:>10.0f}"
+            f"{summary['p50_ms'] or 0:>9.2f}{summary['p95_ms'] or 0:>9.2f}{summary['p99_ms'] or 0:>9.2f}"
+            f"{summary['error_rate']:>9.2%}"
+        )
+        reference = (previous or {}).get("results", {}).get(name)
+        if reference and reference["requests"] and summary["requests"]:
+            line += (
+                f"{(summary['requests_per_sec'] / reference['requests_per_sec'] - 1) * 100:>+9.1f}%"
+                f"{(summary['p99_ms'] / reference['p99_ms'] - 1) * 100:>+8.1f}%"
+            )
+        print(line)
+    if previous:
+        print(f"\nCompared with {previous.get('commit') or 'unknown commit'} ({previous.get('timestamp')})")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "commit": git_commit(),
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "config": {
+                    "url": args.url,
+                    "workers": None if args.url else args.workers,
+                    "mix": args.mix,
+                    "category": args.category,
+                    "concurrency": args.concurrency,
+                    "processes": args.processes,
+                    "duration": args.duration,
+                    "warmup": args.warmup
+                },
+                "results": results
+            }, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized batch scoring against per-respondent calculate_score()
+
+For every questionnaire exposing score_batch() (the instruments declared
+through questionnaires.engine, EQ-5D-5L and PSQI), generates realistic answer sets from its own
+question definitions (api.synthetic) and times, for the same respondents:
+
+    loop    calculate_score() called once per answer set
+    batch   score_batch() on the answers as columns (one array per item)
+
+Both are scoring only: the columns are built once, before timing, as a
+research pipeline would hold them. Requires NumPy (the "batch" extra).
+
+Usage:
+    python -m benchmarks.bench_score_batch
+    python -m benchmarks.bench_score_batch --respondents 50000 --questionnaire CTQ.fr
+    python -m benchmarks.bench_score_batch --min-speedup 10
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from api.dependencies import registry
+from api.synthetic import AnswerGenerator
+
+
+def best_time(function: Callable[[], Any], repeat: int) -> float:
+    """Best-of-repeat wall time of one call, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def columns(questionnaire: Any, answer_sets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Answer sets as one array per scored item (integers, or strings for PSQI times)."""
+    # Engine-based scales list their items in SCALE; others (EQ-5D-5L, PSQI) in ITEMS
+    items = questionnaire.SCALE.items if hasattr(questionnaire, "SCALE") else questionnaire.ITEMS
+    return {item: np.asarray([answers[item] for answers in answer_sets]) for item in items}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--questionnaire", nargs="+", help="Only benchmark these questionnaire ids")
+    parser.add_argument("--respondents", type=int, default=10000, help="Answer sets scored per questionnaire")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best time is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-speedup", type=float, help="Fail (exit status 1) below this batch/loop speedup")
+    args = parser.parse_args()
+
+    print(f"{'questionnaire':<22}{'respondents':>12}{'loop ms':>11}{'batch ms':>11}{'speedup':>10}")
+    slow = []
+    for category in ("auto", "hetero"):
+        for questionnaire_id in registry.questionnaire_ids(category):
+            questionnaire = registry.get_questionnaire(category, questionnaire_id)
+            if not hasattr(questionnaire, "score_batch"):
+                continue
+            if args.questionnaire and questionnaire_id not in args.questionnaire:
+                continue
+
+            generator = AnswerGenerator(questionnaire, seed=args.seed)
+            answer_sets = [submission["answers"] for submission in generator.valid(args.respondents)]
+            data = columns(questionnaire, answer_sets)
+
+            loop = best_time(lambda: [questionnaire.calculate_score(answers) for answers in answer_sets], args.repeat)
+            batch = best_time(lambda: questionnaire.score_batch(data), args.repeat)
+            speedup = loop / batch
+            print(f"{questionnaire_id:<22}{len(answer_sets):>12}{loop * 1e3:>11.1f}{batch * 1e3:>11.2f}{speedup:>9.0f}x")
+            if args.min_speedup is not None and speedup < args.min_speedup:
+                slow.append(f"{questionnaire_id}: {speedup:.1f}x")
+
+    if slow:
+        print(f"\n{len(slow)} questionnaire(s) below {args.min_speedup:g}x: {', '.join(slow)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
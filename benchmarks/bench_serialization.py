@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-request serialization cost of submit responses
+
+Compares the default path (ScoreResponse model, FastAPI response validation
+and jsonable encoding, then json.dumps) with the fast response mode
+(QUESTIONNAIRES_FAST_RESPONSES=1: score data encoded once by fast_dumps) for
+the largest score payloads. Scoring itself is excluded: each questionnaire is
+scored once and only the response serialization is timed.
+
+Usage:
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --iterations 5000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, Tuple
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from api.dependencies import registry
+from api.encoding import FAST_ENCODER, FastJSONResponse, dumps
+from api.main import app
+from api.schemas import ScoreResponse
+
+# (category, questionnaire_id, context) with the largest interpretations
+SCENARIOS: List[Tuple[str, str, Dict[str, Any]]] = [
+    ("hetero", "CGI.fr", {"visit_type": "followup"}),
+    ("hetero", "MADRS.fr", {"baseline_score": 40}),
+    ("hetero", "EtatPatient.fr", {}),
+]
+
+
+def build_answers(questionnaire: Any) -> Dict[str, Any]:
+    """Answer every question with its highest option (longest interpretations)."""
+    answers = {}
+    for question in questionnaire.get_questions():
+        options = question.get("options") or []
+        codes = [option.get("code", option.get("value")) for option in options]
+        if codes:
+            answers[question["id"]] = max(codes)
+    return answers
+
+
+async def time_default(response_field: Any, questionnaire_id: str, score_data: Dict[str, Any], iterations: int) -> float:
+    """Time ScoreResponse + FastAPI response serialization + JSONResponse rendering."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        content = await serialize_response(
+            field=response_field,
+            response_content=ScoreResponse(questionnaire_id=questionnaire_id, score_data=score_data),
+            is_coroutine=True
+        )
+        JSONResponse(content)
+    return time.perf_counter() - start
+
+
+def time_fast(questionnaire_id: str, score_data: Dict[str, Any], iterations: int) -> float:
+    """Time a single FastJSONResponse encoding of the same content."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        FastJSONResponse({"questionnaire_id": questionnaire_id, "score_data": score_data, "validation": None})
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000, help="Responses serialized per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best time is kept)")
+    args = parser.parse_args()
+
+    print(f"fast encoder: {FAST_ENCODER}")
+    print(f"{'questionnaire':<16}{'bytes':>8}{'default µs':>12}{'fast µs':>10}{'speedup':>10}")
+    loop = asyncio.new_event_loop()
+    try:
+        for category, questionnaire_id, context in SCENARIOS:
+            adapter = registry.get_adapter(category, questionnaire_id)
+            score_data = adapter.score(build_answers(adapter.questionnaire), **context)
+
+            route = next(
+                route for route in app.routes
+                if isinstance(route, APIRoute) and route.name == f"submit_{category}_questionnaire_answers"
+            )
+            size = len(dumps({"questionnaire_id": questionnaire_id, "score_data": score_data, "validation": None}))
+
+            default = min(
+                loop.run_until_complete(time_default(route.response_field, questionnaire_id, score_data, args.iterations))
+                for _ in range(args.repeat)
+            )
+            fast = min(time_fast(questionnaire_id, score_data, args.iterations) for _ in range(args.repeat))
+
+            default_us = default / args.iterations * 1e6
+            fast_us = fast / args.iterations * 1e6
+            print(f"{questionnaire_id:<16}{size:>8}{default_us:>12.1f}{fast_us:>10.1f}{default / fast:>9.1f}x")
+    finally:
+        loop.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
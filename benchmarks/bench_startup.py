@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: application startup with lazy vs preloaded questionnaires
+
+Each measurement runs in a fresh interpreter so that nothing is already
+imported. It reports the time to import the application (which builds the
+registry), the latency of the first submit for one questionnaire, the number
+of questionnaire modules imported and the peak resident memory, with
+QUESTIONNAIRES_PRELOAD_QUESTIONNAIRES off (lazy, the default) and on (warm).
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 5 --questionnaire auto/PSQI.fr
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict
+
+# Runs in the child interpreter; prints one JSON line of measurements
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+from api.main import app
+imported = time.perf_counter() - start
+
+from fastapi.testclient import TestClient
+category, questionnaire_id = sys.argv[1].split("/", 1)
+client = TestClient(app)
+start = time.perf_counter()
+client.post(f"/api/{category}/questionnaires/{questionnaire_id}/submit", json={"answers": {}})
+first_submit = time.perf_counter() - start
+
+print(json.dumps({
+    "import_ms": imported * 1e3,
+    "first_submit_ms": first_submit * 1e3,
+    "modules": sum(1 for name in sys.modules if name.startswith("questionnaires.")),
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+}))
+"""
+
+
+def run_probe(preload: bool, questionnaire: str) -> Dict[str, Any]:
+    """Measure one cold start in a child interpreter."""
+    env = dict(os.environ, QUESTIONNAIRES_PRELOAD_QUESTIONNAIRES="1" if preload else "0")
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE, questionnaire],
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Cold starts per mode (best time is kept)")
+    parser.add_argument("--questionnaire", default="auto/QIDS-SR16.fr", help="category/id submitted first")
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'import ms':>11}{'1st submit ms':>15}{'modules':>9}{'max RSS MB':>12}")
+    for mode, preload in (("lazy", False), ("warm", True)):
+        runs = [run_probe(preload, args.questionnaire) for _ in range(args.repeat)]
+        print(
+            f"{mode:<8}"
+            f"{min(run['import_ms'] for run in runs):>11.1f}"
+            f"{min(run['first_submit_ms'] for run in runs):>15.1f}"
+            f"{runs[-1]['modules']:>9}"
+            f"{min(run['max_rss_mb'] for run in runs):>12.1f}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
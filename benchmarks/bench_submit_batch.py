@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: N single submits vs one submit-batch request
+
+Usage:
+    python -m benchmarks.bench_submit_batch
+    python -m benchmarks.bench_submit_batch --records 2000 --repeat 5
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List, Tuple
+
+from fastapi.testclient import TestClient
+
+from api.dependencies import registry
+from api.main import app
+from api.synthetic import AnswerGenerator
+
+# (category, questionnaire_id); answer sets are generated from the questions
+SCENARIOS: List[Tuple[str, str]] = [
+    ("auto", "QIDS-SR16.fr"),
+    ("auto", "STAI-YA.fr"),
+    ("auto", "PRISE-M.fr"),
+    ("hetero", "MADRS.fr"),
+]
+
+
+def time_singles(client: TestClient, url: str, items: List[Dict[str, Any]]) -> float:
+    """Submit every item in its own request; return elapsed seconds."""
+    start = time.perf_counter()
+    for item in items:
+        response = client.post(f"{url}/submit", json=item)
+        assert response.status_code in (200, 400), response.text
+    return time.perf_counter() - start
+
+
+def time_batch(client: TestClient, url: str, items: List[Dict[str, Any]]) -> float:
+    """Submit all items in one submit-batch request; return elapsed seconds."""
+    start = time.perf_counter()
+    response = client.post(f"{url}/submit-batch", json={"items": items})
+    assert response.status_code == 200, response.text
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=500, help="Submissions per scenario")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best time is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    client = TestClient(app)
+
+    print(f"{'questionnaire':<16}{'single µs/rec':>15}{'batch µs/rec':>15}{'speedup':>10}")
+    for category, questionnaire_id in SCENARIOS:
+        generator = AnswerGenerator(registry.get_questionnaire(category, questionnaire_id), seed=args.seed)
+        items = list(generator.valid(args.records))
+        url = f"/api/{category}/questionnaires/{questionnaire_id}"
+
+        single = min(time_singles(client, url, items) for _ in range(args.repeat))
+        batch = min(time_batch(client, url, items) for _ in range(args.repeat))
+
+        single_us = single / args.records * 1e6
+        batch_us = batch / args.records * 1e6
+        print(f"{questionnaire_id:<16}{single_us:>15.1f}{batch_us:>15.1f}{single / batch:>9.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark: submit throughput of the production server by worker count
+
+Starts the production profile (gunicorn -c gunicorn.conf.py api.main:app) on a
+local port with 1, 2, 4, ... workers and drives POST /submit from several
+client processes over keep-alive connections. Throughput should grow nearly
+linearly with the number of workers until the cores are saturated; run it on
+a machine with at least as many free cores as workers plus clients.
+
+Usage:
+    python -m benchmarks.bench_workers
+    python -m benchmarks.bench_workers --workers 1 2 4 8 --clients 16 --duration 10
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PATH = "/api/auto/questionnaires/QIDS-SR16.fr/submit"
+BODY = json.dumps({"answers": {f"q{i}": i % 4 for i in range(1, 17)}}).encode("utf-8")
+
+
+def free_port() -> int:
+    """Pick an unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    """Start the production profile and wait until it answers /health."""
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), QUESTIONNAIRES_BIND=f"127.0.0.1:{port}")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "api.main:app"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/health")
+            if connection.getresponse().status == 200:
+                # Give every worker time to boot
+                time.sleep(1 + workers * 0.2)
+                return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError(f"Server with {workers} workers did not start")
+
+
+def client(port: int, duration: float, results: "multiprocessing.Queue[Tuple[int, int]]") -> None:
+    """Send submits on one keep-alive connection for duration seconds."""
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    headers = {"Content-Type": "application/json"}
+    completed = errors = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        connection.request("POST", PATH, body=BODY, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        if response.status == 200:
+            completed += 1
+        else:
+            errors += 1
+    results.put((completed, errors))
+
+
+def measure(port: int, clients: int, duration: float) -> Tuple[float, int]:
+    """Run the clients concurrently; return requests per second and errors."""
+    results: "multiprocessing.Queue[Tuple[int, int]]" = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=client, args=(port, duration, results))
+        for _ in range(clients)
+    ]
+    for process in processes:
+        process.start()
+    totals: List[Tuple[int, int]] = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return sum(completed for completed, _ in totals) / duration, sum(errors for _, errors in totals)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to compare")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent client processes")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds of load per worker count")
+    args = parser.parse_args()
+
+    print(f"{'workers':>8}{'req/s':>10}{'scaling':>10}{'efficiency':>12}{'errors':>8}")
+    baseline = None
+    for workers in args.workers:
+        port = free_port()
+        server = start_server(workers, port)
+        try:
+            throughput, errors = measure(port, args.clients, args.duration)
+        finally:
+            server.terminate()
+            server.wait()
+
+        if baseline is None:
+            baseline = throughput / workers
+        scaling = throughput / baseline
+        print(f"{workers:>8}{throughput:>10.0f}{scaling:>9.2f}x{scaling / workers:>11.0%}{errors:>8}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
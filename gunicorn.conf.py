@@ -0,0 +1,73 @@
+"""
+Production server profile for the Questionnaires API
+
+Runs several uvicorn workers under gunicorn. The application, and with it the
+questionnaire registry, is imported once in the master process before the
+workers are forked (preload_app), with every questionnaire preloaded and its
+structures pre-rendered, so workers share that memory copy-on-write and
+serve their first request without loading anything.
+
+Usage:
+    gunicorn -c gunicorn.conf.py api.main:app
+
+Environment:
+    WEB_CONCURRENCY: Number of workers (default: one per CPU core available
+        to the process)
+    QUESTIONNAIRES_BIND: Address to listen on (default: 0.0.0.0:8000)
+    QUESTIONNAIRES_GRACEFUL_TIMEOUT: Seconds workers get to finish in-flight
+        requests on reload or shutdown (default: 30)
+    QUESTIONNAIRES_METRICS_DIR: Where workers share their metrics snapshots
+        so /metrics covers every worker (default: a fresh directory per master)
+
+Graceful reload:
+    kill -HUP <master pid>   replaces every worker once in-flight requests
+                             complete; the preloaded application is reused
+    kill -USR2 <master pid>  starts a new master with freshly imported code
+                             (deploy), then kill -TERM the old master
+"""
+
+import gc
+import glob
+import os
+import tempfile
+
+# Load the whole registry in the master, before fork
+os.environ.setdefault("QUESTIONNAIRES_PRELOAD_QUESTIONNAIRES", "1")
+
+# Aggregate /metrics over all workers
+os.environ.setdefault(
+    "QUESTIONNAIRES_METRICS_DIR",
+    os.path.join(tempfile.gettempdir(), f"questionnaires-metrics-{os.getpid()}")
+)
+
+
+def available_cpus() -> int:
+    """CPU cores this process may run on (respects affinity / cpusets)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+bind = os.environ.get("QUESTIONNAIRES_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", available_cpus()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+graceful_timeout = int(os.environ.get("QUESTIONNAIRES_GRACEFUL_TIMEOUT", "30"))
+timeout = 60
+keepalive = 5
+# Access logs are off by default (add --access-logfile - to enable them)
+errorlog = "-"
+
+
+def on_starting(server):
+    """Start every server with empty metrics (drop snapshots of a previous run)."""
+    metrics_dir = os.environ["QUESTIONNAIRES_METRICS_DIR"]
+    for path in glob.glob(os.path.join(metrics_dir, "metrics-*.json")):
+        os.remove(path)
+
+
+def when_ready(server):
+    """Freeze objects loaded by the master so worker GCs do not dirty shared pages."""
+    gc.collect()
+    gc.freeze()
+    server.log.info("Registry preloaded; forking %d workers", server.cfg.workers)
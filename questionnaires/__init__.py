@@ -1,37 +1,8 @@
-# Import all auto questionnaires (self-report)
-from .auto import (
-    QIDSSR16, QIDSError,
-    MDQ, MDQError,
-    ASRM, ASRMError,
-    Epworth, EpworthError,
-    EQ5D5L, EQ5D5LError,
-    Fagerstrom, FagerstromError,
-    MARS, MARSError,
-    MAThyS, MAThySError,
-    PRISEM, PRISEMError,
-    PSQI, PSQIError,
-    STAIYA, STAIYAError,
-    AIMShort, AIMShortError,
-    ALSShort, ALSShortError,
-    AQ12, AQ12Error,
-    ASRS, ASRSError,
-    BIS10, BIS10Error,
-    CSM, CSMError,
-    CTQ, CTQError,
-    CTI, CTIError,
-    WURS25, WURS25Error
-)
+# Questionnaires are re-exported lazily: the auto and hetero packages, and the
+# instrument modules behind them, are only imported when a name is first used.
 
-# Import hetero questionnaires (clinician-rated/heterogeneous)
-from .hetero import (
-    ALDA, ALDAError,
-    CGI, CGIError,
-    EGF, EGFError,
-    EtatPatient, EtatPatientError,
-    FAST, FASTError,
-    MADRS, MADRSError,
-    YMRS, YMRSError
-)
+import importlib
+from typing import Any
 
 __all__ = [
     # Auto questionnaires
@@ -65,3 +36,24 @@ __all__ = [
     "YMRS", "YMRSError"
 ]
 
+
+# Category subpackages, searched in order for an exported name
+_CATEGORIES = ("auto", "hetero")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _CATEGORIES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    for category in _CATEGORIES:
+        package = importlib.import_module(f".{category}", __name__)
+        if name in package.__all__:
+            value = getattr(package, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
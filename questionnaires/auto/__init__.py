@@ -1,44 +1,45 @@
-from .qids import QIDSSR16, QIDSError
-from .mdq import MDQ, MDQError
-from .asrm import ASRM, ASRMError
-from .epworth import Epworth, EpworthError
-from .eq5del import EQ5D5L, EQ5D5LError
-from .fagerstrom import Fagerstrom, FagerstromError
-from .mars import MARS, MARSError
-from .mathys import MAThyS, MAThySError
-from .prise_m import PRISEM, PRISEMError
-from .psqi import PSQI, PSQIError
-from .stai_ya import STAIYA, STAIYAError
-from .aim_short import AIMShort, AIMShortError
-from .als_short import ALSShort, ALSShortError
-from .aq12 import AQ12, AQ12Error
-from .asrs import ASRS, ASRSError
-from .bis10 import BIS10, BIS10Error
-from .csm import CSM, CSMError
-from .ctq import CTQ, CTQError
-from .cti import CTI, CTIError
-from .wurs25 import WURS25, WURS25Error
+# Auto (self-report) questionnaires
+# Instrument modules are imported on first attribute access, so importing one
+# questionnaire does not pay for all of them.
 
-__all__ = [
-    "QIDSSR16", "QIDSError",
-    "MDQ", "MDQError",
-    "ASRM", "ASRMError",
-    "Epworth", "EpworthError",
-    "EQ5D5L", "EQ5D5LError",
-    "Fagerstrom", "FagerstromError",
-    "MARS", "MARSError",
-    "MAThyS", "MAThySError",
-    "PRISEM", "PRISEMError",
-    "PSQI", "PSQIError",
-    "STAIYA", "STAIYAError",
-    "AIMShort", "AIMShortError",
-    "ALSShort", "ALSShortError",
-    "AQ12", "AQ12Error",
-    "ASRS", "ASRSError",
-    "BIS10", "BIS10Error",
-    "CSM", "CSMError",
-    "CTQ", "CTQError",
-    "CTI", "CTIError",
-    "WURS25", "WURS25Error"
-]
+import importlib
+from typing import Any, Dict
 
+# Exported name -> submodule defining it
+_EXPORTS: Dict[str, str] = {
+    "QIDSSR16": ".qids", "QIDSError": ".qids",
+    "MDQ": ".mdq", "MDQError": ".mdq",
+    "ASRM": ".asrm", "ASRMError": ".asrm",
+    "Epworth": ".epworth", "EpworthError": ".epworth",
+    "EQ5D5L": ".eq5del", "EQ5D5LError": ".eq5del",
+    "Fagerstrom": ".fagerstrom", "FagerstromError": ".fagerstrom",
+    "MARS": ".mars", "MARSError": ".mars",
+    "MAThyS": ".mathys", "MAThySError": ".mathys",
+    "PRISEM": ".prise_m", "PRISEMError": ".prise_m",
+    "PSQI": ".psqi", "PSQIError": ".psqi",
+    "STAIYA": ".stai_ya", "STAIYAError": ".stai_ya",
+    "AIMShort": ".aim_short", "AIMShortError": ".aim_short",
+    "ALSShort": ".als_short", "ALSShortError": ".als_short",
+    "AQ12": ".aq12", "AQ12Error": ".aq12",
+    "ASRS": ".asrs", "ASRSError": ".asrs",
+    "BIS10": ".bis10", "BIS10Error": ".bis10",
+    "CSM": ".csm", "CSMError": ".csm",
+    "CTQ": ".ctq", "CTQError": ".ctq",
+    "CTI": ".cti", "CTIError": ".cti",
+    "WURS25": ".wurs25", "WURS25Error": ".wurs25"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,13 +8,15 @@ which assesses emotional reactivity - the intensity with which individuals exper
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from ...engine import Band, BatchScoring, ScaleSpec, compile_spec, item_ids, items_of
+
 
 class AIMShortError(Exception):
     """Custom exception for AIM-short questionnaire errors."""
     pass
 
 
-class AIMShort:
+class AIMShort(BatchScoring):
     """
     AIM-short (Affect Intensity Measure - Short Version)
     
@@ -68,6 +70,27 @@ class AIMShort:
         {"code": 6, "label": "6 – Toujours", "score": 6}
     ]
     
+    # Qualitative categories of the mean score, rounded to the nearest response
+    # (round half to even, as round() does); means are multiples of 0.05
+    CATEGORY_BANDS = (
+        Band(1.0, 1.45, "Très faible (proche de « jamais »)"),
+        Band(1.5, 2.5, "Presque jamais intense"),
+        Band(2.55, 3.45, "Occasionnellement intense"),
+        Band(3.5, 4.5, "Habituellement intense"),
+        Band(4.55, 5.45, "Presque toujours intense"),
+        Band(5.5, 6.0, "Toujours intense")
+    )
+    
+    # Scoring: 20 items (1-6), reverse items recoded 7 - value, mean score
+    SCALE = compile_spec(ScaleSpec(
+        items=item_ids(20),
+        min_value=1,
+        max_value=6,
+        reverse=frozenset(items_of(REVERSE_ITEMS)),
+        bands=CATEGORY_BANDS,
+        total="mean"
+    ))
+    
     def __init__(self):
         """Initialize the AIM-short questionnaire."""
         self.id = "AIM-short.fr"
@@ -158,25 +181,10 @@ class AIMShort:
         Raises:
             AIMShortError: If validation fails critically
         """
-        errors = []
+        # All 20 items present, integers between 1 and 6
+        errors = self.SCALE.errors(answers)
         warnings = []
         
-        # Check all 20 items are present
-        expected_items = [f"q{i}" for i in range(1, 21)]
-        missing = [qid for qid in expected_items if qid not in answers]
-        
-        if missing:
-            errors.append(f"Items manquants: {', '.join(missing)}")
-        
-        # Validate each response value
-        for qid in expected_items:
-            if qid in answers:
-                value = answers[qid]
-                if not isinstance(value, int):
-                    errors.append(f"{qid}: la valeur doit être un entier (reçu: {type(value).__name__})")
-                elif value < 1 or value > 6:
-                    errors.append(f"{qid}: la valeur doit être entre 1 et 6 (reçu: {value})")
-        
         # Check for unusual patterns (all same response)
         if not errors and len(set(answers.values())) == 1:
             warnings.append(
@@ -228,26 +236,14 @@ class AIMShort:
                 f"Validation échouée: {'; '.join(validation['errors'])}"
             )
         
-        # Calculate scores with reverse coding
-        item_scores = {}
-        total = 0
-        
-        for i in range(1, 21):
-            qid = f"q{i}"
-            value = answers[qid]
-            
-            # Apply reverse scoring if needed (7 - value)
-            if i in self.REVERSE_ITEMS:
-                scored_value = 7 - value
-            else:
-                scored_value = value
-            
-            item_scores[qid] = {
-                "raw": value,
-                "scored": scored_value,
-                "reversed": i in self.REVERSE_ITEMS
-            }
-            total += scored_value
+        # Calculate scores with reverse coding (7 - value)
+        values = self.SCALE.values(answers)
+        scored = self.SCALE.score(values)
+        item_scores = {
+            qid: {"raw": value, "scored": scored_value, "reversed": reversed_item}
+            for qid, value, scored_value, reversed_item in zip(self.SCALE.items, values, scored, self.SCALE.reversed)
+        }
+        total = sum(scored)
         
         # Calculate mean score
         mean_score = total / 20.0
@@ -282,19 +278,7 @@ class AIMShort:
         Returns:
             Qualitative category label
         """
-        # Round to nearest integer (clamped to 1-6)
-        rounded = int(round(min(6.0, max(1.0, mean_score))))
-        
-        mapping = {
-            1: "Très faible (proche de « jamais »)",
-            2: "Presque jamais intense",
-            3: "Occasionnellement intense",
-            4: "Habituellement intense",
-            5: "Presque toujours intense",
-            6: "Toujours intense"
-        }
-        
-        return mapping.get(rounded, "Interprétation continue")
+        return self.SCALE.band(mean_score, "Interprétation continue")
     
     def _get_severity(self, mean_score: float) -> str:
         """
@@ -8,13 +8,15 @@ which assesses emotional lability - rapid shifts in mood states.
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from ...engine import BatchScoring, Group, ScaleSpec, compile_spec, item_ids, items_of
+
 
 class ALSShortError(Exception):
     """Custom exception for ALS-short questionnaire errors."""
     pass
 
 
-class ALSShort:
+class ALSShort(BatchScoring):
     """
     ALS-short (Affective Lability Scale - Short Version)
     
@@ -67,6 +69,20 @@ class ALSShort:
         {"code": 0, "label": "D – Absolument pas caractéristique de moi, ne me décrit pas du tout", "score": 0}
     ]
     
+    # Scoring: 18 items (0-3), subscale and total scores are item means
+    SCALE = compile_spec(ScaleSpec(
+        items=item_ids(18),
+        min_value=0,
+        max_value=3,
+        groups=(
+            Group("anxiety_depression", items_of(ANXIETY_DEPRESSION_ITEMS), "mean"),
+            Group("depression_elation", items_of(DEPRESSION_ELATION_ITEMS), "mean"),
+            Group("anger", items_of(ANGER_ITEMS), "mean")
+        ),
+        total="mean",
+        range_hint=" (A=3,B=2,C=1,D=0)"
+    ))
+    
     def __init__(self):
         """Initialize the ALS-short questionnaire."""
         self.id = "ALS-short.fr"
@@ -166,25 +182,10 @@ class ALSShort:
         Raises:
             ALSShortError: If validation fails critically
         """
-        errors = []
+        # All 18 items present, integers between 0 and 3
+        errors = self.SCALE.errors(answers)
         warnings = []
         
-        # Check all 18 items are present
-        expected_items = [f"q{i}" for i in range(1, 19)]
-        missing = [qid for qid in expected_items if qid not in answers]
-        
-        if missing:
-            errors.append(f"Items manquants: {', '.join(missing)}")
-        
-        # Validate each response value
-        for qid in expected_items:
-            if qid in answers:
-                value = answers[qid]
-                if not isinstance(value, int):
-                    errors.append(f"{qid}: la valeur doit être un entier (reçu: {type(value).__name__})")
-                elif value < 0 or value > 3:
-                    errors.append(f"{qid}: la valeur doit être entre 0 et 3 (A=3,B=2,C=1,D=0) (reçu: {value})")
-        
         # Check for unusual patterns
         if not errors and len(set(answers.values())) == 1:
             warnings.append(
@@ -229,34 +230,24 @@ class ALSShort:
                 f"Validation échouée: {'; '.join(validation['errors'])}"
             )
         
-        # Calculate subscale scores
-        anxiety_depression_score = self._calculate_subscale_mean(
-            answers, self.ANXIETY_DEPRESSION_ITEMS
-        )
-        depression_elation_score = self._calculate_subscale_mean(
-            answers, self.DEPRESSION_ELATION_ITEMS
-        )
-        anger_score = self._calculate_subscale_mean(
-            answers, self.ANGER_ITEMS
-        )
+        # Calculate subscale scores (item means)
+        values = self.SCALE.values(answers)
+        subscales = self.SCALE.group_scores(values)
+        anxiety_depression_score = subscales["anxiety_depression"]
+        depression_elation_score = subscales["depression_elation"]
+        anger_score = subscales["anger"]
         
         # Calculate total score (mean of all 18 items)
-        total_score = sum(answers[f"q{i}"] for i in range(1, 19)) / 18.0
+        total_score = sum(values) / 18.0
         
         # Collect item scores
-        item_scores = {}
-        for i in range(1, 19):
-            qid = f"q{i}"
-            item_scores[qid] = {
-                "score": answers[qid],
-                "subscales": []
+        item_scores = {
+            qid: {
+                "score": value,
+                "subscales": [group.name for group in self.SCALE.spec.groups if qid in group.items]
             }
-            if i in self.ANXIETY_DEPRESSION_ITEMS:
-                item_scores[qid]["subscales"].append("anxiety_depression")
-            if i in self.DEPRESSION_ELATION_ITEMS:
-                item_scores[qid]["subscales"].append("depression_elation")
-            if i in self.ANGER_ITEMS:
-                item_scores[qid]["subscales"].append("anger")
+            for qid, value in zip(self.SCALE.items, values)
+        }
         
         # Generate interpretation
         interpretation = self._generate_interpretation(
@@ -280,19 +271,6 @@ class ALSShort:
             "calculation_date": datetime.utcnow().isoformat() + "Z"
         }
     
-    def _calculate_subscale_mean(self, answers: Dict[str, int], items: List[int]) -> float:
-        """
-        Calculate mean score for a subscale.
-        
-        Args:
-            answers: Dictionary of answers
-            items: List of item numbers (1-indexed)
-        
-        Returns:
-            Mean score (0.0-3.0)
-        """
-        return sum(answers[f"q{i}"] for i in items) / float(len(items))
-    
     def _generate_interpretation(
         self,
         total_score: float,
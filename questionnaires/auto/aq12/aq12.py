@@ -8,13 +8,15 @@ which assesses four dimensions of aggression: Physical, Verbal, Anger, and Hosti
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from ...engine import BatchScoring, Group, ScaleSpec, compile_spec, item_ids, items_of
+
 
 class AQ12Error(Exception):
     """Custom exception for AQ-12 questionnaire errors."""
     pass
 
 
-class AQ12:
+class AQ12(BatchScoring):
     """
     AQ-12 (Aggression Questionnaire - 12 items)
     
@@ -63,6 +65,22 @@ class AQ12:
         {"code": 6, "label": "6 – Tout à fait moi", "score": 6}
     ]
     
+    # Scoring: 12 items (1-6), four subscales of three items
+    SCALE = compile_spec(ScaleSpec(
+        items=item_ids(12),
+        min_value=1,
+        max_value=6,
+        groups=(
+            Group("physical_aggression", items_of(PHYSICAL_AGGRESSION_ITEMS)),
+            Group("verbal_aggression", items_of(VERBAL_AGGRESSION_ITEMS)),
+            Group("anger", items_of(ANGER_ITEMS)),
+            Group("hostility", items_of(HOSTILITY_ITEMS))
+        )
+    ))
+    
+    # Subscale of each item
+    ITEM_SUBSCALES = {item: group.name for group in SCALE.spec.groups for item in group.items}
+    
     def __init__(self):
         """Initialize the AQ-12 questionnaire."""
         self.id = "AQ-12.fr"
@@ -166,25 +184,10 @@ class AQ12:
         Raises:
             AQ12Error: If validation fails critically
         """
-        errors = []
+        # All 12 items present, integers between 1 and 6
+        errors = self.SCALE.errors(answers)
         warnings = []
         
-        # Check all 12 items are present
-        expected_items = [f"q{i}" for i in range(1, 13)]
-        missing = [qid for qid in expected_items if qid not in answers]
-        
-        if missing:
-            errors.append(f"Items manquants: {', '.join(missing)}")
-        
-        # Validate each response value
-        for qid in expected_items:
-            if qid in answers:
-                value = answers[qid]
-                if not isinstance(value, int):
-                    errors.append(f"{qid}: la valeur doit être un entier (reçu: {type(value).__name__})")
-                elif value < 1 or value > 6:
-                    errors.append(f"{qid}: la valeur doit être entre 1 et 6 (reçu: {value})")
-        
         # Check for unusual patterns
         if not errors and len(set(answers.values())) == 1:
             warnings.append(
@@ -236,50 +239,28 @@ class AQ12:
                 f"Validation échouée: {'; '.join(validation['errors'])}"
             )
         
-        # Calculate subscale scores (sums)
-        physical_score = sum(answers[f"q{i}"] for i in self.PHYSICAL_AGGRESSION_ITEMS)
-        verbal_score = sum(answers[f"q{i}"] for i in self.VERBAL_AGGRESSION_ITEMS)
-        anger_score = sum(answers[f"q{i}"] for i in self.ANGER_ITEMS)
-        hostility_score = sum(answers[f"q{i}"] for i in self.HOSTILITY_ITEMS)
-        
-        # Calculate total score (sum of all 12 items)
-        total_score = sum(answers[f"q{i}"] for i in range(1, 13))
+        # Calculate subscale scores (sums) and total score (sum of all 12 items)
+        values = self.SCALE.values(answers)
+        subscale_scores = self.SCALE.group_scores(values)
+        total_score = sum(values)
         
         # Collect item scores
-        item_scores = {}
-        for i in range(1, 13):
-            qid = f"q{i}"
-            subscale = None
-            if i in self.PHYSICAL_AGGRESSION_ITEMS:
-                subscale = "physical_aggression"
-            elif i in self.VERBAL_AGGRESSION_ITEMS:
-                subscale = "verbal_aggression"
-            elif i in self.ANGER_ITEMS:
-                subscale = "anger"
-            elif i in self.HOSTILITY_ITEMS:
-                subscale = "hostility"
-            
-            item_scores[qid] = {
-                "score": answers[qid],
-                "subscale": subscale
-            }
+        item_scores = {
+            qid: {"score": value, "subscale": self.ITEM_SUBSCALES.get(qid)}
+            for qid, value in zip(self.SCALE.items, values)
+        }
         
         # Generate interpretation
         interpretation = self._generate_interpretation(
             total_score,
-            physical_score,
-            verbal_score,
-            anger_score,
-            hostility_score
+            subscale_scores["physical_aggression"],
+            subscale_scores["verbal_aggression"],
+            subscale_scores["anger"],
+            subscale_scores["hostility"]
         )
         
         return {
-            "subscale_scores": {
-                "physical_aggression": physical_score,
-                "verbal_aggression": verbal_score,
-                "anger": anger_score,
-                "hostility": hostility_score
-            },
+            "subscale_scores": subscale_scores,
             "total_score": total_score,
             "score_range": [12, 72],
             "subscale_ranges": {
@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pydantic import BaseModel
 
+from ...engine import BatchScoring, Group, ScaleSpec, compile_spec, items_of
+
 
 class BIS10Error(ValueError):
     """Custom exception for BIS-10 validation errors"""
@@ -69,7 +71,7 @@ class ValidationResult(BaseModel):
     warnings: List[str] = []
 
 
-class BIS10:
+class BIS10(BatchScoring):
     """
     BIS-10 Short Version (12 items) Questionnaire Class
     
@@ -127,6 +129,20 @@ class BIS10:
         {"code": 4, "label": "Toujours ou presque toujours"}
     ]
     
+    # Scoring: 12 items (1-4), cognitive items reverse-scored (5 - value),
+    # subscale scores are item means and the overall score is their mean
+    SCALE = compile_spec(ScaleSpec(
+        items=items_of(sorted(ITEM_TEXTS)),
+        min_value=1,
+        max_value=4,
+        reverse=frozenset(items_of(COGNITIVE_ITEMS)),
+        groups=(
+            Group("cognitive", items_of(COGNITIVE_ITEMS), "mean"),
+            Group("behavioral", items_of(BEHAVIORAL_ITEMS), "mean")
+        ),
+        total="group_mean"
+    ))
+    
     def __init__(self):
         """Initialize the BIS-10 questionnaire"""
         self._sections = self._build_sections()
@@ -254,7 +270,7 @@ class BIS10:
         warnings = []
         
         # Check for missing required questions
-        expected_keys = [f"q{i}" for i in sorted(self.ITEM_TEXTS.keys())]
+        expected_keys = self.SCALE.items
         missing = [k for k in expected_keys if k not in answers]
         if missing:
             errors.append(f"Items manquants: {', '.join(missing)}")
@@ -276,7 +292,7 @@ class BIS10:
         # Clinical warnings (only if no errors)
         if not errors:
             # Check if all values are identical
-            values = [answers[k] for k in expected_keys]
+            values = self.SCALE.values(answers)
             if len(set(values)) == 1:
                 warnings.append(
                     "Toutes les réponses sont identiques. Veuillez vérifier que le patient "
@@ -316,14 +332,11 @@ class BIS10:
         if not validation.valid:
             raise BIS10Error("; ".join(validation.errors))
         
-        # Calculate cognitive impulsivity mean (reverse scored)
-        # Cognitive items: 4=rarely → 1, 1=always → 4 (so: 5 - value)
-        cognitive_scores = [5 - answers[f"q{i}"] for i in self.COGNITIVE_ITEMS]
-        cognitive_mean = sum(cognitive_scores) / len(cognitive_scores)
-        
-        # Calculate behavioral impulsivity mean (normal scoring)
-        behavioral_scores = [answers[f"q{i}"] for i in self.BEHAVIORAL_ITEMS]
-        behavioral_mean = sum(behavioral_scores) / len(behavioral_scores)
+        # Subscale means, cognitive items reverse scored (validation accepted int() of each value)
+        values = [int(value) for value in self.SCALE.values(answers)]
+        subscale_means = self.SCALE.group_scores(self.SCALE.score(values))
+        cognitive_mean = subscale_means["cognitive"]
+        behavioral_mean = subscale_means["behavioral"]
         
         # Calculate overall impulsivity (mean of the two means)
         overall_mean = (cognitive_mean + behavioral_mean) / 2
@@ -8,13 +8,15 @@ circadian flexibility/rigidity and languid/vigorous tendencies.
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from ...engine import BatchScoring, Group, ScaleSpec, compile_spec, item_ids, items_of
+
 
 class CTIError(Exception):
     """Custom exception for CTI questionnaire errors."""
     pass
 
 
-class CTI:
+class CTI(BatchScoring):
     """
     CTI (Circadian Type Inventory)
     
@@ -61,6 +63,17 @@ class CTI:
         {"code": 5, "label": "5 – Presque toujours", "score": 5}
     ]
     
+    # Scoring: 11 items (1-5), two subscales (simple sums, no reverse coding)
+    SCALE = compile_spec(ScaleSpec(
+        items=item_ids(11),
+        min_value=1,
+        max_value=5,
+        groups=(
+            Group("flexibility", items_of(FLEXIBILITY_ITEMS)),
+            Group("languid", items_of(LANGUID_ITEMS))
+        )
+    ))
+    
     def __init__(self):
         """Initialize the CTI questionnaire."""
         self.id = "CTI.fr"
@@ -158,25 +171,10 @@ class CTI:
         Raises:
             CTIError: If validation fails critically
         """
-        errors = []
+        # All 11 items present, integers between 1 and 5
+        errors = self.SCALE.errors(answers)
         warnings = []
         
-        # Check all 11 items are present
-        expected_items = [f"q{i}" for i in range(1, 12)]
-        missing = [qid for qid in expected_items if qid not in answers]
-        
-        if missing:
-            errors.append(f"Items manquants: {', '.join(missing)}")
-        
-        # Validate each response value
-        for qid in expected_items:
-            if qid in answers:
-                value = answers[qid]
-                if not isinstance(value, int):
-                    errors.append(f"{qid}: la valeur doit être un entier (reçu: {type(value).__name__})")
-                elif value < 1 or value > 5:
-                    errors.append(f"{qid}: la valeur doit être entre 1 et 5 (reçu: {value})")
-        
         # Check for unusual patterns
         if not errors and len(set(answers.values())) == 1:
             warnings.append(
@@ -215,20 +213,20 @@ class CTI:
             )
         
         # Calculate subscale scores (simple sums, no reverse coding)
-        flexibility_score = sum(answers[f"q{i}"] for i in self.FLEXIBILITY_ITEMS)
-        languid_score = sum(answers[f"q{i}"] for i in self.LANGUID_ITEMS)
+        values = self.SCALE.values(answers)
+        subscales = self.SCALE.group_scores(values)
+        flexibility_score = subscales["flexibility"]
+        languid_score = subscales["languid"]
         
         # Determine circadian profile
         circadian_profile = self._get_profile(flexibility_score, languid_score)
         
         # Collect item scores
-        item_scores = {}
-        for i in range(1, 12):
-            qid = f"q{i}"
-            item_scores[qid] = {
-                "score": answers[qid],
-                "subscale": "flexibility" if i in self.FLEXIBILITY_ITEMS else "languid"
-            }
+        flexibility_items = self.SCALE.spec.groups[0].items
+        item_scores = {
+            qid: {"score": value, "subscale": "flexibility" if qid in flexibility_items else "languid"}
+            for qid, value in zip(self.SCALE.items, values)
+        }
         
         # Generate interpretation
         interpretation = self._generate_interpretation(
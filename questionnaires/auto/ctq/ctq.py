@@ -9,13 +9,15 @@ Sexual Abuse, Emotional Neglect, and Physical Neglect.
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+from ...engine import BatchScoring, Group, ScaleSpec, bands_of, compile_spec, item_ids, items_of
+
 
 class CTQError(Exception):
     """Custom exception for CTQ questionnaire errors."""
     pass
 
 
-class CTQ:
+class CTQ(BatchScoring):
     """
     CTQ (Childhood Trauma Questionnaire)
     
@@ -128,6 +130,28 @@ class CTQ:
         {"code": 5, "label": "Très souvent", "score": 5}
     ]
     
+    # Scoring: 28 items (1-5), reverse items recoded 6 - value, five clinical subscales with their bands
+    SCALE = compile_spec(ScaleSpec(
+        items=item_ids(28),
+        min_value=1,
+        max_value=5,
+        reverse=frozenset(items_of(REVERSE_ITEMS)),
+        groups=(
+            Group("emotional_abuse", items_of(EMOTIONAL_ABUSE_ITEMS), bands=bands_of(CUTOFFS["emotional_abuse"])),
+            Group("physical_abuse", items_of(PHYSICAL_ABUSE_ITEMS), bands=bands_of(CUTOFFS["physical_abuse"])),
+            Group("sexual_abuse", items_of(SEXUAL_ABUSE_ITEMS), bands=bands_of(CUTOFFS["sexual_abuse"])),
+            Group("emotional_neglect", items_of(EMOTIONAL_NEGLECT_ITEMS), bands=bands_of(CUTOFFS["emotional_neglect"])),
+            Group("physical_neglect", items_of(PHYSICAL_NEGLECT_ITEMS), bands=bands_of(CUTOFFS["physical_neglect"]))
+        ),
+        total="groups"
+    ))
+    
+    # Subscale of each item (denial items included)
+    ITEM_SUBSCALES = {
+        **{item: "denial" for item in items_of(DENIAL_ITEMS)},
+        **{item: group.name for group in SCALE.spec.groups for item in group.items}
+    }
+    
     def __init__(self):
         """Initialize the CTQ questionnaire."""
         self.id = "CTQ.fr"
@@ -239,25 +263,10 @@ class CTQ:
         Raises:
             CTQError: If validation fails critically
         """
-        errors = []
+        # All 28 items present, integers between 1 and 5
+        errors = self.SCALE.errors(answers)
         warnings = []
         
-        # Check all 28 items are present
-        expected_items = [f"q{i}" for i in range(1, 29)]
-        missing = [qid for qid in expected_items if qid not in answers]
-        
-        if missing:
-            errors.append(f"Items manquants: {', '.join(missing)}")
-        
-        # Validate each response value
-        for qid in expected_items:
-            if qid in answers:
-                value = answers[qid]
-                if not isinstance(value, int):
-                    errors.append(f"{qid}: la valeur doit être un entier (reçu: {type(value).__name__})")
-                elif value < 1 or value > 5:
-                    errors.append(f"{qid}: la valeur doit être entre 1 et 5 (reçu: {value})")
-        
         # Check for high denial/minimization
         if not errors:
             denial_count = sum(1 for i in self.DENIAL_ITEMS if answers.get(f"q{i}", 0) == 5)
@@ -307,78 +316,33 @@ class CTQ:
                 f"Validation échouée: {'; '.join(validation['errors'])}"
             )
         
-        # Apply reverse coding where needed
-        recoded = {}
-        for i in range(1, 29):
-            qid = f"q{i}"
-            value = answers[qid]
-            
-            if i in self.REVERSE_ITEMS:
-                recoded[i] = 6 - value
-            else:
-                recoded[i] = value
-        
-        # Calculate subscale scores
-        emotional_abuse = sum(recoded[i] for i in self.EMOTIONAL_ABUSE_ITEMS)
-        physical_abuse = sum(recoded[i] for i in self.PHYSICAL_ABUSE_ITEMS)
-        sexual_abuse = sum(recoded[i] for i in self.SEXUAL_ABUSE_ITEMS)
-        emotional_neglect = sum(recoded[i] for i in self.EMOTIONAL_NEGLECT_ITEMS)
-        physical_neglect = sum(recoded[i] for i in self.PHYSICAL_NEGLECT_ITEMS)
+        # Apply reverse coding where needed and calculate subscale scores
+        values = self.SCALE.values(answers)
+        recoded = self.SCALE.score(values)
+        subscales = self.SCALE.group_scores(recoded)
         
         # Calculate total score (sum of 5 subscales)
-        total_score = (emotional_abuse + physical_abuse + sexual_abuse +
-                      emotional_neglect + physical_neglect)
+        total_score = sum(subscales.values())
         
         # Calculate denial/minimization score
         denial_score = sum(1 for i in self.DENIAL_ITEMS if answers[f"q{i}"] == 5)
         
         # Get severity levels
         subscale_scores = {
-            "emotional_abuse": {
-                "score": emotional_abuse,
-                "severity": self._get_severity("emotional_abuse", emotional_abuse)
-            },
-            "physical_abuse": {
-                "score": physical_abuse,
-                "severity": self._get_severity("physical_abuse", physical_abuse)
-            },
-            "sexual_abuse": {
-                "score": sexual_abuse,
-                "severity": self._get_severity("sexual_abuse", sexual_abuse)
-            },
-            "emotional_neglect": {
-                "score": emotional_neglect,
-                "severity": self._get_severity("emotional_neglect", emotional_neglect)
-            },
-            "physical_neglect": {
-                "score": physical_neglect,
-                "severity": self._get_severity("physical_neglect", physical_neglect)
-            }
+            name: {"score": score, "severity": self._get_severity(name, score)}
+            for name, score in subscales.items()
         }
         
         # Collect item scores
-        item_scores = {}
-        for i in range(1, 29):
-            qid = f"q{i}"
-            item_scores[qid] = {
-                "raw": answers[qid],
-                "scored": recoded[i],
-                "reversed": i in self.REVERSE_ITEMS,
-                "subscale": None
+        item_scores = {
+            qid: {
+                "raw": value,
+                "scored": scored_value,
+                "reversed": reversed_item,
+                "subscale": self.ITEM_SUBSCALES.get(qid)
             }
-            
-            if i in self.EMOTIONAL_ABUSE_ITEMS:
-                item_scores[qid]["subscale"] = "emotional_abuse"
-            elif i in self.PHYSICAL_ABUSE_ITEMS:
-                item_scores[qid]["subscale"] = "physical_abuse"
-            elif i in self.SEXUAL_ABUSE_ITEMS:
-                item_scores[qid]["subscale"] = "sexual_abuse"
-            elif i in self.EMOTIONAL_NEGLECT_ITEMS:
-                item_scores[qid]["subscale"] = "emotional_neglect"
-            elif i in self.PHYSICAL_NEGLECT_ITEMS:
-                item_scores[qid]["subscale"] = "physical_neglect"
-            elif i in self.DENIAL_ITEMS:
-                item_scores[qid]["subscale"] = "denial"
+            for qid, value, scored_value, reversed_item in zip(self.SCALE.items, values, recoded, self.SCALE.reversed)
+        }
         
         # Generate interpretation
         interpretation = self._generate_interpretation(
@@ -409,10 +373,7 @@ class CTQ:
         Returns:
             Severity level label
         """
-        for min_val, max_val, label in self.CUTOFFS[subscale]:
-            if min_val <= score <= max_val:
-                return label
-        return "Hors bornes"
+        return self.SCALE.group_band(subscale, score, "Hors bornes")
     
     def _generate_interpretation(
         self,
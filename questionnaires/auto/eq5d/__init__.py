@@ -1,4 +1,3 @@
 from .eq5d5l import EQ5D5L, EQ5D5LError, ScoreResult, ValidationResult
 
 __all__ = ["EQ5D5L", "EQ5D5LError", "ScoreResult", "ValidationResult"]
-
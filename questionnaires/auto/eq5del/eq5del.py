@@ -33,7 +33,22 @@ The EQ-5D-5L generates three types of scores:
      * 1.0 = Perfect health (11111)
      * 0.0 = Death
      * <0.0 = States worse than death
-   - Automatically calculated using built-in France crosswalk table
+   - Automatically calculated using the built-in France crosswalk value set
+     (value_sets/FR.bin, looked up by profile code; see value_set.py)
+   - Other national value sets can be registered and requested per call
+     (value_set="XX" or several at once: value_set=["FR", "XX"])
+
+BATCH SCORING:
+- score_batch() computes profile codes, VAS and index values of many
+  respondents at once with NumPy (the "batch" extra)
+
+PROFILE TABLE:
+- Everything derived from the profile alone (dimension texts, problem
+  counts, level sum, interpretation sentence) is precomputed for the 3,125
+  profiles on first use (see profiles.py) and read by profile code
+
+This is the only EQ-5D-5L implementation: questionnaires.auto.eq5d is a
+compatibility layer over it.
 
 CLINICAL INTERPRETATION:
 - Profile shows specific problem areas
@@ -42,10 +57,13 @@ CLINICAL INTERPRETATION:
 - Inconsistencies between profile and VAS flagged as warnings
 """
 
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Mapping, NamedTuple, Optional, Any, Sequence, Union
 from datetime import datetime
 from pydantic import BaseModel
-from .france_crosswalk import FRANCE_CROSSWALK
+from ...engine import require_numpy
+from .profiles import ProfileTable
+from .value_set import WEIGHTS, ValueSet, available_value_sets, code_of, load_value_set, profile_code
 
 
 class EQ5D5LError(ValueError):
@@ -84,6 +102,7 @@ class ScoreResult(BaseModel):
     profile: str
     vas_score: int
     index_value: Optional[float] = None
+    index_values: Optional[Dict[str, float]] = None
     interpretation: str
     dimensions: Dict[str, int]
 
@@ -95,6 +114,27 @@ class ValidationResult(BaseModel):
     warnings: List[str] = []
 
 
+class BatchResult(NamedTuple):
+    """
+    Scores of many respondents, one array element (or row) per respondent.
+    
+    Rows failing validation are flagged in valid; their profile codes are -1
+    and their index values NaN.
+    """
+    valid: Any                          # bool array
+    dimensions: Any                     # respondents x 5 array of levels
+    profile_codes: Any                  # base-5 profile codes (see value_set.profile_of)
+    vas_score: Any                      # VAS scores
+    index_value: Any                    # index values under the first value set
+    index_values: Dict[str, Any]        # value set name -> index values
+
+
+@lru_cache(maxsize=None)
+def profile_table() -> ProfileTable:
+    """Table of the 3,125 profiles (built on first use)"""
+    return ProfileTable(EQ5D5L.DIMENSIONS)
+
+
 class EQ5D5L:
     """
     EQ-5D-5L Questionnaire Class
@@ -155,6 +195,13 @@ class EQ5D5L:
         ])
     ]
     
+    # Default value set of the utility index (France crosswalk)
+    VALUE_SET = "FR"
+    VALUE_SET_LABELS = {"FR": "France"}
+    
+    # Answer items, in batch column order
+    ITEMS = ("q1", "q2", "q3", "q4", "q5", "vas")
+    
     DIMENSION_NAMES = [
         "Mobilité",
         "Autonomie",
@@ -243,7 +290,9 @@ class EQ5D5L:
             "dimensions": 5,
             "profile_range": ["11111", "55555"],
             "vas_range": [0, 100],
-            "index_range": [-0.530, 1.000]
+            "index_range": [-0.530, 1.000],
+            "value_set": self.VALUE_SET,
+            "value_sets": list(available_value_sets())
         }
     
     def get_sections(self) -> List[Dict[str, Any]]:
@@ -335,7 +384,23 @@ class EQ5D5L:
             warnings=warnings
         )
     
-    def calculate_score(self, answers: Dict[str, int]) -> ScoreResult:
+    def calculate_profile(self, answers: Dict[str, int]) -> str:
+        """
+        Calculate the 5-digit health state profile
+        
+        Args:
+            answers: Dictionary with Q1-Q5 answers
+            
+        Returns:
+            5-digit profile string (e.g., "21341")
+        """
+        return "%d%d%d%d%d" % (answers["q1"], answers["q2"], answers["q3"], answers["q4"], answers["q5"])
+    
+    def calculate_score(
+        self,
+        answers: Dict[str, int],
+        value_set: Optional[Union[str, Sequence[str]]] = None
+    ) -> ScoreResult:
         """
         Calculate EQ-5D-5L profile, VAS score, and utility index
         
@@ -344,7 +409,8 @@ class EQ5D5L:
         1. Validate all answers (q1-q5: 1-5, vas: 0-100)
         2. Generate 5-digit health state profile by concatenating q1...q5
         3. Extract VAS score directly from 'vas' answer
-        4. Look up utility index from France crosswalk table
+        4. Look up utility index from the requested value set(s) (by profile code,
+           computed once); the France crosswalk by default
         5. Create dimensions dictionary (dimension name -> level)
         6. Generate clinical interpretation
         
@@ -366,12 +432,15 @@ class EQ5D5L:
         
         Args:
             answers: Dictionary with keys 'q1' through 'q5' (values 1-5) and 'vas' (value 0-100)
+            value_set: Value set name (e.g. "FR") or list of names. index_value
+                uses the first one; when given, index_values holds the index
+                under each of them
             
         Returns:
             ScoreResult with profile, VAS score, utility index, dimensions, and interpretation
             
         Raises:
-            EQ5D5LError: If validation fails
+            EQ5D5LError: If validation fails or a value set is unknown
         """
         # Validate answers
         validation = self.validate_answers(answers)
@@ -379,15 +448,17 @@ class EQ5D5L:
             raise EQ5D5LError("; ".join(validation.errors))
         
         # Generate 5-digit profile (e.g., "21341")
-        profile = "".join(str(answers[f"q{i}"]) for i in range(1, 6))
+        levels = (answers["q1"], answers["q2"], answers["q3"], answers["q4"], answers["q5"])
+        profile = self.calculate_profile(answers)
         
         # Get VAS score
         vas_score = answers["vas"]
         
-        # Look up utility index from France crosswalk table
-        index_value = FRANCE_CROSSWALK.get(profile)
-        if index_value is None:
-            raise EQ5D5LError(f"Profile {profile} not found in France crosswalk table")
+        # Look up utility index in each value set (by profile code)
+        value_sets = self._value_sets(value_set)
+        code = profile_code(levels)
+        index_values = {values.name: values.utility(code) for values in value_sets}
+        index_value = index_values[value_sets[0].name]
         
         # Get dimension values
         dimensions = {
@@ -397,44 +468,105 @@ class EQ5D5L:
         
         # Build interpretation
         interpretation = self._build_interpretation(
-            profile, vas_score, index_value, dimensions, validation.warnings
+            profile, code, vas_score, index_value, validation.warnings,
+            self.VALUE_SET_LABELS.get(value_sets[0].name, value_sets[0].name)
         )
         
         return ScoreResult(
             profile=profile,
             vas_score=vas_score,
             index_value=index_value,
+            index_values=index_values if value_set is not None else None,
             interpretation=interpretation,
             dimensions=dimensions
         )
     
+    def _value_sets(self, value_set: Optional[Union[str, Sequence[str]]]) -> List[ValueSet]:
+        """Requested value sets, loaded on first use"""
+        if value_set is None:
+            names: Sequence[str] = [self.VALUE_SET]
+        elif isinstance(value_set, str):
+            names = [value_set]
+        else:
+            names = value_set
+        if not names:
+            raise EQ5D5LError("Aucun value set demandé")
+        value_sets = []
+        for name in names:
+            try:
+                value_sets.append(load_value_set(name))
+            except LookupError as e:
+                raise EQ5D5LError(
+                    f"Value set inconnu: {name} (disponibles: {', '.join(available_value_sets())})"
+                ) from e
+        return value_sets
+    
+    def score_batch(self, answers: Any, value_set: Optional[Union[str, Sequence[str]]] = None) -> BatchResult:
+        """
+        Score many respondents at once with NumPy (no interpretation).
+        
+        Args:
+            answers: 2-D array (respondents x q1..q5, vas) or dict of item ID -> column
+            value_set: Value set name or list of names, as in calculate_score()
+        
+        Returns:
+            BatchResult with levels, profile codes, VAS and index values
+        
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If items are missing or the array has the wrong shape
+        """
+        np = require_numpy()
+        if isinstance(answers, Mapping):
+            missing = [item for item in self.ITEMS if item not in answers]
+            if missing:
+                raise ValueError(f"Items manquants: {', '.join(missing)}")
+            matrix = np.column_stack([np.asarray(answers[item]) for item in self.ITEMS])
+        else:
+            matrix = np.asarray(answers)
+            if matrix.ndim != 2 or matrix.shape[1] != len(self.ITEMS):
+                raise ValueError(f"Expected a respondents x {len(self.ITEMS)} array, got shape {matrix.shape}")
+        
+        # Floats (e.g. NaN for unanswered items) are valid only when integral
+        numeric = matrix.astype(np.float64)
+        valid = (
+            (numeric == np.floor(numeric)).all(axis=1)
+            & ((numeric[:, :5] >= 1) & (numeric[:, :5] <= 5)).all(axis=1)
+            & (numeric[:, 5] >= 0) & (numeric[:, 5] <= 100)
+        )
+        values = np.nan_to_num(numeric).astype(np.int64)
+        levels = values[:, :5]
+        
+        codes = np.where(valid, (np.clip(levels, 1, 5) - 1) @ np.asarray(WEIGHTS), -1)
+        index_values = {
+            selected.name: np.where(valid, selected.utilities(np.maximum(codes, 0)), np.nan)
+            for selected in self._value_sets(value_set)
+        }
+        return BatchResult(
+            valid=valid,
+            dimensions=levels,
+            profile_codes=codes,
+            vas_score=values[:, 5],
+            index_value=next(iter(index_values.values())),
+            index_values=index_values
+        )
+    
     def _build_interpretation(
         self,
         profile: str,
+        code: int,
         vas_score: int,
         index_value: float,
-        dimensions: Dict[str, int],
-        warnings: List[str]
+        warnings: List[str],
+        value_set_label: str = "France"
     ) -> str:
         """Build clinical interpretation text"""
         interpretation = f"Profil de santé: {profile}. "
         interpretation += f"Score VAS: {vas_score}/100. "
-        interpretation += f"Index d'utilité (France): {index_value:.3f}. "
+        interpretation += f"Index d'utilité ({value_set_label}): {index_value:.3f}. "
         
-        # Interpret profile
-        if profile == "11111":
-            interpretation += "État de santé optimal (aucun problème dans les 5 dimensions). "
-        elif profile == "55555":
-            interpretation += "État de santé le plus défavorable (problèmes extrêmes dans toutes les dimensions). "
-        else:
-            # Count dimensions with problems
-            problems = sum(1 for v in dimensions.values() if v > 1)
-            severe_problems = sum(1 for v in dimensions.values() if v >= 4)
-            
-            if severe_problems > 0:
-                interpretation += f"{severe_problems} dimension(s) avec problèmes sévères ou extrêmes. "
-            elif problems > 0:
-                interpretation += f"{problems} dimension(s) avec problèmes. "
+        # Interpret profile (precomputed per profile)
+        interpretation += profile_table().fragment(code)
         
         # Interpret VAS
         if vas_score >= 80:
@@ -492,14 +624,38 @@ class EQ5D5L:
         if len(profile) != 5 or not profile.isdigit():
             raise EQ5D5LError(f"Profil invalide: {profile}. Doit être 5 chiffres 1-5.")
         
-        if not all(1 <= int(d) <= 5 for d in profile):
+        if profile.strip("12345"):
             raise EQ5D5LError(f"Profil invalide: {profile}. Chaque chiffre doit être 1-5.")
         
-        description = {}
-        for i, digit in enumerate(profile):
-            level = int(digit)
-            dim_name, level_texts = self.DIMENSIONS[i]
-            description[dim_name] = level_texts[level - 1]
+        return profile_table().describe(code_of(profile))
+    
+    def get_profile_table(self, value_set: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get everything derived from each of the 3,125 health state profiles
+        
+        For offline analytics: dimension level texts, and per profile its
+        levels, problem counts, level sum, misery index, interpretation
+        sentence and utility index.
         
-        return description
+        Args:
+            value_set: Value set of the utility index (default: France)
+            
+        Returns:
+            Dictionary with the dimension labels and one row per profile, in
+            profile code order ("11111" first)
+            
+        Raises:
+            EQ5D5LError: If the value set is unknown
+        """
+        table = profile_table()
+        utilities = self._value_sets(value_set)[0]
+        rows = table.rows()
+        for row in rows:
+            row["index_value"] = utilities.utility(row["code"])
+        return {
+            "instrument_id": self.INSTRUMENT_ID,
+            "value_set": utilities.name,
+            "dimensions": {name: list(texts) for name, texts in table.labels},
+            "profiles": rows
+        }
 
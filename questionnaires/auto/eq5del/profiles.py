@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+EQ-5D-5L health state table: everything derived from the profile alone
+
+There are only 3,125 profiles, so what scoring and descriptions derive from a
+profile is computed once for all of them, on first use, and then read by
+profile code (see value_set.py):
+
+    levels          level (1-5) of each dimension
+    problems        dimensions with any problem (level > 1)
+    severe          dimensions with severe or extreme problems (level >= 4)
+    level_sum       sum of the levels, 5 (11111) to 25 (55555): the level
+                    sum score
+    misery_index    sum of the levels counted from 0 (level_sum - 5), 0-20
+    interpretation  the sentence on the profile in the score interpretation
+
+Counts and sums are kept in byte strings (one byte per profile, five for the
+levels) and interpretation sentences as an index into the few distinct
+sentences, so the whole table takes about 30 KiB.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .value_set import DIMENSIONS, PROFILES, profile_of
+
+# Dimension name and its level texts (levels 1-5), in q1..q5 order
+Labels = Sequence[Tuple[str, Sequence[str]]]
+
+
+def interpretation_fragment(levels: Sequence[int]) -> str:
+    """Sentence on the profile in the score interpretation (may be empty)."""
+    if all(level == 1 for level in levels):
+        return "État de santé optimal (aucun problème dans les 5 dimensions). "
+    if all(level == 5 for level in levels):
+        return "État de santé le plus défavorable (problèmes extrêmes dans toutes les dimensions). "
+    problems = sum(1 for level in levels if level > 1)
+    severe_problems = sum(1 for level in levels if level >= 4)
+    if severe_problems > 0:
+        return f"{severe_problems} dimension(s) avec problèmes sévères ou extrêmes. "
+    if problems > 0:
+        return f"{problems} dimension(s) avec problèmes. "
+    return ""
+
+
+class ProfileTable:
+    """
+    Derived values of the 3,125 EQ-5D-5L profiles, indexed by profile code.
+
+    Attributes:
+        labels: Dimension names and level texts the descriptions use
+        levels: Levels of every profile, five bytes per profile
+        problems: Dimensions with problems, one byte per profile
+        severe: Dimensions with severe or extreme problems, one byte per profile
+        level_sum: Sum of the levels, one byte per profile
+        fragments: Distinct interpretation sentences
+        fragment_codes: Index into fragments, one byte per profile
+    """
+
+    __slots__ = ("labels", "levels", "problems", "severe", "level_sum", "fragments", "fragment_codes")
+
+    def __init__(self, labels: Labels):
+        self.labels = tuple((name, tuple(texts)) for name, texts in labels)
+        levels = bytearray()
+        problems = bytearray()
+        severe = bytearray()
+        level_sum = bytearray()
+        fragment_codes = bytearray()
+        fragments: Dict[str, int] = {}
+        for code in range(PROFILES):
+            profile_levels = [int(digit) for digit in profile_of(code)]
+            levels.extend(profile_levels)
+            problems.append(sum(1 for level in profile_levels if level > 1))
+            severe.append(sum(1 for level in profile_levels if level >= 4))
+            level_sum.append(sum(profile_levels))
+            fragment = interpretation_fragment(profile_levels)
+            fragment_codes.append(fragments.setdefault(fragment, len(fragments)))
+        self.levels = bytes(levels)
+        self.problems = bytes(problems)
+        self.severe = bytes(severe)
+        self.level_sum = bytes(level_sum)
+        self.fragments = tuple(fragments)
+        self.fragment_codes = bytes(fragment_codes)
+
+    def describe(self, code: int) -> Dict[str, str]:
+        """Level text of each dimension (dimension name -> text)."""
+        levels = self.levels[code * DIMENSIONS:(code + 1) * DIMENSIONS]
+        return {name: texts[level - 1] for (name, texts), level in zip(self.labels, levels)}
+
+    def fragment(self, code: int) -> str:
+        """Interpretation sentence on the profile."""
+        return self.fragments[self.fragment_codes[code]]
+
+    def row(self, code: int) -> Dict[str, Any]:
+        """Everything derived from one profile, as JSON-compatible data."""
+        return {
+            "profile": profile_of(code),
+            "code": code,
+            "levels": list(self.levels[code * DIMENSIONS:(code + 1) * DIMENSIONS]),
+            "problems": self.problems[code],
+            "severe": self.severe[code],
+            "level_sum": self.level_sum[code],
+            "misery_index": self.level_sum[code] - DIMENSIONS,
+            "interpretation": self.fragment(code).strip()
+        }
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Rows of all profiles, in code order."""
+        return [self.row(code) for code in range(PROFILES)]
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+EQ-5D-5L value sets: utility index lookup by health state
+
+A value set maps each of the 3,125 health states (levels 1-5 on the five
+dimensions) to a utility. States are numbered by their base-5 code
+
+    code = (q1 - 1) * 625 + (q2 - 1) * 125 + (q3 - 1) * 25 + (q4 - 1) * 5 + (q5 - 1)
+
+so "11111" is 0 and "55555" is 3124, in the order of the profile strings.
+Utilities are published with three decimals and stored as thousandths in a
+flat array of signed 16-bit integers, indexed by that code. On disk a value
+set is the same array in little-endian order (6,250 bytes). Value sets are
+shipped in value_sets/ (one NAME.bin per value set) or registered from any
+directory with register_value_set(). A value set is only loaded when it is
+first used, and is memory-mapped rather than read, so workers share its pages
+through the OS page cache.
+
+Single lookups are O(1) from the integer levels; arrays of profiles are
+looked up in one vectorized step with NumPy (the "batch" extra).
+"""
+
+import mmap
+import os
+import sys
+from array import array
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from typing import Any, Dict, Mapping, Sequence, Tuple, Union
+
+from ...engine import require_numpy
+
+DIMENSIONS = 5
+LEVELS = 5
+PROFILES = LEVELS ** DIMENSIONS
+
+# Code weights of q1..q5, and the code offset of levels starting at 1
+WEIGHTS = (625, 125, 25, 5, 1)
+_OFFSET = sum(WEIGHTS)
+
+# Utilities are stored in thousandths
+SCALE = 1000
+
+_TYPECODE = "h"
+_SUFFIX = ".bin"
+_SIZE = 2 * PROFILES
+
+# Value sets registered at runtime: name -> packed file
+_REGISTERED: Dict[str, Path] = {}
+
+
+def profile_code(levels: Sequence[int]) -> int:
+    """Base-5 code of the levels of q1..q5 (each 1-5, not checked)."""
+    q1, q2, q3, q4, q5 = levels
+    return (((q1 * 5 + q2) * 5 + q3) * 5 + q4) * 5 + q5 - _OFFSET
+
+
+def code_of(profile: str) -> int:
+    """Base-5 code of a 5-digit profile string such as "21341" (not checked)."""
+    return profile_code([ord(digit) - 48 for digit in profile])
+
+
+def profile_of(code: int) -> str:
+    """5-digit profile string of a code."""
+    digits = []
+    for weight in WEIGHTS:
+        level, code = divmod(code, weight)
+        digits.append(str(level + 1))
+    return "".join(digits)
+
+
+class ValueSet:
+    """
+    Utilities of the 3,125 EQ-5D-5L health states.
+
+    Attributes:
+        name: Value set identifier (e.g. "FR")
+        thousandths: Utility of every state in thousandths, indexed by code
+            (an array, or a memory map of the packed file)
+    """
+
+    __slots__ = ("name", "thousandths")
+
+    def __init__(self, name: str, thousandths: Sequence[int]):
+        if len(thousandths) != PROFILES:
+            raise ValueError(f"Value set {name}: {len(thousandths)} utilities (expected {PROFILES})")
+        self.name = name
+        self.thousandths = thousandths
+
+    @classmethod
+    def from_bytes(cls, name: str, data: bytes) -> "ValueSet":
+        """Value set from its packed form (little-endian int16 thousandths)."""
+        values = array(_TYPECODE)
+        values.frombytes(data)
+        if sys.byteorder != "little":
+            values.byteswap()
+        return cls(name, values)
+
+    @classmethod
+    def from_mapping(cls, name: str, utilities: Mapping[str, float]) -> "ValueSet":
+        """
+        Value set from a profile -> utility mapping (e.g. a published table).
+
+        Raises:
+            ValueError: If a profile is missing or a utility has more than three decimals
+        """
+        values = array(_TYPECODE, bytes(2 * PROFILES))
+        for code in range(PROFILES):
+            utility = utilities[profile_of(code)]
+            values[code] = round(utility * SCALE)
+            if values[code] / SCALE != utility:
+                raise ValueError(f"Value set {name}: {profile_of(code)} = {utility} has more than 3 decimals")
+        return cls(name, values)
+
+    def to_bytes(self) -> bytes:
+        """Packed form of the value set (little-endian int16 thousandths)."""
+        values = array(_TYPECODE, self.thousandths)
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values.tobytes()
+
+    def utility(self, code: int) -> float:
+        """Utility of the state with this code."""
+        return self.thousandths[code] / SCALE
+
+    def lookup(self, levels: Sequence[int]) -> float:
+        """Utility of the state with these levels of q1..q5 (each 1-5)."""
+        return self.thousandths[profile_code(levels)] / SCALE
+
+    def lookup_profile(self, profile: str) -> float:
+        """Utility of a 5-digit profile string such as "21341"."""
+        return self.thousandths[code_of(profile)] / SCALE
+
+    def lookup_many(self, levels: Any) -> Any:
+        """
+        Utilities of many states at once.
+
+        Args:
+            levels: respondents x 5 array-like of levels (1-5) of q1..q5
+
+        Returns:
+            NumPy float array of utilities
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If the array is not n x 5 or a level is out of range
+        """
+        np = require_numpy()
+        matrix = np.asarray(levels)
+        if matrix.ndim != 2 or matrix.shape[1] != DIMENSIONS:
+            raise ValueError(f"Expected a respondents x {DIMENSIONS} array of levels, got shape {matrix.shape}")
+        if matrix.size and (matrix.min() < 1 or matrix.max() > LEVELS):
+            raise ValueError(f"Levels must be between 1 and {LEVELS}")
+        return self.utilities((matrix.astype(np.int64) - 1) @ np.asarray(WEIGHTS))
+
+    def utilities(self, codes: Any) -> Any:
+        """Utilities of an array of state codes (NumPy float array)."""
+        np = require_numpy()
+        return np.frombuffer(self.thousandths, dtype=np.int16)[codes] / SCALE
+
+
+def _map(path: Path) -> Sequence[int]:
+    """Memory-mapped thousandths of a packed value set file."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size != _SIZE:
+            raise ValueError(f"{path}: not a packed value set ({_SIZE} bytes expected)")
+        if sys.byteorder != "little":
+            return ValueSet.from_bytes(path.stem, file.read()).thousandths
+        # The mapping stays valid after the file is closed
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)).cast(_TYPECODE)
+
+
+@lru_cache(maxsize=None)
+def _shipped() -> Tuple[str, ...]:
+    return tuple(
+        resource.name[:-len(_SUFFIX)]
+        for resource in resources.files(__package__).joinpath("value_sets").iterdir()
+        if resource.name.endswith(_SUFFIX)
+    )
+
+
+def available_value_sets() -> Tuple[str, ...]:
+    """Names of the shipped and registered value sets (none is loaded)."""
+    return tuple(sorted(set(_shipped()) | set(_REGISTERED)))
+
+
+def register_value_set(name: str, path: Union[str, Path]) -> None:
+    """
+    Make a packed value set file available under a name.
+
+    The file (see ValueSet.to_bytes) is only mapped when the value set is
+    first used. A registered name takes precedence over a shipped one.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(f"Value set {name}: {path} not found")
+    _REGISTERED[name] = path
+    load_value_set.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def load_value_set(name: str) -> ValueSet:
+    """
+    Value set by name, loaded on first use (once per process).
+
+    Raises:
+        LookupError: If no value set has this name
+    """
+    if name in _REGISTERED:
+        return ValueSet(name, _map(_REGISTERED[name]))
+    if name not in _shipped():
+        raise LookupError(f"Unknown value set: {name} (available: {', '.join(available_value_sets())})")
+    resource = resources.files(__package__).joinpath("value_sets", name + _SUFFIX)
+    if isinstance(resource, Path):
+        return ValueSet(name, _map(resource))
+    # Not on the file system (e.g. zipped package): read it instead
+    return ValueSet.from_bytes(name, resource.read_bytes())
@@ -355,8 +355,8 @@ class MDQ:
         if missing_q1:
             errors.append(f"Items Q1 manquants: {', '.join(missing_q1)}")
         
-        # Calculate Q1 sum for conditional logic
-        q1_sum = sum(answers.get(k, 0) for k in q1_keys)
+        # Calculate Q1 sum for conditional logic (non-integer values are reported below)
+        q1_sum = sum(answers[k] for k in q1_keys if isinstance(answers.get(k), int))
         
         # Q2 and Q3 are only required if Q1 sum >= 2
         if q1_sum >= 2:
@@ -434,9 +434,9 @@ class MDQ:
         q1_keys = [f"q1_{i}" for i in range(1, 14)]
         q1_total = sum(answers[k] for k in q1_keys)
         
-        # Get Q2 and Q3 values
-        q2_concurrent = answers["q2"] == 1
-        q3_impact = answers["q3"]
+        # Get Q2 and Q3 values (hidden, so possibly absent, below 2 Q1 symptoms)
+        q2_concurrent = answers.get("q2") == 1
+        q3_impact = answers.get("q3", 0)
         q3_impact_label = self.Q3_IMPACT_LABELS[q3_impact]
         
         # Determine screening result
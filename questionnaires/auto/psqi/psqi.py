@@ -2,12 +2,16 @@
 """
 PSQI (Pittsburgh Sleep Quality Index)
 French version - Sleep quality assessment questionnaire
+
+The time fields (q1, q3, q4) are parsed once per submission (see times.py)
+and shared by validation and scoring.
 """
 
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Mapping, NamedTuple, Optional, Any
 from datetime import datetime
 from pydantic import BaseModel
-import re
+from ...engine import require_numpy
+from .times import OUT_OF_RANGE, SleepTimes, parse_clock_column, parse_sleep_hours, parse_sleep_times
 
 
 class PSQIError(ValueError):
@@ -66,6 +70,21 @@ class ValidationResult(BaseModel):
     warnings: List[str] = []
 
 
+class BatchResult(NamedTuple):
+    """
+    Scores of many respondents, one array element per respondent.
+    
+    Rows failing validation are flagged in valid; their component and total
+    scores are -1 and their times NaN.
+    """
+    valid: Any                      # bool array
+    components: Dict[str, Any]      # component name -> scores (0-3)
+    total: Any                      # total scores (0-21)
+    sleep_efficiency_pct: Any
+    time_in_bed_hours: Any
+    sleep_hours: Any
+
+
 class PSQI:
     """
     PSQI (Pittsburgh Sleep Quality Index) Questionnaire Class
@@ -106,6 +125,10 @@ class PSQI:
         "j": "Autre raison (préciser)"
     }
     
+    # Answer items
+    ITEMS = ("q1", "q2", "q3", "q4", "q5a", "q5b", "q5c", "q5d", "q5e", "q5f", "q5g", "q5h", "q5i", "q5j",
+             "q6", "q7", "q8", "q9")
+    
     # Component names
     COMPONENTS = {
         "subjective_quality": "Qualité subjective",
@@ -293,64 +316,19 @@ class PSQI:
                 return q.model_dump()
         return None
     
-    @staticmethod
-    def _parse_time(time_str: str) -> Tuple[int, int]:
-        """Parse HH:MM time string to (hours, minutes)"""
-        if not isinstance(time_str, str) or not re.match(r"^\d{2}:\d{2}$", time_str):
-            raise PSQIError(f"Format HH:MM attendu (reçu: {time_str!r})")
-        
-        h, m = time_str.split(":")
-        h, m = int(h), int(m)
-        
-        if not (0 <= h <= 23 and 0 <= m <= 59):
-            raise PSQIError(f"Heure invalide: {time_str!r}")
-        
-        return h, m
-    
-    @staticmethod
-    def _hours_between(bedtime: str, waketime: str) -> float:
-        """Calculate hours between bedtime and waketime (handles midnight crossover)"""
-        bh, bm = PSQI._parse_time(bedtime)
-        wh, wm = PSQI._parse_time(waketime)
-        
-        bed_minutes = bh * 60 + bm
-        wake_minutes = wh * 60 + wm
-        
-        # Handle midnight crossover
-        if wake_minutes < bed_minutes:
-            wake_minutes += 24 * 60
-        
-        minutes = wake_minutes - bed_minutes
-        return minutes / 60.0
-    
-    @staticmethod
-    def _parse_sleep_hours(value: Union[str, int, float]) -> float:
-        """Parse sleep hours (accepts HH:MM or decimal)"""
-        if isinstance(value, (int, float)):
-            v = float(value)
-            if v < 0:
-                raise PSQIError("q4 (heures de sommeil) doit être >= 0")
-            return v
-        
-        if isinstance(value, str):
-            # Try HH:MM format
-            if re.match(r"^\d{1,2}:\d{2}$", value):
-                h, m = value.split(":")
-                return int(h) + int(m) / 60.0
-            
-            # Try decimal format
-            try:
-                v = float(value)
-                if v < 0:
-                    raise PSQIError("q4 (heures de sommeil) doit être >= 0")
-                return v
-            except ValueError:
-                pass
-        
-        raise PSQIError(f"q4 invalide (attendu HH:MM ou nombre d'heures), reçu: {value!r}")
-    
-    def validate_answers(self, answers: Dict[str, Any]) -> ValidationResult:
-        """Validate provided answers"""
+    def validate_answers(self, answers: Dict[str, Any], times: Optional[SleepTimes] = None) -> ValidationResult:
+        """
+        Validate provided answers
+        
+        Args:
+            answers: Dictionary of question_id -> answer mappings
+            times: The parsed time fields, when the caller already has them
+        
+        Returns:
+            ValidationResult with validation status and messages
+        """
+        if times is None:
+            times = parse_sleep_times(answers)
         errors = []
         warnings = []
         
@@ -363,12 +341,12 @@ class PSQI:
             errors.append(f"Items manquants: {', '.join(missing)}")
         
         # Validate time formats
-        for q_id in ["q1", "q3"]:
-            if q_id in answers:
-                try:
-                    self._parse_time(str(answers[q_id]))
-                except PSQIError as e:
-                    errors.append(f"{q_id}: {str(e)}")
+        for q_id, minutes in (("q1", times.bedtime), ("q3", times.waketime)):
+            if q_id in answers and minutes < 0:
+                if minutes == OUT_OF_RANGE:
+                    errors.append(f"{q_id}: Heure invalide: {str(answers[q_id])!r}")
+                else:
+                    errors.append(f"{q_id}: Format HH:MM attendu (reçu: {str(answers[q_id])!r})")
         
         # Validate Q2 (minutes)
         if "q2" in answers:
@@ -381,10 +359,10 @@ class PSQI:
         
         # Validate Q4 (sleep hours)
         if "q4" in answers:
-            try:
-                self._parse_sleep_hours(answers["q4"])
-            except PSQIError as e:
-                errors.append(str(e))
+            if times.sleep_hours is None:
+                errors.append(f"q4 invalide (attendu HH:MM ou nombre d'heures), reçu: {answers['q4']!r}")
+            elif times.sleep_hours < 0:
+                errors.append("q4 (heures de sommeil) doit être >= 0")
         
         # Validate frequency items (Q5a-j, Q6-Q9)
         frequency_items = [f"q5{c}" for c in self.Q5_ITEMS.keys()] + ["q6", "q7", "q8", "q9"]
@@ -398,21 +376,20 @@ class PSQI:
                     errors.append(f"{q_id} doit être un entier (0-3)")
         
         # Check time in bed coherence (only if no errors)
-        if not errors and all(k in answers for k in ["q1", "q3"]):
-            try:
-                time_in_bed = self._hours_between(str(answers["q1"]), str(answers["q3"]))
-                if time_in_bed < 3:
-                    warnings.append(
-                        f"Temps au lit très court ({time_in_bed:.1f}h). "
-                        "Vérifier la cohérence des heures de coucher et lever."
-                    )
-                elif time_in_bed > 14:
-                    warnings.append(
-                        f"Temps au lit très long ({time_in_bed:.1f}h). "
-                        "Vérifier la cohérence des heures de coucher et lever."
-                    )
-            except PSQIError:
+        if not errors:
+            time_in_bed = times.time_in_bed_hours
+            if time_in_bed is None:
                 pass  # Already caught in format validation
+            elif time_in_bed < 3:
+                warnings.append(
+                    f"Temps au lit très court ({time_in_bed:.1f}h). "
+                    "Vérifier la cohérence des heures de coucher et lever."
+                )
+            elif time_in_bed > 14:
+                warnings.append(
+                    f"Temps au lit très long ({time_in_bed:.1f}h). "
+                    "Vérifier la cohérence des heures de coucher et lever."
+                )
         
         return ValidationResult(
             valid=len(errors) == 0,
@@ -422,14 +399,17 @@ class PSQI:
     
     def calculate_score(self, answers: Dict[str, Any]) -> ScoreResult:
         """Calculate PSQI total score and 7 components"""
+        # Parse the time fields once, for validation and scoring
+        times = parse_sleep_times(answers)
+        
         # Validate answers
-        validation = self.validate_answers(answers)
+        validation = self.validate_answers(answers, times)
         if not validation.valid:
             raise PSQIError("; ".join(validation.errors))
         
-        # Parse time-based values
-        time_in_bed_h = self._hours_between(str(answers["q1"]), str(answers["q3"]))
-        sleep_hours = self._parse_sleep_hours(answers["q4"])
+        # Time-based values (valid once validation passed)
+        time_in_bed_h = times.time_in_bed_hours
+        sleep_hours = times.sleep_hours
         
         if time_in_bed_h <= 0:
             raise PSQIError("Temps au lit nul/négatif: vérifier q1/q3.")
@@ -517,6 +497,86 @@ class PSQI:
             interpretation=interpretation
         )
     
+    def score_batch(self, answers: Any) -> BatchResult:
+        """
+        Score many respondents at once with NumPy (no interpretation).
+        
+        q1 and q3 are parsed as whole columns of HH:MM strings; q4 may be a
+        numeric column (hours) or strings (H:MM or hours, parsed one by one).
+        
+        Args:
+            answers: Mapping of item ID -> column (e.g. a pandas DataFrame)
+        
+        Returns:
+            BatchResult with component and total scores, efficiency and times
+        
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If items are missing, columns differ in length or a
+                numeric column holds non-numeric values
+        """
+        np = require_numpy()
+        if not isinstance(answers, Mapping) and not hasattr(answers, "columns"):
+            raise ValueError("Expected a mapping of item ID -> column")
+        missing = [item for item in self.ITEMS if item not in answers]
+        if missing:
+            raise ValueError(f"Items manquants: {', '.join(missing)}")
+        
+        bedtime = parse_clock_column(answers["q1"])
+        waketime = parse_clock_column(answers["q3"])
+        q4 = np.asarray(answers["q4"])
+        if np.issubdtype(q4.dtype, np.number) or q4.dtype == np.bool_:
+            sleep_hours = q4.astype(np.float64)
+        else:
+            parsed = (parse_sleep_hours(value) for value in q4.tolist())
+            sleep_hours = np.fromiter((np.nan if hours is None else hours for hours in parsed),
+                                      dtype=np.float64, count=len(q4))
+        
+        # Integer items: truncated like int() in validate_answers
+        numeric = np.column_stack([np.asarray(answers[item], dtype=np.float64) for item in self.ITEMS
+                                   if item not in ("q1", "q3", "q4")])
+        if not (len(numeric) == len(bedtime) == len(waketime) == len(sleep_hours)):
+            raise ValueError("Columns must have the same length")
+        finite = np.isfinite(numeric).all(axis=1)
+        values = np.trunc(np.nan_to_num(numeric)).astype(np.int64)
+        q2, frequencies = values[:, 0], values[:, 1:]
+        
+        minutes = waketime - bedtime
+        time_in_bed = np.where(minutes < 0, minutes + 24 * 60, minutes) / 60.0
+        valid = (
+            finite
+            & (q2 >= 0)
+            & ((frequencies >= 0) & (frequencies <= 3)).all(axis=1)
+            & (bedtime >= 0) & (waketime >= 0)
+            & ~np.isnan(sleep_hours) & (sleep_hours >= 0)
+            & (time_in_bed > 0)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            efficiency_pct = (sleep_hours / time_in_bed) * 100.0
+        
+        q5 = {item: frequencies[:, index] for index, item in enumerate(self.ITEMS[4:14])}
+        q6, q7, q8, q9 = frequencies[:, 10], frequencies[:, 11], frequencies[:, 12], frequencies[:, 13]
+        components = {
+            "subjective_quality": q6,
+            # Q2 coded 0-3 (<=15, <=30, <=60, >60 minutes) plus Q5a, re-bucketed in pairs
+            "latency": (np.digitize(q2, [15, 30, 60], right=True) + q5["q5a"] + 1) // 2,
+            "duration": 3 - np.digitize(np.nan_to_num(sleep_hours), [5, 6, 7]),
+            "efficiency": 3 - np.digitize(np.nan_to_num(efficiency_pct), [65, 75, 85]),
+            # Sum of Q5b-j (0-27) in bands of 9
+            "disturbances": (sum(q5[f"q5{c}"] for c in "bcdefghij") + 8) // 9,
+            "medication": q7,
+            "daytime_dysfunction": (q8 + q9 + 1) // 2
+        }
+        components = {name: np.where(valid, scores, -1) for name, scores in components.items()}
+        return BatchResult(
+            valid=valid,
+            components=components,
+            total=np.where(valid, sum(components.values()), -1),
+            sleep_efficiency_pct=np.where(valid, efficiency_pct, np.nan),
+            time_in_bed_hours=np.where(valid, time_in_bed, np.nan),
+            sleep_hours=np.where(valid, sleep_hours, np.nan)
+        )
+    
     @staticmethod
     def _calculate_latency(q2_minutes: int, q5a_score: int) -> int:
         """Calculate latency component (Q2 + Q5a bucketed)"""
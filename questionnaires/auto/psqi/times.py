@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+PSQI time fields: parsed once per submission
+
+q1 (bedtime) and q3 (wake time) are HH:MM clock times, q4 (hours of actual
+sleep) is H:MM/HH:MM or a number of hours. parse_sleep_times() reads the
+three fields of a submission once into a SleepTimes tuple, which validation
+and scoring then share:
+
+    bedtime, waketime   minutes since midnight (0-1439), or MALFORMED /
+                        OUT_OF_RANGE
+    sleep_hours         decimal hours, or None if not a number or H:MM
+
+Clock times and hours are parsed character by character (no regular
+expression, no split, no exception). parse_clock_column() does the same on a whole column of
+strings with NumPy, for batch scoring.
+"""
+
+from typing import Any, NamedTuple, Optional
+
+from ...engine import require_numpy
+
+# Clock time codes besides minutes since midnight
+MALFORMED = -1          # missing, or not HH:MM
+OUT_OF_RANGE = -2       # HH:MM, but hours > 23 or minutes > 59
+
+MINUTES_PER_DAY = 24 * 60
+
+_ZERO = ord("0")
+_COLON = ord(":")
+
+
+def _digit(text: str, index: int) -> int:
+    """Value of an ASCII digit, -1 for any other character."""
+    value = ord(text[index]) - _ZERO
+    return value if 0 <= value <= 9 else -1
+
+
+def parse_clock(value: Any) -> int:
+    """
+    Parse an HH:MM (24h) clock time.
+
+    Returns:
+        Minutes since midnight, MALFORMED or OUT_OF_RANGE
+    """
+    text = value if isinstance(value, str) else str(value)
+    if len(text) != 5 or text[2] != ":":
+        return MALFORMED
+    h1, h2, m1, m2 = _digit(text, 0), _digit(text, 1), _digit(text, 3), _digit(text, 4)
+    if h1 < 0 or h2 < 0 or m1 < 0 or m2 < 0:
+        return MALFORMED
+    hours = h1 * 10 + h2
+    minutes = m1 * 10 + m2
+    if hours > 23 or minutes > 59:
+        return OUT_OF_RANGE
+    return hours * 60 + minutes
+
+
+def _number(text: str) -> Optional[float]:
+    """
+    Value of an ASCII decimal number: optional sign, digits with at most one
+    decimal point (at least one digit), optional exponent. None for anything
+    else (including inf, nan and digit separators).
+    """
+    length = len(text)
+    index = 0
+    if index < length and text[index] in "+-":
+        index += 1
+    digits = 0
+    point = False
+    while index < length:
+        char = text[index]
+        if "0" <= char <= "9":
+            digits += 1
+        elif char == "." and not point:
+            point = True
+        else:
+            break
+        index += 1
+    if not digits:
+        return None
+    if index < length and text[index] in "eE":
+        index += 1
+        if index < length and text[index] in "+-":
+            index += 1
+        start = index
+        while index < length and "0" <= text[index] <= "9":
+            index += 1
+        if index == start:
+            return None
+    if index != length:
+        return None
+    # Checked above: float() cannot fail
+    return float(text)
+
+
+def parse_sleep_hours(value: Any) -> Optional[float]:
+    """
+    Parse hours of sleep: H:MM, HH:MM or a number of hours.
+
+    Numbers are returned as they are (negative ones included, for the caller
+    to reject); strings that are neither H:MM nor a non-negative decimal
+    number (surrounding whitespace allowed) give None.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        return None
+
+    length = len(value)
+    if length in (4, 5) and value[length - 3] == ":":
+        h1 = _digit(value, 0) if length == 5 else 0
+        h2 = _digit(value, length - 4)
+        m1 = _digit(value, length - 2)
+        m2 = _digit(value, length - 1)
+        if h1 >= 0 and h2 >= 0 and m1 >= 0 and m2 >= 0:
+            return h1 * 10 + h2 + (m1 * 10 + m2) / 60.0
+
+    hours = _number(value.strip())
+    return hours if hours is not None and not hours < 0 else None
+
+
+def hours_between(bedtime: int, waketime: int) -> float:
+    """Hours from bedtime to wake time, in minutes since midnight (crossing midnight if needed)."""
+    minutes = waketime - bedtime
+    if minutes < 0:
+        minutes += MINUTES_PER_DAY
+    return minutes / 60.0
+
+
+class SleepTimes(NamedTuple):
+    """Time fields of one submission, parsed once."""
+    bedtime: int                    # q1: minutes since midnight, MALFORMED or OUT_OF_RANGE
+    waketime: int                   # q3: minutes since midnight, MALFORMED or OUT_OF_RANGE
+    sleep_hours: Optional[float]    # q4: decimal hours, None if missing or invalid
+
+    @property
+    def time_in_bed_hours(self) -> Optional[float]:
+        """Hours in bed, None unless both clock times are valid."""
+        if self.bedtime < 0 or self.waketime < 0:
+            return None
+        return hours_between(self.bedtime, self.waketime)
+
+
+def parse_sleep_times(answers: Any) -> SleepTimes:
+    """Parse q1, q3 and q4 of a submission (missing fields count as invalid)."""
+    return SleepTimes(
+        bedtime=parse_clock(answers["q1"]) if "q1" in answers else MALFORMED,
+        waketime=parse_clock(answers["q3"]) if "q3" in answers else MALFORMED,
+        sleep_hours=parse_sleep_hours(answers["q4"]) if "q4" in answers else None
+    )
+
+
+def parse_clock_column(values: Any) -> Any:
+    """
+    Parse a column of HH:MM clock times at once.
+
+    Args:
+        values: 1-D array-like of strings
+
+    Returns:
+        NumPy int64 array of minutes since midnight, MALFORMED or OUT_OF_RANGE
+
+    Raises:
+        ImportError: If NumPy is not installed
+        ValueError: If values is not one-dimensional
+    """
+    np = require_numpy()
+    text = np.asarray(values, dtype=str)
+    if text.ndim != 1:
+        raise ValueError(f"Expected a column of clock times, got shape {text.shape}")
+    width = text.dtype.itemsize // 4
+    if width < 5:
+        return np.full(len(text), MALFORMED, dtype=np.int64)
+
+    # The first five characters of each string as code points
+    chars = text.view(np.uint32).reshape(len(text), width)[:, :5].astype(np.int64)
+    digits = chars[:, [0, 1, 3, 4]] - _ZERO
+    well_formed = (
+        (np.char.str_len(text) == 5)
+        & (chars[:, 2] == _COLON)
+        & ((digits >= 0) & (digits <= 9)).all(axis=1)
+    )
+    hours = digits[:, 0] * 10 + digits[:, 1]
+    minutes = digits[:, 2] * 10 + digits[:, 3]
+    return np.where(
+        well_formed,
+        np.where((hours <= 23) & (minutes <= 59), hours * 60 + minutes, OUT_OF_RANGE),
+        MALFORMED
+    )
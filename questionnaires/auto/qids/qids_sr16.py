@@ -8,6 +8,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 from pydantic import BaseModel, Field, validator
 
+from ...engine import BatchScoring, Group, ScaleSpec, bands_of, compile_spec, item_ids
+
 
 class QIDSError(ValueError):
     """Custom exception for QIDS validation errors"""
@@ -59,7 +61,7 @@ class ValidationResult(BaseModel):
     warnings: List[str] = []
 
 
-class QIDSSR16:
+class QIDSSR16(BatchScoring):
     """
     QIDS-SR16 Questionnaire Class
     
@@ -86,6 +88,26 @@ class QIDSSR16:
         (21, 27, "Dépression très sévère"),
     ]
     
+    # Scoring: 16 items (0-3) folded into 9 domains; mutually exclusive items take their maximum
+    SCALE = compile_spec(ScaleSpec(
+        items=item_ids(16),
+        min_value=0,
+        max_value=3,
+        groups=(
+            Group("sleep", ("q1", "q2", "q3", "q4"), "max"),
+            Group("sadness", ("q5",)),
+            Group("appetite_weight", ("q6", "q7", "q8", "q9"), "max"),
+            Group("concentration", ("q10",)),
+            Group("self_view", ("q11",)),
+            Group("suicidal_ideation", ("q12",)),
+            Group("interest", ("q13",)),
+            Group("energy", ("q14",)),
+            Group("psychomotor", ("q15", "q16"), "max")
+        ),
+        bands=bands_of(CUTOFFS),
+        total="groups"
+    ))
+    
     def __init__(self):
         """Initialize the QIDS-SR16 questionnaire"""
         self._sections = self._build_sections()
@@ -561,34 +583,16 @@ class QIDSSR16:
         if not validation.valid:
             raise QIDSError("; ".join(validation.errors))
         
-        # Calculate domain scores (max of related items)
-        sleep_domain = max(answers['q1'], answers['q2'], answers['q3'], answers['q4'])
-        appetite_weight_domain = max(answers['q6'], answers['q7'], answers['q8'], answers['q9'])
-        psychomotor_domain = max(answers['q15'], answers['q16'])
-        
-        # Calculate total score (sum of 9 domains)
-        total = (
-            sleep_domain +
-            answers['q5'] +  # Sadness
-            appetite_weight_domain +
-            answers['q10'] +  # Concentration
-            answers['q11'] +  # Self-view
-            answers['q12'] +  # Suicidal ideation
-            answers['q13'] +  # Interest
-            answers['q14'] +  # Energy
-            psychomotor_domain
-        )
+        # Calculate domain scores (max of related items) and total score (sum of 9 domains)
+        domain_scores = self.SCALE.group_scores(self.SCALE.values(answers))
+        total = sum(domain_scores.values())
         
         # Safety check
         if total < 0 or total > 27:
             raise QIDSError(f"Score hors bornes: {total}")
         
         # Determine severity
-        severity = None
-        for lo, hi, label in self.CUTOFFS:
-            if lo <= total <= hi:
-                severity = label
-                break
+        severity = self.SCALE.band(total)
         
         # Build interpretation
         interpretation = self._build_interpretation(total, severity, answers)
@@ -596,17 +600,7 @@ class QIDSSR16:
         return ScoreResult(
             total_score=total,
             severity=severity,
-            domain_scores={
-                "sleep": sleep_domain,
-                "sadness": answers['q5'],
-                "appetite_weight": appetite_weight_domain,
-                "concentration": answers['q10'],
-                "self_view": answers['q11'],
-                "suicidal_ideation": answers['q12'],
-                "interest": answers['q13'],
-                "energy": answers['q14'],
-                "psychomotor": psychomotor_domain
-            },
+            domain_scores=domain_scores,
             interpretation=interpretation
         )
     
@@ -9,13 +9,15 @@ This module implements the STAI Form Y-A, which measures state anxiety
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from ...engine import Band, BatchScoring, ScaleSpec, compile_spec, item_ids, items_of
+
 
 class STAIYAError(Exception):
     """Custom exception for STAI-YA questionnaire errors."""
     pass
 
 
-class STAIYA:
+class STAIYA(BatchScoring):
     """
     STAI-YA (State-Trait Anxiety Inventory - Form Y-A)
     
@@ -67,6 +69,21 @@ class STAIYA:
         {"code": 4, "label": "oui", "score": 4}
     ]
     
+    # Scoring: 20 items (1-4), reverse items recoded 5 - value, total bands (French norms)
+    SCALE = compile_spec(ScaleSpec(
+        items=item_ids(20),
+        min_value=1,
+        max_value=4,
+        reverse=frozenset(items_of(REVERSE_ITEMS)),
+        bands=(
+            Band(20, 35, ("Anxiété état très faible", "very_low")),
+            Band(36, 45, ("Anxiété état faible", "low")),
+            Band(46, 55, ("Anxiété état moyenne", "average")),
+            Band(56, 65, ("Anxiété état élevée", "high")),
+            Band(66, 80, ("Anxiété état très élevée", "very_high"))
+        )
+    ))
+    
     def __init__(self):
         """Initialize the STAI-YA questionnaire."""
         self.id = "STAI-YA.fr"
@@ -152,25 +169,10 @@ class STAIYA:
         Raises:
             STAIYAError: If validation fails critically
         """
-        errors = []
+        # All 20 items present, integers between 1 and 4
+        errors = self.SCALE.errors(answers)
         warnings = []
         
-        # Check all 20 items are present
-        expected_items = [f"q{i}" for i in range(1, 21)]
-        missing = [qid for qid in expected_items if qid not in answers]
-        
-        if missing:
-            errors.append(f"Items manquants: {', '.join(missing)}")
-        
-        # Validate each response value
-        for qid in expected_items:
-            if qid in answers:
-                value = answers[qid]
-                if not isinstance(value, int):
-                    errors.append(f"{qid}: la valeur doit être un entier (reçu: {type(value).__name__})")
-                elif value < 1 or value > 4:
-                    errors.append(f"{qid}: la valeur doit être entre 1 et 4 (reçu: {value})")
-        
         # Check for unusual patterns (all same response)
         if not errors and len(set(answers.values())) == 1:
             warnings.append(
@@ -209,42 +211,16 @@ class STAIYA:
             )
         
         # Calculate scores with reverse coding
-        item_scores = {}
-        total = 0
-        
-        for i in range(1, 21):
-            qid = f"q{i}"
-            value = answers[qid]
-            
-            # Apply reverse scoring if needed
-            if i in self.REVERSE_ITEMS:
-                scored_value = 5 - value
-            else:
-                scored_value = value
-            
-            item_scores[qid] = {
-                "raw": value,
-                "scored": scored_value,
-                "reversed": i in self.REVERSE_ITEMS
-            }
-            total += scored_value
+        values = self.SCALE.values(answers)
+        scored = self.SCALE.score(values)
+        item_scores = {
+            qid: {"raw": value, "scored": scored_value, "reversed": reversed_item}
+            for qid, value, scored_value, reversed_item in zip(self.SCALE.items, values, scored, self.SCALE.reversed)
+        }
+        total = sum(scored)
         
         # Determine anxiety category based on French norms
-        if total <= 35:
-            category = "Anxiété état très faible"
-            severity = "very_low"
-        elif 36 <= total <= 45:
-            category = "Anxiété état faible"
-            severity = "low"
-        elif 46 <= total <= 55:
-            category = "Anxiété état moyenne"
-            severity = "average"
-        elif 56 <= total <= 65:
-            category = "Anxiété état élevée"
-            severity = "high"
-        else:  # >= 66
-            category = "Anxiété état très élevée"
-            severity = "very_high"
+        category, severity = self.SCALE.band(total)
         
         # Generate interpretation
         interpretation = self._generate_interpretation(total, severity)
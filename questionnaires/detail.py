@@ -0,0 +1,44 @@
+"""
+Detail levels of scoring results
+
+Scoring methods that accept a ``detail`` argument can skip the work a caller
+does not need. Bulk and analytics callers usually only want the numbers:
+
+    full     Everything (default): scores, labels, interpretation text,
+             warnings and the calculation date
+    summary  Scores, labels (severity, categories, item names) and warnings,
+             without the interpretation text and the calculation date
+    numeric  Scores only: totals, subscale and item scores, counts and flags
+
+The keys present at a lower level have the same values as at "full", except
+item and domain scores, which are plain numbers at "numeric" instead of
+{"score": ..., "name": ...} objects.
+"""
+
+from typing import Optional, Tuple
+
+NUMERIC = "numeric"
+SUMMARY = "summary"
+FULL = "full"
+
+DETAIL_LEVELS: Tuple[str, ...] = (NUMERIC, SUMMARY, FULL)
+
+
+def check_detail(detail: Optional[str]) -> str:
+    """
+    Resolve a requested detail level.
+
+    Args:
+        detail: "numeric", "summary", "full" or None (full)
+
+    Returns:
+        The detail level to apply
+
+    Raises:
+        ValueError: If the level is unknown
+    """
+    if detail is None:
+        return FULL
+    if detail not in DETAIL_LEVELS:
+        raise ValueError(f"Niveau de détail inconnu: {detail} (attendu: {', '.join(DETAIL_LEVELS)})")
+    return detail
@@ -0,0 +1,387 @@
+"""
+Shared scoring engine for fixed-item rating scales
+
+Most instruments are a list of items answered on one integer scale, with some
+items reverse-scored, item groups aggregated into subscales or domains (sum,
+mean or max) and score bands mapped to labels. Instead of re-implementing
+those loops, an instrument declares them once:
+
+    SPEC = ScaleSpec(
+        items=tuple(f"q{i}" for i in range(1, 21)),
+        min_value=1,
+        max_value=4,
+        reverse=frozenset({"q1", "q2", "q5"}),
+        groups=(Group("calm", ("q1", "q2", "q5")),),
+        bands=(Band(20, 35, "low"), Band(36, 80, "high"))
+    )
+    SCALE = compile_spec(SPEC)
+
+and compile_spec() turns the spec into a CompiledScale holding precomputed
+lookup tables: one recoding table per item (reverse scoring is a table
+lookup), group index tuples and bisect tables for the bands. Validation
+messages follow the wording shared by the French instruments.
+
+CompiledScale.score_batch() scores many respondents at once with NumPy array
+operations; instrument classes expose it as score_batch() by inheriting
+BatchScoring. NumPy is optional (the "batch" extra); it is imported on first use.
+"""
+
+from bisect import bisect_right
+from operator import itemgetter
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, NamedTuple, Sequence, Tuple, Union
+
+Number = Union[int, float]
+
+
+class Band(NamedTuple):
+    """Inclusive score range mapped to a label (any value: text, tuple, ...)."""
+    low: Number
+    high: Number
+    label: Any
+
+
+class Group(NamedTuple):
+    """Items aggregated into one subscale or domain score."""
+    name: str
+    items: Tuple[str, ...]
+    aggregation: str = "sum"  # "sum", "mean" or "max"
+    # Bands of the group score, in ascending order
+    bands: Tuple[Band, ...] = ()
+
+
+class ScaleSpec(NamedTuple):
+    """Declarative description of a rating scale."""
+    items: Tuple[str, ...]
+    min_value: int
+    max_value: int
+    # Items scored as min_value + (item) max_value - answer
+    reverse: FrozenSet[str] = frozenset()
+    groups: Tuple[Group, ...] = ()
+    # Bands of the total score, in ascending order
+    bands: Tuple[Band, ...] = ()
+    # Items whose maximum differs from max_value, as (item, maximum) pairs
+    item_max: Tuple[Tuple[str, int], ...] = ()
+    # Total score: "sum" or "mean" of the scored items, "groups" (sum of the group
+    # scores) or "group_mean" (mean of the group scores)
+    total: str = "sum"
+    # Appended to the out-of-range message (e.g. the letter coding of the values)
+    range_hint: str = ""
+
+
+class BatchScores(NamedTuple):
+    """
+    Scores of many respondents, one array element (or row) per respondent.
+
+    Rows failing validation are flagged in valid; their scores are computed
+    from the raw values anyway and their severity codes are -1.
+    """
+    valid: Any                      # bool array
+    scored: Any                     # respondents x items array of scored values
+    total: Any                      # total scores
+    severity: Any                   # index into severity_labels, -1 outside every band
+    severity_labels: Tuple[Any, ...]
+    groups: Dict[str, Any]          # group name -> group scores
+    group_severity: Dict[str, Any]  # group name -> band indices (groups with bands)
+    group_severity_labels: Dict[str, Tuple[Any, ...]]
+
+
+_AGGREGATIONS: Dict[str, Callable[[Sequence[Number]], Number]] = {
+    "sum": sum,
+    "mean": lambda values: sum(values) / float(len(values)),
+    "max": max
+}
+
+# Aggregate of a single-item group, applied to the item value itself
+_SINGLE_ITEM: Dict[str, Callable[[Number], Number]] = {
+    "sum": lambda value: value,
+    "mean": float,
+    "max": lambda value: value
+}
+
+_TOTALS = ("sum", "mean", "groups", "group_mean")
+
+
+def _group_scorer(indices: Tuple[int, ...], aggregation: str) -> Callable[[Sequence[Number]], Number]:
+    """Score of one group from the scored values in item order."""
+    getter = itemgetter(*indices)
+    if len(indices) == 1:
+        single = _SINGLE_ITEM[aggregation]
+        return lambda scored: single(getter(scored))
+    aggregate = _AGGREGATIONS[aggregation]
+    return lambda scored: aggregate(getter(scored))
+
+
+def require_numpy() -> Any:
+    """The numpy module, imported on first use."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Batch scoring requires NumPy: pip install numpy (or the 'batch' extra)") from e
+    return numpy
+
+
+class BandTable:
+    """Bisect table over ascending, non-overlapping bands."""
+
+    __slots__ = ("lows", "highs", "labels")
+
+    def __init__(self, bands: Sequence[Band]):
+        self.lows = [band.low for band in bands]
+        self.highs = [band.high for band in bands]
+        self.labels = [band.label for band in bands]
+
+    def lookup(self, score: Number, default: Any = None) -> Any:
+        """Label of the band containing score (default outside every band)."""
+        index = bisect_right(self.lows, score) - 1
+        if index < 0 or score > self.highs[index]:
+            return default
+        return self.labels[index]
+
+    def codes(self, scores: Any) -> Any:
+        """Band index of every score of an array (-1 outside every band)."""
+        np = require_numpy()
+        if not self.lows:
+            return np.full(len(scores), -1, dtype=np.int8)
+        index = np.searchsorted(np.asarray(self.lows), scores, side="right") - 1
+        inside = (index >= 0) & (scores <= np.asarray(self.highs)[np.maximum(index, 0)])
+        return np.where(inside, index, -1).astype(np.int8)
+
+
+class CompiledScale:
+    """
+    Precomputed validator and scorer of a ScaleSpec.
+
+    Attributes:
+        spec: The compiled specification
+        items: Item ids in scoring order
+        maxima: Maximum answer of every item, in item order
+        tables: Per item, the scored value indexed by answer - min_value
+        reversed: Whether every item is reverse-scored, in item order
+        groups: (name, scorer) per group, the scorer taking the scored values
+        bands: Band table of the total score
+        group_bands: Band table of every group with bands, by group name
+    """
+
+    def __init__(self, spec: ScaleSpec):
+        self.spec = spec
+        self.items = spec.items
+        self.min_value = spec.min_value
+        self.max_value = spec.max_value
+        maxima = dict(spec.item_max)
+        self.maxima: Tuple[int, ...] = tuple(maxima.get(item, spec.max_value) for item in spec.items)
+        self._ranges = tuple(zip(spec.items, self.maxima))
+        self.tables: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(spec.min_value + high - value if item in spec.reverse else value for value in range(spec.min_value, high + 1))
+            for item, high in self._ranges
+        )
+        self.reversed: Tuple[bool, ...] = tuple(item in spec.reverse for item in spec.items)
+        index = {item: position for position, item in enumerate(spec.items)}
+        self._group_indices: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(index[item] for item in group.items) for group in spec.groups
+        )
+        self.groups: Tuple[Tuple[str, Callable[[Sequence[Number]], Number]], ...] = tuple(
+            (group.name, _group_scorer(indices, group.aggregation))
+            for group, indices in zip(spec.groups, self._group_indices)
+        )
+        self.bands = BandTable(spec.bands)
+        self.group_bands: Dict[str, BandTable] = {group.name: BandTable(group.bands) for group in spec.groups if group.bands}
+
+    def errors(self, answers: Dict[str, Any]) -> List[str]:
+        """
+        Check that every item is answered with an integer in range.
+
+        Returns:
+            Error messages (empty when the answers are valid)
+        """
+        low = self.min_value
+        try:
+            # Fast path: everything present and in range
+            if all(type(answers[item]) is int and low <= answers[item] <= high for item, high in self._ranges):
+                return []
+        except KeyError:
+            pass
+
+        errors = []
+        missing = [item for item in self.items if item not in answers]
+        if missing:
+            errors.append(f"Items manquants: {', '.join(missing)}")
+        for item, high in self._ranges:
+            if item in answers:
+                value = answers[item]
+                if not isinstance(value, int):
+                    errors.append(f"{item}: la valeur doit être un entier (reçu: {type(value).__name__})")
+                elif value < low or value > high:
+                    errors.append(f"{item}: la valeur doit être entre {low} et {high}{self.spec.range_hint} (reçu: {value})")
+        return errors
+
+    def values(self, answers: Dict[str, Any]) -> List[int]:
+        """Raw answers in item order (answers must be valid)."""
+        return [answers[item] for item in self.items]
+
+    def score(self, values: Sequence[int]) -> List[int]:
+        """Scored (reverse-coded) values in item order."""
+        low = self.min_value
+        return [table[value - low] for table, value in zip(self.tables, values)]
+
+    def group_scores(self, scored: Sequence[int]) -> Dict[str, Number]:
+        """Aggregate of every group, by group name."""
+        return {name: scorer(scored) for name, scorer in self.groups}
+
+    def band(self, score: Number, default: Any = None) -> Any:
+        """Label of the total-score band containing score."""
+        return self.bands.lookup(score, default)
+
+    def group_band(self, name: str, score: Number, default: Any = None) -> Any:
+        """Label of the band of group name containing score."""
+        return self.group_bands[name].lookup(score, default)
+
+    def matrix(self, answers: Any) -> Any:
+        """
+        Answers of many respondents as a respondents x items array.
+
+        Args:
+            answers: 2-D array-like with one column per item, in item order, or
+                a columnar mapping of item id -> 1-D array-like
+
+        Raises:
+            ValueError: If items are missing or the array has the wrong shape
+        """
+        np = require_numpy()
+        if isinstance(answers, Mapping):
+            missing = [item for item in self.items if item not in answers]
+            if missing:
+                raise ValueError(f"Items manquants: {', '.join(missing)}")
+            return np.column_stack([np.asarray(answers[item]) for item in self.items])
+        matrix = np.asarray(answers)
+        if matrix.ndim != 2 or matrix.shape[1] != len(self.items):
+            raise ValueError(f"Expected a respondents x {len(self.items)} array, got shape {matrix.shape}")
+        return matrix
+
+    def score_batch(self, answers: Any) -> BatchScores:
+        """
+        Score many respondents with vectorized array operations.
+
+        Args:
+            answers: 2-D array-like (respondents x items, in item order) or a
+                columnar mapping of item id -> 1-D array-like
+
+        Returns:
+            Item, total and group scores with their band indices
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If items are missing or the array has the wrong shape
+        """
+        np = require_numpy()
+        raw = self.matrix(answers)
+        maxima = np.asarray(self.maxima)
+
+        if np.issubdtype(raw.dtype, np.integer) or raw.dtype == np.bool_:
+            values = raw.astype(np.int64, copy=False)
+            valid = ((values >= self.min_value) & (values <= maxima)).all(axis=1)
+        else:
+            # Floats (e.g. NaN for unanswered items) are valid only when integral
+            numeric = raw.astype(np.float64)
+            valid = ((numeric == np.floor(numeric)) & (numeric >= self.min_value) & (numeric <= maxima)).all(axis=1)
+            values = np.nan_to_num(numeric).astype(np.int64)
+
+        # Reverse scoring in one pass: scored = sign * value + offset
+        reverse = np.asarray(self.reversed)
+        scored = np.where(reverse, -1, 1) * values + np.where(reverse, self.min_value + maxima, 0)
+
+        groups: Dict[str, Any] = {}
+        for group, indices in zip(self.spec.groups, self._group_indices):
+            columns = scored[:, list(indices)]
+            if group.aggregation == "max":
+                groups[group.name] = columns.max(axis=1)
+            elif group.aggregation == "mean":
+                groups[group.name] = columns.mean(axis=1)
+            else:
+                groups[group.name] = columns.sum(axis=1)
+
+        if self.spec.total == "groups":
+            total = np.sum(list(groups.values()), axis=0, dtype=np.int64)
+        elif self.spec.total == "group_mean":
+            total = np.mean(list(groups.values()), axis=0)
+        elif self.spec.total == "mean":
+            total = scored.mean(axis=1)
+        else:
+            total = scored.sum(axis=1)
+
+        return BatchScores(
+            valid=valid,
+            scored=scored,
+            total=total,
+            severity=np.where(valid, self.bands.codes(total), -1).astype(np.int8),
+            severity_labels=tuple(self.bands.labels),
+            groups=groups,
+            group_severity={
+                name: np.where(valid, table.codes(groups[name]), -1).astype(np.int8)
+                for name, table in self.group_bands.items()
+            },
+            group_severity_labels={name: tuple(table.labels) for name, table in self.group_bands.items()}
+        )
+
+
+class BatchScoring:
+    """
+    Mixin giving an instrument class with a SCALE attribute (a CompiledScale)
+    its score_batch() method.
+    """
+
+    SCALE: CompiledScale
+
+    def score_batch(self, answers: Any) -> BatchScores:
+        """
+        Score many respondents at once with NumPy (no interpretation).
+
+        Args:
+            answers: 2-D array (respondents x items, in SCALE.items order) or
+                dict of item ID -> column
+
+        Returns:
+            BatchScores with item, total and subscale scores and severity codes
+        """
+        return self.SCALE.score_batch(answers)
+
+
+def compile_spec(spec: ScaleSpec) -> CompiledScale:
+    """
+    Compile a scale specification.
+
+    Raises:
+        ValueError: If a group names an unknown item or aggregation, the
+            total is unknown, or bands are not ascending and disjoint
+    """
+    known = set(spec.items)
+    for group in spec.groups:
+        unknown = [item for item in group.items if item not in known]
+        if unknown or group.aggregation not in _AGGREGATIONS:
+            raise ValueError(f"Invalid group {group.name!r}: unknown items {unknown} or aggregation {group.aggregation!r}")
+    if spec.total not in _TOTALS:
+        raise ValueError(f"Unknown total {spec.total!r} (expected one of {', '.join(_TOTALS)})")
+    for bands in (spec.bands, *(group.bands for group in spec.groups)):
+        for previous, band in zip(bands, bands[1:]):
+            if band.low <= previous.high:
+                raise ValueError(f"Bands overlap or are not ascending: {previous} / {band}")
+    return CompiledScale(spec)
+
+
+def bands_of(cutoffs: Sequence[Tuple[Number, Number, Any]]) -> Tuple[Band, ...]:
+    """Bands from (low, high, label) tuples, such as a CUTOFFS list."""
+    return tuple(Band(*cutoff) for cutoff in cutoffs)
+
+
+def band_table(cutoffs: Sequence[Tuple[Number, Number, Any]]) -> BandTable:
+    """Band table from (low, high, label) tuples, such as a CUTOFFS list."""
+    return BandTable(bands_of(cutoffs))
+
+
+def item_ids(count: int, prefix: str = "q") -> Tuple[str, ...]:
+    """Item ids q1..qN."""
+    return tuple(f"{prefix}{i}" for i in range(1, count + 1))
+
+
+def items_of(numbers: Sequence[int], prefix: str = "q") -> Tuple[str, ...]:
+    """Item ids of 1-based item numbers (e.g. a REVERSE_ITEMS set)."""
+    return tuple(f"{prefix}{i}" for i in numbers)
@@ -1,13 +1,32 @@
 # Hetero (clinician-rated) questionnaires
-# This module contains clinician-administered/rated questionnaires with heterogeneous item types
+# This module contains clinician-administered/rated questionnaires with heterogeneous item types.
+# Instrument modules are imported on first attribute access.
 
-from .alda import ALDA, ALDAError
-from .cgi import CGI, CGIError
-from .egf import EGF, EGFError
-from .etat_patient import EtatPatient, EtatPatientError
-from .fast import FAST, FASTError
-from .madrs import MADRS, MADRSError
-from .ymrs import YMRS, YMRSError
+import importlib
+from typing import Any, Dict
 
-__all__ = ["ALDA", "ALDAError", "CGI", "CGIError", "EGF", "EGFError", "EtatPatient", "EtatPatientError", "FAST", "FASTError", "MADRS", "MADRSError", "YMRS", "YMRSError"]
+# Exported name -> submodule defining it
+_EXPORTS: Dict[str, str] = {
+    "ALDA": ".alda", "ALDAError": ".alda",
+    "CGI": ".cgi", "CGIError": ".cgi",
+    "EGF": ".egf", "EGFError": ".egf",
+    "EtatPatient": ".etat_patient", "EtatPatientError": ".etat_patient",
+    "FAST": ".fast", "FASTError": ".fast",
+    "MADRS": ".madrs", "MADRSError": ".madrs",
+    "YMRS": ".ymrs", "YMRSError": ".ymrs"
+}
 
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -9,6 +9,8 @@ where A is clinical improvement (0-10) and B is the sum of five confounding fact
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+from ...detail import NUMERIC, SUMMARY, check_detail
+
 
 class ALDAError(Exception):
     """Custom exception for ALDA scale errors."""
@@ -367,7 +369,8 @@ class ALDA:
     def calculate_score(
         self,
         answers: Dict[str, int],
-        clamp_min_zero: bool = True
+        clamp_min_zero: bool = True,
+        detail: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Calculate ALDA score.
@@ -375,6 +378,7 @@ class ALDA:
         Args:
             answers: Dictionary mapping item IDs to response values
             clamp_min_zero: If True, clamp total score to minimum 0 (common usage)
+            detail: "numeric", "summary" or "full" (default); see questionnaires.detail
         
         Returns:
             Dictionary containing:
@@ -389,7 +393,10 @@ class ALDA:
         
         Raises:
             ALDAError: If validation fails
+            ValueError: If the detail level is unknown
         """
+        detail = check_detail(detail)
+        
         # Validate answers
         validation = self.validate_answers(answers)
         if not validation["valid"]:
@@ -408,6 +415,16 @@ class ALDA:
         total_score = max(0, total_score_unclamped) if clamp_min_zero else total_score_unclamped
         clamp_applied = clamp_min_zero and total_score_unclamped < 0
         
+        if detail == NUMERIC:
+            return {
+                "score_A": score_A,
+                "score_B": score_B,
+                "total_score": total_score,
+                "total_score_unclamped": total_score_unclamped,
+                "clamp_applied": clamp_applied,
+                "item_scores": {item: answers[item] for item in ("A", *self.B_ITEMS)}
+            }
+        
         # Determine response category
         response_category = self._get_response_category(total_score)
         
@@ -425,17 +442,7 @@ class ALDA:
                 "description": self._get_b_item_description(item)
             }
         
-        # Generate interpretation
-        interpretation = self._generate_interpretation(
-            score_A,
-            score_B,
-            total_score,
-            total_score_unclamped,
-            response_category,
-            answers
-        )
-        
-        return {
+        result = {
             "score_A": score_A,
             "score_B": score_B,
             "total_score": total_score,
@@ -444,11 +451,24 @@ class ALDA:
             "clamp_applied": clamp_applied,
             "response_category": response_category,
             "good_response_threshold": self.GOOD_RESPONSE_THRESHOLD,
-            "item_scores": item_scores,
-            "interpretation": interpretation,
-            "warnings": validation["warnings"],
-            "calculation_date": datetime.utcnow().isoformat() + "Z"
+            "item_scores": item_scores
         }
+        if detail == SUMMARY:
+            result["warnings"] = validation["warnings"]
+            return result
+        
+        # Generate interpretation
+        result["interpretation"] = self._generate_interpretation(
+            score_A,
+            score_B,
+            total_score,
+            total_score_unclamped,
+            response_category,
+            answers
+        )
+        result["warnings"] = validation["warnings"]
+        result["calculation_date"] = datetime.utcnow().isoformat() + "Z"
+        return result
     
     def _get_response_category(self, total_score: int) -> str:
         """
@@ -13,6 +13,8 @@ The CGI consists of three subscales:
 from typing import Dict, List, Optional, Any, Literal
 from datetime import datetime
 
+from ...detail import NUMERIC, SUMMARY, check_detail
+
 
 class CGIError(Exception):
     """Custom exception for CGI scale errors."""
@@ -518,7 +520,8 @@ class CGI:
     def calculate_score(
         self,
         answers: Dict[str, int],
-        visit_type: Optional[str] = None
+        visit_type: Optional[str] = None,
+        detail: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Calculate CGI scores.
@@ -526,6 +529,7 @@ class CGI:
         Args:
             answers: Dictionary mapping item IDs to response values
             visit_type: Type of visit ("baseline" or "followup")
+            detail: "numeric", "summary" or "full" (default); see questionnaires.detail
         
         Returns:
             Dictionary containing:
@@ -539,7 +543,10 @@ class CGI:
         
         Raises:
             CGIError: If validation fails
+            ValueError: If the detail level is unknown
         """
+        detail = check_detail(detail)
+        
         # Validate answers
         validation = self.validate_answers(answers, visit_type)
         if not validation["valid"]:
@@ -558,22 +565,27 @@ class CGI:
         if effect is not None and side_effects is not None and effect != 0:
             therapeutic_index = self.calculate_therapeutic_index(effect, side_effects)
         
-        # Generate interpretation
-        interpretation = self._generate_interpretation(
-            cgi_s, cgi_i, effect, side_effects, therapeutic_index, visit_type
-        )
-        
-        return {
+        result = {
             "cgi_s": cgi_s,
             "cgi_i": cgi_i,
             "therapeutic_effect": effect,
             "side_effects": side_effects,
-            "therapeutic_index": therapeutic_index,
-            "visit_type": visit_type or "unspecified",
-            "interpretation": interpretation,
-            "warnings": validation["warnings"],
-            "calculation_date": datetime.utcnow().isoformat() + "Z"
+            "therapeutic_index": therapeutic_index
         }
+        if detail == NUMERIC:
+            return result
+        result["visit_type"] = visit_type or "unspecified"
+        if detail == SUMMARY:
+            result["warnings"] = validation["warnings"]
+            return result
+        
+        # Generate interpretation
+        result["interpretation"] = self._generate_interpretation(
+            cgi_s, cgi_i, effect, side_effects, therapeutic_index, visit_type
+        )
+        result["warnings"] = validation["warnings"]
+        result["calculation_date"] = datetime.utcnow().isoformat() + "Z"
+        return result
     
     def _get_severity_label(self, score: int) -> str:
         """Get severity category label."""
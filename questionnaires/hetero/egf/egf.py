@@ -12,6 +12,8 @@ providing a quick assessment of psychological, social, and occupational function
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+from ...detail import NUMERIC, SUMMARY, check_detail
+
 
 class EGFError(Exception):
     """Custom exception for EGF scale errors."""
@@ -383,12 +385,13 @@ class EGF:
         else:  # score >= 91
             return "91-100"
     
-    def calculate_score(self, answers: Dict[str, int]) -> Dict[str, Any]:
+    def calculate_score(self, answers: Dict[str, int], detail: Optional[str] = None) -> Dict[str, Any]:
         """
         Calculate and interpret EGF score.
         
         Args:
             answers: Dictionary mapping question IDs to response values (expects 'egf_score' key)
+            detail: "numeric", "summary" or "full" (default); see questionnaires.detail
         
         Returns:
             Dictionary containing:
@@ -401,7 +404,10 @@ class EGF:
         
         Raises:
             EGFError: If validation fails
+            ValueError: If the detail level is unknown
         """
+        detail = check_detail(detail)
+        
         # Validate answers
         validation = self.validate_answers(answers)
         if not validation["valid"]:
@@ -412,23 +418,28 @@ class EGF:
         
         # Get band
         band = self.get_band(score)
+        if detail == NUMERIC:
+            return {"score": score, "band": band}
         band_label = self.BANDS.get(band, "Unknown")
         
         # Determine severity
         severity = self._get_severity(score)
         
-        # Generate interpretation
-        interpretation = self._generate_interpretation(score, band, band_label, severity)
-        
-        return {
+        result = {
             "score": score,
             "band": band,
             "band_label": band_label,
-            "severity": severity,
-            "interpretation": interpretation,
-            "warnings": validation["warnings"],
-            "calculation_date": datetime.utcnow().isoformat() + "Z"
+            "severity": severity
         }
+        if detail == SUMMARY:
+            result["warnings"] = validation["warnings"]
+            return result
+        
+        # Generate interpretation
+        result["interpretation"] = self._generate_interpretation(score, band, band_label, severity)
+        result["warnings"] = validation["warnings"]
+        result["calculation_date"] = datetime.utcnow().isoformat() + "Z"
+        return result
     
     def _get_severity(self, score: int) -> str:
         """Get severity category based on score."""
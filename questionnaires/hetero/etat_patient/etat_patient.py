@@ -12,6 +12,8 @@ automatic safety flagging for suicidal ideation.
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from ...detail import NUMERIC, SUMMARY, check_detail
+
 
 class EtatPatientError(Exception):
     """Custom exception for État du patient errors."""
@@ -337,12 +339,13 @@ class EtatPatient:
             "warnings": warnings
         }
     
-    def calculate_score(self, answers: Dict[str, int]) -> Dict[str, Any]:
+    def calculate_score(self, answers: Dict[str, int], detail: Optional[str] = None) -> Dict[str, Any]:
         """
         Calculate État du patient scores.
         
         Args:
             answers: Dictionary mapping item IDs to response values
+            detail: "numeric", "summary" or "full" (default); see questionnaires.detail
         
         Returns:
             Dictionary containing:
@@ -356,7 +359,10 @@ class EtatPatient:
         
         Raises:
             EtatPatientError: If validation fails
+            ValueError: If the detail level is unknown
         """
+        detail = check_detail(detail)
+        
         # Validate answers
         validation = self.validate_answers(answers)
         if not validation["valid"]:
@@ -375,17 +381,10 @@ class EtatPatient:
         # Safety flag
         safety_flag = 1 if answers.get("dep_suicide") == 1 else 0
         
-        # Generate interpretation
-        interpretation = self._generate_interpretation(
-            depressive_count,
-            manic_count,
-            safety_flag,
-            depressive_symptoms,
-            manic_symptoms,
-            answers
-        )
+        if detail == NUMERIC:
+            return {"depressive_count": depressive_count, "manic_count": manic_count, "safety_flag": safety_flag}
         
-        return {
+        result = {
             "depressive_count": depressive_count,
             "manic_count": manic_count,
             "safety_flag": safety_flag,
@@ -393,11 +392,24 @@ class EtatPatient:
             "manic_symptoms": manic_symptoms,
             "conditional_items": {
                 item: answers.get(item) for item in self.CONDITIONAL_ITEMS if item in answers
-            },
-            "interpretation": interpretation,
-            "warnings": validation["warnings"],
-            "calculation_date": datetime.utcnow().isoformat() + "Z"
+            }
         }
+        if detail == SUMMARY:
+            result["warnings"] = validation["warnings"]
+            return result
+        
+        # Generate interpretation
+        result["interpretation"] = self._generate_interpretation(
+            depressive_count,
+            manic_count,
+            safety_flag,
+            depressive_symptoms,
+            manic_symptoms,
+            answers
+        )
+        result["warnings"] = validation["warnings"]
+        result["calculation_date"] = datetime.utcnow().isoformat() + "Z"
+        return result
     
     def _generate_interpretation(
         self,
@@ -12,6 +12,8 @@ Higher scores indicate greater functional impairment.
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from ...detail import NUMERIC, SUMMARY, check_detail
+
 
 class FASTError(Exception):
     """Custom exception for FAST scale errors."""
@@ -319,12 +321,13 @@ class FAST:
             "warnings": warnings
         }
     
-    def calculate_score(self, answers: Dict[str, int]) -> Dict[str, Any]:
+    def calculate_score(self, answers: Dict[str, int], detail: Optional[str] = None) -> Dict[str, Any]:
         """
         Calculate FAST scores.
         
         Args:
             answers: Dictionary mapping item IDs to response values
+            detail: "numeric", "summary" or "full" (default); see questionnaires.detail
         
         Returns:
             Dictionary containing:
@@ -337,7 +340,10 @@ class FAST:
         
         Raises:
             FASTError: If validation fails
+            ValueError: If the detail level is unknown
         """
+        detail = check_detail(detail)
+        
         # Validate answers
         validation = self.validate_answers(answers)
         if not validation["valid"]:
@@ -345,6 +351,13 @@ class FAST:
                 f"Validation échouée: {'; '.join(validation['errors'])}"
             )
         
+        if detail == NUMERIC:
+            domain_totals = {
+                domain_id: sum(answers.get(f"q{i}", 0) for i in domain_info["items"])
+                for domain_id, domain_info in self.DOMAINS.items()
+            }
+            return {"total_score": sum(domain_totals.values()), "domain_scores": domain_totals}
+        
         # Calculate domain scores
         domain_scores = {}
         for domain_id, domain_info in self.DOMAINS.items():
@@ -369,24 +382,27 @@ class FAST:
                 ds["score"], ds["max_score"]
             )
         
+        result = {
+            "total_score": total_score,
+            "domain_scores": domain_scores,
+            "impairment_level": impairment_level,
+            "domain_impairments": domain_impairments
+        }
+        if detail == SUMMARY:
+            result["warnings"] = validation["warnings"]
+            return result
+        
         # Generate interpretation
-        interpretation = self._generate_interpretation(
+        result["interpretation"] = self._generate_interpretation(
             total_score,
             domain_scores,
             impairment_level,
             domain_impairments,
             answers
         )
-        
-        return {
-            "total_score": total_score,
-            "domain_scores": domain_scores,
-            "impairment_level": impairment_level,
-            "domain_impairments": domain_impairments,
-            "interpretation": interpretation,
-            "warnings": validation["warnings"],
-            "calculation_date": datetime.utcnow().isoformat() + "Z"
-        }
+        result["warnings"] = validation["warnings"]
+        result["calculation_date"] = datetime.utcnow().isoformat() + "Z"
+        return result
     
     def _get_impairment_level(self, total_score: int) -> str:
         """Get overall impairment level based on total score."""
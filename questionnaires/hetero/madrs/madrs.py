@@ -14,13 +14,16 @@ from the past week.
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+from ...detail import NUMERIC, SUMMARY, check_detail
+from ...engine import BatchScoring, ScaleSpec, bands_of, compile_spec, item_ids
+
 
 class MADRSError(Exception):
     """Custom exception for MADRS scale errors."""
     pass
 
 
-class MADRS:
+class MADRS(BatchScoring):
     """
     MADRS - Montgomery-Åsberg Depression Rating Scale
     
@@ -58,6 +61,9 @@ class MADRS:
         (35, 60, "Dépression sévère")
     ]
     
+    # Batch scoring: 10 items (0-6) summed, severity bands from CUTOFFS
+    SCALE = compile_spec(ScaleSpec(items=item_ids(10), min_value=0, max_value=6, bands=bands_of(CUTOFFS)))
+    
     # Remission threshold (commonly used in clinical trials)
     REMISSION_THRESHOLD = 10
     
@@ -434,7 +440,8 @@ class MADRS:
     def calculate_score(
         self,
         answers: Dict[str, int],
-        baseline_score: Optional[int] = None
+        baseline_score: Optional[int] = None,
+        detail: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Calculate MADRS score and interpretation.
@@ -442,6 +449,7 @@ class MADRS:
         Args:
             answers: Dictionary mapping item IDs (q1-q10) to response values (0-6)
             baseline_score: Optional baseline score for calculating % change and response
+            detail: "numeric", "summary" or "full" (default); see questionnaires.detail
         
         Returns:
             Dictionary containing:
@@ -456,7 +464,10 @@ class MADRS:
         
         Raises:
             MADRSError: If validation fails
+            ValueError: If the detail level is unknown
         """
+        detail = check_detail(detail)
+        
         # Validate answers
         validation = self.validate_answers(answers)
         if not validation["valid"]:
@@ -467,9 +478,6 @@ class MADRS:
         # Calculate total score
         total_score = sum(answers.get(f"q{i}", 0) for i in range(1, 11))
         
-        # Get severity category
-        severity = self.get_severity_category(total_score)
-        
         # Check remission
         remission = total_score <= self.REMISSION_THRESHOLD
         
@@ -484,6 +492,19 @@ class MADRS:
                 percent_change = 0.0
                 response = False
         
+        if detail == NUMERIC:
+            return {
+                "total_score": total_score,
+                "item_scores": {f"q{i}": answers.get(f"q{i}", 0) for i in range(1, 11)},
+                "remission": remission,
+                "response": response,
+                "percent_change": percent_change,
+                "baseline_score": baseline_score
+            }
+        
+        # Get severity category
+        severity = self.get_severity_category(total_score)
+        
         # Collect item scores with names
         item_scores = {}
         item_names = [
@@ -505,8 +526,21 @@ class MADRS:
                 "name": name
             }
         
+        result = {
+            "total_score": total_score,
+            "severity": severity,
+            "item_scores": item_scores,
+            "remission": remission,
+            "response": response,
+            "percent_change": percent_change,
+            "baseline_score": baseline_score
+        }
+        if detail == SUMMARY:
+            result["warnings"] = validation["warnings"]
+            return result
+        
         # Generate interpretation
-        interpretation = self._generate_interpretation(
+        result["interpretation"] = self._generate_interpretation(
             total_score,
             severity,
             item_scores,
@@ -515,19 +549,9 @@ class MADRS:
             percent_change,
             baseline_score
         )
-        
-        return {
-            "total_score": total_score,
-            "severity": severity,
-            "item_scores": item_scores,
-            "remission": remission,
-            "response": response,
-            "percent_change": percent_change,
-            "baseline_score": baseline_score,
-            "interpretation": interpretation,
-            "warnings": validation["warnings"],
-            "calculation_date": datetime.utcnow().isoformat() + "Z"
-        }
+        result["warnings"] = validation["warnings"]
+        result["calculation_date"] = datetime.utcnow().isoformat() + "Z"
+        return result
     
     def _generate_interpretation(
         self,
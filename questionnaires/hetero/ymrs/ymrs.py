@@ -15,13 +15,16 @@ patient's behavior during the past 48 hours (or longer depending on clinical con
 from typing import Dict, List, Optional, Any, Tuple, Set
 from datetime import datetime
 
+from ...detail import NUMERIC, SUMMARY, check_detail
+from ...engine import Band, BatchScoring, ScaleSpec, compile_spec, item_ids, items_of
+
 
 class YMRSError(Exception):
     """Custom exception for YMRS scale errors."""
     pass
 
 
-class YMRS:
+class YMRS(BatchScoring):
     """
     YMRS - Young Mania Rating Scale
     
@@ -67,6 +70,19 @@ class YMRS:
     # Remission threshold (commonly used in clinical practice)
     REMISSION_THRESHOLD = 12
     
+    # Batch scoring: 11 items summed, items 5, 6, 8 and 9 rated up to 8
+    SCALE = compile_spec(ScaleSpec(
+        items=item_ids(11),
+        min_value=0,
+        max_value=4,
+        item_max=tuple((item, 8) for item in items_of(sorted(ITEMS_0_TO_8))),
+        bands=(
+            Band(0, CUTOFF_NO_HYPOMANIA, "Pas d'hypomanie"),
+            Band(CUTOFF_HYPOMANIA, CUTOFF_MANIA - 1, "Hypomanie"),
+            Band(CUTOFF_MANIA, 60, "Manie")
+        )
+    ))
+    
     def __init__(self):
         """Initialize the YMRS scale."""
         self.id = "YMRS.fr"
@@ -436,7 +452,8 @@ class YMRS:
     def calculate_score(
         self,
         answers: Dict[str, int],
-        baseline_score: Optional[int] = None
+        baseline_score: Optional[int] = None,
+        detail: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Calculate YMRS score and interpretation.
@@ -444,6 +461,7 @@ class YMRS:
         Args:
             answers: Dictionary mapping item IDs (q1-q11) to response values
             baseline_score: Optional baseline score for calculating change
+            detail: "numeric", "summary" or "full" (default); see questionnaires.detail
         
         Returns:
             Dictionary containing:
@@ -457,7 +475,10 @@ class YMRS:
         
         Raises:
             YMRSError: If validation fails
+            ValueError: If the detail level is unknown
         """
+        detail = check_detail(detail)
+        
         # Validate answers
         validation = self.validate_answers(answers)
         if not validation["valid"]:
@@ -468,9 +489,6 @@ class YMRS:
         # Calculate total score
         total_score = sum(answers.get(f"q{i}", 0) for i in range(1, 12))
         
-        # Get severity category
-        severity = self.get_severity_category(total_score)
-        
         # Check remission
         remission = total_score < self.REMISSION_THRESHOLD
         
@@ -479,6 +497,18 @@ class YMRS:
         if baseline_score is not None and baseline_score > 0:
             percent_change = round(((baseline_score - total_score) / baseline_score) * 100, 1)
         
+        if detail == NUMERIC:
+            return {
+                "total_score": total_score,
+                "item_scores": {f"q{i}": answers.get(f"q{i}", 0) for i in range(1, 12)},
+                "remission": remission,
+                "percent_change": percent_change,
+                "baseline_score": baseline_score
+            }
+        
+        # Get severity category
+        severity = self.get_severity_category(total_score)
+        
         # Collect item scores with names
         item_names = {
             "q1": "Élévation de l'humeur",
@@ -504,8 +534,20 @@ class YMRS:
                 "name": item_names[item_id]
             }
         
+        result = {
+            "total_score": total_score,
+            "severity": severity,
+            "item_scores": item_scores,
+            "remission": remission,
+            "percent_change": percent_change,
+            "baseline_score": baseline_score
+        }
+        if detail == SUMMARY:
+            result["warnings"] = validation["warnings"]
+            return result
+        
         # Generate interpretation
-        interpretation = self._generate_interpretation(
+        result["interpretation"] = self._generate_interpretation(
             total_score,
             severity,
             item_scores,
@@ -513,18 +555,9 @@ class YMRS:
             percent_change,
             baseline_score
         )
-        
-        return {
-            "total_score": total_score,
-            "severity": severity,
-            "item_scores": item_scores,
-            "remission": remission,
-            "percent_change": percent_change,
-            "baseline_score": baseline_score,
-            "interpretation": interpretation,
-            "warnings": validation["warnings"],
-            "calculation_date": datetime.utcnow().isoformat() + "Z"
-        }
+        result["warnings"] = validation["warnings"]
+        result["calculation_date"] = datetime.utcnow().isoformat() + "Z"
+        return result
     
     def _generate_interpretation(
         self,
@@ -621,3 +621,22 @@ class TestAIMShortEdgeCases:
             assert item_score["scored"] == 3
             assert item_score["reversed"] is False
 
+
+
+class TestAIMShortBatch:
+    """Test AIM-short batch scoring."""
+    
+    def test_batch_matches_calculate_score(self):
+        """Test batch totals are mean scores and severities are the score categories."""
+        np = pytest.importorskip("numpy")
+        aim = AIMShort()
+        rng = np.random.default_rng(0)
+        rows = rng.integers(1, 7, size=(200, 20))
+        rows[0] = 1
+        rows[1] = 6
+        batch = aim.score_batch(rows)
+        assert batch.valid.all()
+        for index, row in enumerate(rows.tolist()):
+            result = aim.calculate_score(dict(zip(aim.SCALE.items, row)))
+            assert round(float(batch.total[index]), 2) == result["mean_score"]
+            assert batch.severity_labels[batch.severity[index]] == result["category"]
@@ -0,0 +1,1064 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the FastAPI application (routes, registry and response caching)
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.dependencies import get_registry
+from api.schemas import QuestionnaireDetail
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Fixture providing a test client for the API"""
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def registry():
+    """Fixture providing the global questionnaire registry"""
+    return get_registry()
+
+
+class TestQuestionnaireStructure:
+    """Test the pre-rendered GET /questionnaires/{id} endpoint"""
+
+    @pytest.mark.parametrize("category", ["auto", "hetero"])
+    def test_structure_matches_questionnaire(self, client, registry, category):
+        """Test pre-rendered bodies match the live questionnaire structure"""
+        for q_id, q_instance in registry.list_questionnaires(category).items():
+            response = client.get(f"/api/{category}/questionnaires/{q_id}")
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/json"
+
+            expected = QuestionnaireDetail(**q_instance.get_full_questionnaire())
+            assert response.json() == json.loads(json.dumps(expected.model_dump(mode="json")))
+
+    def test_strong_etag(self, client):
+        """Test structures are served with a strong, stable ETag"""
+        first = client.get("/api/auto/questionnaires/QIDS-SR16.fr")
+        second = client.get("/api/auto/questionnaires/QIDS-SR16.fr")
+        etag = first.headers["etag"]
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == second.headers["etag"]
+
+    def test_gender_variants(self, client):
+        """Test PRISE-M gender variants are rendered separately"""
+        female = client.get("/api/auto/questionnaires/PRISE-M.fr", params={"gender": "f"})
+        male = client.get("/api/auto/questionnaires/PRISE-M.fr", params={"gender": "M"})
+        unfiltered = client.get("/api/auto/questionnaires/PRISE-M.fr")
+
+        female_ids = {q["id"] for q in female.json()["questions"]}
+        male_ids = {q["id"] for q in male.json()["questions"]}
+        assert "q20" in female_ids and "q25" not in female_ids
+        assert "q25" in male_ids and "q20" not in male_ids
+        assert len(unfiltered.json()["questions"]) == 32
+        assert len({female.headers["etag"], male.headers["etag"], unfiltered.headers["etag"]}) == 3
+
+    def test_gender_ignored_without_variants(self, client):
+        """Test gender is ignored by questionnaires without branching on it"""
+        plain = client.get("/api/auto/questionnaires/QIDS-SR16.fr")
+        with_gender = client.get("/api/auto/questionnaires/QIDS-SR16.fr", params={"gender": "F"})
+        assert with_gender.status_code == 200
+        assert with_gender.content == plain.content
+
+    def test_not_found(self, client):
+        """Test unknown questionnaire returns 404"""
+        response = client.get("/api/auto/questionnaires/UNKNOWN.fr")
+        assert response.status_code == 404
+        assert "UNKNOWN.fr" in response.json()["detail"]
+
+
+class TestConditionalRequests:
+    """Test ETag / If-None-Match / Cache-Control handling on read endpoints"""
+
+    READ_ENDPOINTS = [
+        "/api/auto/questionnaires",
+        "/api/hetero/questionnaires",
+        "/api/auto/questionnaires/QIDS-SR16.fr/metadata",
+        "/api/hetero/questionnaires/MADRS.fr/metadata",
+        "/api/auto/questionnaires/EQ-5D-5L.fr/profiles",
+        "/api/auto/questionnaires/EQ-5D-5L.fr/profiles?value_set=FR",
+        "/api/auto/questionnaires/PRISE-M.fr?gender=F",
+        "/api/hetero/questionnaires/CGI.fr",
+    ]
+
+    @pytest.mark.parametrize("url", READ_ENDPOINTS)
+    def test_not_modified(self, client, url):
+        """Test matching If-None-Match returns 304 without a body"""
+        first = client.get(url)
+        assert first.status_code == 200
+        assert "cache-control" in first.headers
+
+        second = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == first.headers["etag"]
+
+    def test_stale_etag_returns_body(self, client):
+        """Test non-matching If-None-Match returns the full body"""
+        response = client.get(
+            "/api/auto/questionnaires/QIDS-SR16.fr",
+            headers={"If-None-Match": '"stale"'}
+        )
+        assert response.status_code == 200
+        assert response.json()["metadata"]["id"] == "QIDS-SR16.fr"
+
+    def test_weak_and_multiple_etags(self, client):
+        """Test weak comparison and ETag lists in If-None-Match"""
+        etag = client.get("/api/auto/questionnaires").headers["etag"]
+        response = client.get(
+            "/api/auto/questionnaires",
+            headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+        assert response.status_code == 304
+
+    def test_wildcard(self, client):
+        """Test If-None-Match: * matches any representation"""
+        response = client.get("/api/hetero/questionnaires", headers={"If-None-Match": "*"})
+        assert response.status_code == 304
+
+    def test_etag_per_representation(self, client):
+        """Test list, metadata and structure carry distinct ETags"""
+        etags = {
+            client.get("/api/auto/questionnaires").headers["etag"],
+            client.get("/api/auto/questionnaires/MDQ.fr/metadata").headers["etag"],
+            client.get("/api/auto/questionnaires/MDQ.fr").headers["etag"],
+            client.get("/api/auto/questionnaires/EQ-5D-5L.fr/metadata").headers["etag"],
+            client.get("/api/auto/questionnaires/EQ-5D-5L.fr/profiles").headers["etag"],
+        }
+        assert len(etags) == 5
+
+    def test_configurable_cache_control(self, client, monkeypatch):
+        """Test Cache-Control comes from QUESTIONNAIRES_CACHE_CONTROL"""
+        from api.config import get_settings
+
+        monkeypatch.setenv("QUESTIONNAIRES_CACHE_CONTROL", "public, max-age=600")
+        get_settings.cache_clear()
+        try:
+            response = client.get("/api/auto/questionnaires/ASRM.fr/metadata")
+            assert response.headers["cache-control"] == "public, max-age=600"
+        finally:
+            monkeypatch.delenv("QUESTIONNAIRES_CACHE_CONTROL")
+            get_settings.cache_clear()
+
+
+class TestSubmitBatch:
+    """Test the POST /questionnaires/{id}/submit-batch endpoints"""
+
+    def test_batch_matches_single_submits(self, client):
+        """Test each batch result equals the single-submit score data"""
+        items = [
+            {"answers": {f"q{i}": 0 for i in range(1, 17)}},
+            {"answers": {f"q{i}": (i % 4) for i in range(1, 17)}},
+        ]
+        response = client.post("/api/auto/questionnaires/QIDS-SR16.fr/submit-batch", json={"items": items})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2 and data["succeeded"] == 2 and data["failed"] == 0
+
+        for item, result in zip(items, data["results"]):
+            single = client.post("/api/auto/questionnaires/QIDS-SR16.fr/submit", json=item).json()
+            assert result["success"] is True
+            assert result["score_data"] == single["score_data"]
+
+    def test_per_item_errors(self, client):
+        """Test a failing item does not fail the batch"""
+        items = [
+            {"answers": {f"q{i}": 1 for i in range(1, 17)}},
+            {"answers": {"q1": 9}},
+        ]
+        data = client.post("/api/auto/questionnaires/QIDS-SR16.fr/submit-batch", json={"items": items}).json()
+        assert data["succeeded"] == 1 and data["failed"] == 1
+        assert data["results"][1]["index"] == 1
+        assert data["results"][1]["success"] is False
+        assert data["results"][1]["score_data"] is None
+        assert data["results"][1]["error"]
+
+    def test_per_item_demographics(self, client):
+        """Test PRISE-M uses each item's own gender"""
+        answers = {f"q{i}": 0 for i in range(1, 33)}
+        answers["q20"] = 2
+        answers["q25"] = 1
+        items = [
+            {"answers": answers, "demographics": {"gender": "F"}},
+            {"answers": answers, "demographics": {"gender": "M"}},
+            {"answers": answers},
+        ]
+        data = client.post("/api/auto/questionnaires/PRISE-M.fr/submit-batch", json={"items": items}).json()
+        female, male, missing = data["results"]
+        assert female["score_data"]["total_score"] == 2
+        assert male["score_data"]["total_score"] == 1
+        assert missing["success"] is False
+
+    def test_per_item_baseline_score(self, client):
+        """Test MADRS receives each item's baseline score"""
+        answers = {f"q{i}": 1 for i in range(1, 11)}
+        items = [{"answers": answers, "baseline_score": 40}, {"answers": answers}]
+        data = client.post("/api/hetero/questionnaires/MADRS.fr/submit-batch", json={"items": items}).json()
+        assert data["results"][0]["score_data"]["baseline_score"] == 40
+        assert data["results"][0]["score_data"]["percent_change"] is not None
+        assert data["results"][1]["score_data"]["baseline_score"] is None
+
+    def test_batch_size_limit(self, client, monkeypatch):
+        """Test batches above QUESTIONNAIRES_MAX_BATCH_SIZE are rejected"""
+        from api.config import get_settings
+
+        monkeypatch.setenv("QUESTIONNAIRES_MAX_BATCH_SIZE", "1")
+        get_settings.cache_clear()
+        try:
+            items = [{"answers": {"q1": 0}}, {"answers": {"q1": 0}}]
+            response = client.post("/api/auto/questionnaires/QIDS-SR16.fr/submit-batch", json={"items": items})
+            assert response.status_code == 413
+        finally:
+            monkeypatch.delenv("QUESTIONNAIRES_MAX_BATCH_SIZE")
+            get_settings.cache_clear()
+
+    def test_not_found(self, client):
+        """Test unknown questionnaire returns 404"""
+        response = client.post("/api/hetero/questionnaires/UNKNOWN.fr/submit-batch", json={"items": []})
+        assert response.status_code == 404
+
+
+class TestSubmitStream:
+    """Test the POST /questionnaires/{id}/submit-stream NDJSON endpoints"""
+
+    URL = "/api/auto/questionnaires/QIDS-SR16.fr/submit-stream"
+
+    @staticmethod
+    def _records(response):
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    def test_stream_scores_each_record(self, client):
+        """Test one result line per record, in order, with ids echoed"""
+        lines = [
+            json.dumps({"id": f"r{n}", "answers": {f"q{i}": n % 4 for i in range(1, 17)}})
+            for n in range(5)
+        ]
+        response = client.post(self.URL, content="\n".join(lines) + "\n")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        records = self._records(response)
+        assert [r["id"] for r in records] == [f"r{n}" for n in range(5)]
+        assert [r["line"] for r in records] == [1, 2, 3, 4, 5]
+        assert all(r["success"] for r in records)
+
+    def test_records_split_across_chunks(self, client):
+        """Test records spanning request body chunks are reassembled"""
+        line = (json.dumps({"answers": {f"q{i}": 1 for i in range(1, 17)}}) + "\n").encode()
+
+        def body():
+            for _ in range(3):
+                yield line[:25]
+                yield line[25:]
+
+        records = self._records(client.post(self.URL, content=body()))
+        assert len(records) == 3
+        assert all(r["success"] for r in records)
+
+    def test_per_line_errors(self, client):
+        """Test invalid JSON, invalid records and invalid answers are reported per line"""
+        lines = [
+            "not json",
+            "",
+            json.dumps({"answers": "nope"}),
+            json.dumps({"answers": {"q1": 9}}),
+            json.dumps({"answers": {f"q{i}": 0 for i in range(1, 17)}}),
+        ]
+        records = self._records(client.post(self.URL, content="\n".join(lines)))
+        assert [r["line"] for r in records] == [1, 3, 4, 5]
+        assert [r["success"] for r in records] == [False, False, False, True]
+        assert records[0]["error"].startswith("Invalid JSON")
+        assert records[1]["error"].startswith("Invalid record")
+
+    def test_oversized_record(self, client, monkeypatch):
+        """Test records above QUESTIONNAIRES_MAX_STREAM_LINE_BYTES are skipped"""
+        from api.config import get_settings
+
+        monkeypatch.setenv("QUESTIONNAIRES_MAX_STREAM_LINE_BYTES", "200")
+        get_settings.cache_clear()
+        try:
+            valid = json.dumps({"answers": {f"q{i}": 0 for i in range(1, 17)}})
+            oversized = json.dumps({"answers": {f"q{i}": 0 for i in range(1, 17)}, "padding": "x" * 500})
+            records = self._records(client.post(self.URL, content="\n".join([oversized, valid])))
+        finally:
+            monkeypatch.delenv("QUESTIONNAIRES_MAX_STREAM_LINE_BYTES")
+            get_settings.cache_clear()
+
+        assert records[0]["success"] is False and "exceeds" in records[0]["error"]
+        assert records[1]["success"] is True
+
+    def test_hetero_context(self, client):
+        """Test hetero records carry their own baseline score"""
+        line = json.dumps({"answers": {f"q{i}": 2 for i in range(1, 11)}, "baseline_score": 40})
+        records = self._records(client.post("/api/hetero/questionnaires/MADRS.fr/submit-stream", content=line))
+        assert records[0]["score_data"]["baseline_score"] == 40
+
+    def test_not_found(self, client):
+        """Test unknown questionnaire returns 404"""
+        response = client.post("/api/auto/questionnaires/UNKNOWN.fr/submit-stream", content="")
+        assert response.status_code == 404
+
+
+class TestScoringDispatch:
+    """Test scoring adapters resolved at registration time"""
+
+    def test_adapters_resolved_at_registration(self, registry):
+        """Test every questionnaire has an adapter with its method and context"""
+        for category in ("auto", "hetero"):
+            for q_id in registry.list_questionnaires(category):
+                assert registry.get_adapter(category, q_id).supports_scoring
+        assert registry.get_adapter("auto", "MDQ.fr").score_method.__name__ == "calculate_screening"
+        assert registry.get_adapter("auto", "PRISE-M.fr").score_context == ("gender",)
+        assert registry.get_adapter("hetero", "MADRS.fr").score_context == ("baseline_score",)
+        assert registry.get_adapter("hetero", "CGI.fr").score_context == ("visit_type",)
+        assert registry.get_adapter("auto", "QIDS-SR16.fr").score_context == ()
+        assert registry.get_adapter("auto", "UNKNOWN.fr") is None
+
+    def test_hetero_submit_receives_baseline_score(self, client):
+        """Test single hetero submits pass baseline_score to MADRS"""
+        answers = {f"q{i}": 1 for i in range(1, 11)}
+        response = client.post(
+            "/api/hetero/questionnaires/MADRS.fr/submit",
+            json={"answers": answers, "baseline_score": 40}
+        )
+        assert response.status_code == 200
+        assert response.json()["score_data"]["baseline_score"] == 40
+        assert response.json()["score_data"]["percent_change"] == 75.0
+
+    def test_submit_value_sets(self, client, registry):
+        """Test EQ-5D-5L submits select the value set(s) of the utility index"""
+        assert registry.get_adapter("auto", "EQ-5D-5L.fr").score_context == ("value_set",)
+        url = "/api/auto/questionnaires/EQ-5D-5L.fr/submit"
+        answers = {"q1": 2, "q2": 1, "q3": 3, "q4": 4, "q5": 1, "vas": 75}
+        default = client.post(url, json={"answers": answers}).json()["score_data"]
+        assert default["index_value"] == 0.474
+        assert default["index_values"] is None
+        selected = client.post(url, json={"answers": answers, "value_set": ["FR"]}).json()["score_data"]
+        assert selected["index_values"] == {"FR": 0.474}
+        unknown = client.post(url, json={"answers": answers, "value_set": "ZZ"})
+        assert unknown.status_code == 400
+        assert "ZZ" in unknown.json()["detail"]
+
+    def test_validate_passes_gender(self, client):
+        """Test PRISE-M validation receives the respondent's gender"""
+        answers = {f"q{i}": 0 for i in range(1, 33)}
+        with_gender = client.post(
+            "/api/auto/questionnaires/PRISE-M.fr/validate",
+            json={"answers": answers, "demographics": {"gender": "F"}}
+        ).json()
+        without_gender = client.post(
+            "/api/auto/questionnaires/PRISE-M.fr/validate",
+            json={"answers": answers}
+        ).json()
+        assert with_gender["valid"] is True
+        assert without_gender["valid"] is False
+
+    def test_validate_dict_results(self, client):
+        """Test questionnaires returning validation dictionaries are normalized"""
+        response = client.post("/api/auto/questionnaires/STAI-YA.fr/validate", json={"answers": {"q1": 1}})
+        assert response.status_code == 200
+        assert response.json()["valid"] is False
+        assert response.json()["errors"]
+
+
+class TestFastResponses:
+    """Test the opt-in fast response mode (QUESTIONNAIRES_FAST_RESPONSES)"""
+
+    MADRS = {"answers": {f"q{i}": 3 for i in range(1, 11)}, "baseline_score": 40}
+    PRISE_M = {"answers": {f"q{i}": 1 for i in range(1, 33)}, "demographics": {"gender": "F"}}
+
+    @pytest.fixture
+    def fast_mode(self, monkeypatch):
+        from api.config import get_settings
+
+        monkeypatch.setenv("QUESTIONNAIRES_FAST_RESPONSES", "1")
+        get_settings.cache_clear()
+        yield
+        monkeypatch.delenv("QUESTIONNAIRES_FAST_RESPONSES")
+        get_settings.cache_clear()
+
+    def _post_all(self, client):
+        return [
+            client.post("/api/hetero/questionnaires/MADRS.fr/submit", json=self.MADRS),
+            client.post("/api/auto/questionnaires/PRISE-M.fr/submit", json=self.PRISE_M),
+            client.post("/api/hetero/questionnaires/MADRS.fr/submit-batch", json={"items": [self.MADRS, {"answers": {}}]}),
+            client.post("/api/hetero/questionnaires/MADRS.fr/submit-stream", content=json.dumps(self.MADRS) + "\n"),
+        ]
+
+    @staticmethod
+    def _normalize(data):
+        # calculation_date is a timestamp and differs between calls
+        if isinstance(data, dict):
+            return {key: TestFastResponses._normalize(value) for key, value in data.items() if key != "calculation_date"}
+        if isinstance(data, list):
+            return [TestFastResponses._normalize(value) for value in data]
+        return data
+
+    def test_same_documents_as_default_mode(self, client, monkeypatch):
+        """Test fast responses carry the same JSON as the model-validated path"""
+        from api.config import get_settings
+
+        default = self._post_all(client)
+        monkeypatch.setenv("QUESTIONNAIRES_FAST_RESPONSES", "1")
+        get_settings.cache_clear()
+        try:
+            fast = self._post_all(client)
+        finally:
+            monkeypatch.delenv("QUESTIONNAIRES_FAST_RESPONSES")
+            get_settings.cache_clear()
+
+        for fast_response, default_response in zip(fast, default):
+            assert fast_response.status_code == default_response.status_code == 200
+            assert fast_response.headers["content-type"] == default_response.headers["content-type"]
+            fast_lines = [json.loads(line) for line in fast_response.text.splitlines()]
+            default_lines = [json.loads(line) for line in default_response.text.splitlines()]
+            assert self._normalize(fast_lines) == self._normalize(default_lines)
+
+    def test_errors_unchanged(self, client, fast_mode):
+        """Test scoring errors are still reported as 400"""
+        response = client.post("/api/hetero/questionnaires/MADRS.fr/submit", json={"answers": {"q1": 99}})
+        assert response.status_code == 400
+
+    def test_openapi_schema_preserved(self, client, fast_mode):
+        """Test the submit endpoints still document ScoreResponse"""
+        schema = client.get("/openapi.json").json()
+        submit = schema["paths"]["/api/hetero/questionnaires/{questionnaire_id}/submit"]["post"]
+        content = submit["responses"]["200"]["content"]["application/json"]["schema"]
+        assert content["$ref"].endswith("/ScoreResponse")
+
+    def test_fast_dumps_fallback(self, monkeypatch):
+        """Test fast_dumps produces the same document without orjson"""
+        from api import encoding
+
+        content = {"score": 1.5, "text": "Dépression légère", "items": [1, 2, None]}
+        expected = encoding.dumps(content)
+        assert json.loads(encoding.fast_dumps(content)) == json.loads(expected)
+        monkeypatch.setattr(encoding, "orjson", None)
+        assert encoding.fast_dumps(content) == expected
+
+
+class TestDetailLevels:
+    """Test the numeric and summary result detail levels"""
+
+    MADRS = {"answers": {f"q{i}": 3 for i in range(1, 11)}, "baseline_score": 40}
+
+    def test_levels_trim_full_result(self, registry):
+        """Test summary drops only the interpretation and date, and numeric keeps only scores"""
+        from api.synthetic import AnswerGenerator
+
+        for questionnaire_id in registry.questionnaire_ids("hetero"):
+            adapter = registry.get_adapter("hetero", questionnaire_id)
+            assert adapter.accepts_detail, questionnaire_id
+            for submission in AnswerGenerator(adapter.questionnaire, seed=0).valid(20):
+                context = {key: submission.get(key) for key in ("baseline_score", "visit_type")}
+                full = adapter.score(submission["answers"], **context)
+                summary = adapter.score(submission["answers"], detail="summary", **context)
+                numeric = adapter.score(submission["answers"], detail="numeric", **context)
+                assert summary == {key: value for key, value in full.items() if key not in ("interpretation", "calculation_date")}
+                assert set(numeric) < set(summary)
+                for key, value in numeric.items():
+                    if key in ("item_scores", "domain_scores"):
+                        assert value == {item: score["score"] for item, score in full[key].items()}
+                    else:
+                        assert value == full[key], (questionnaire_id, key)
+
+    def test_submit_detail(self, client):
+        """Test submit and submit-batch pass the detail level through"""
+        url = "/api/hetero/questionnaires/MADRS.fr"
+        numeric = client.post(f"{url}/submit", json={**self.MADRS, "detail": "numeric"}).json()["score_data"]
+        assert numeric == {
+            "total_score": 30,
+            "item_scores": {f"q{i}": 3 for i in range(1, 11)},
+            "remission": False,
+            "response": False,
+            "percent_change": 25.0,
+            "baseline_score": 40
+        }
+        batch = client.post(f"{url}/submit-batch", json={"items": [self.MADRS, {**self.MADRS, "detail": "summary"}]}).json()
+        assert "interpretation" in batch["results"][0]["score_data"]
+        assert "interpretation" not in batch["results"][1]["score_data"]
+        assert batch["results"][1]["score_data"]["severity"] == "Dépression modérée"
+
+    def test_unknown_detail_rejected(self, client):
+        """Test unknown detail levels fail request validation"""
+        response = client.post("/api/hetero/questionnaires/MADRS.fr/submit", json={**self.MADRS, "detail": "brief"})
+        assert response.status_code == 422
+
+    def test_instruments_without_levels_return_full_result(self, client):
+        """Test the detail level is ignored by instruments that do not support it"""
+        response = client.post(
+            "/api/auto/questionnaires/STAI-YA.fr/submit",
+            json={"answers": {f"q{i}": 2 for i in range(1, 21)}, "detail": "numeric"}
+        )
+        assert response.status_code == 200
+        assert "interpretation" in response.json()["score_data"]
+
+
+class TestProfileTable:
+    """Test the precomputed EQ-5D-5L profile table endpoint"""
+
+    URL = "/api/auto/questionnaires/EQ-5D-5L.fr/profiles"
+
+    def test_profile_table(self, client):
+        """Test the whole table is served with an ETag and revalidates"""
+        response = client.get(self.URL)
+        assert response.status_code == 200
+        table = response.json()
+        assert len(table["profiles"]) == 3125
+        assert table["profiles"][690] == {
+            "profile": "21341", "code": 690, "levels": [2, 1, 3, 4, 1], "problems": 3, "severe": 1,
+            "level_sum": 11, "misery_index": 6,
+            "interpretation": "1 dimension(s) avec problèmes sévères ou extrêmes.", "index_value": 0.474
+        }
+        revalidated = client.get(self.URL, headers={"If-None-Match": response.headers["etag"]})
+        assert revalidated.status_code == 304
+
+    def test_unsupported_and_unknown(self, client):
+        """Test questionnaires without profile table and unknown value sets"""
+        assert client.get("/api/auto/questionnaires/CTQ.fr/profiles").status_code == 404
+        assert client.get("/api/auto/questionnaires/UNKNOWN.fr/profiles").status_code == 404
+        assert client.get(self.URL, params={"value_set": "ZZ"}).status_code == 400
+
+
+class TestLazyRegistry:
+    """Test on-demand questionnaire loading in QuestionnaireRegistry"""
+
+    def test_nothing_loaded_up_front(self):
+        """Test a new registry knows every id without loading any questionnaire"""
+        from api.dependencies import QuestionnaireRegistry
+
+        lazy = QuestionnaireRegistry()
+        assert "QIDS-SR16.fr" in lazy.questionnaire_ids("auto")
+        assert "MADRS.fr" in lazy.questionnaire_ids("hetero")
+        assert lazy.questionnaire_ids("unknown") == []
+        assert not any(
+            lazy.is_loaded(category, q_id)
+            for category in ("auto", "hetero")
+            for q_id in lazy.questionnaire_ids(category)
+        )
+
+    def test_loads_only_requested_questionnaire(self):
+        """Test first use loads a single questionnaire"""
+        from api.dependencies import QuestionnaireRegistry
+
+        lazy = QuestionnaireRegistry()
+        assert lazy.get_adapter("auto", "QIDS-SR16.fr").supports_scoring
+        assert lazy.is_loaded("auto", "QIDS-SR16.fr")
+        assert not lazy.is_loaded("auto", "PSQI.fr")
+        assert lazy.get_adapter("auto", "UNKNOWN.fr") is None
+        assert lazy.get_structure("hetero", "QIDS-SR16.fr") is None
+
+    def test_concurrent_first_use_loads_once(self):
+        """Test concurrent first requests share one instance"""
+        from concurrent.futures import ThreadPoolExecutor
+        from api.dependencies import QuestionnaireRegistry
+
+        lazy = QuestionnaireRegistry()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            instances = list(pool.map(lambda _: lazy.get_questionnaire("hetero", "CGI.fr"), range(32)))
+        assert all(instance is instances[0] for instance in instances)
+
+    def test_preload_matches_lazy(self, registry):
+        """Test warm mode loads everything and renders identical bodies"""
+        from api.dependencies import QuestionnaireRegistry
+
+        warm = QuestionnaireRegistry(preload=True)
+        for category in ("auto", "hetero"):
+            assert all(warm.is_loaded(category, q_id) for q_id in warm.questionnaire_ids(category))
+            assert warm.get_listing(category) == registry.get_listing(category)
+        assert warm.get_structure("auto", "PRISE-M.fr", "F") == registry.get_structure("auto", "PRISE-M.fr", "F")
+
+    def test_app_import_is_lazy(self):
+        """Test importing the application imports no questionnaire module"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; import api.main; "
+            "print(sorted(m for m in sys.modules if m.startswith('questionnaires.')))"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True)
+        assert output.stdout.strip() == "[]"
+
+
+class TestDiscovery:
+    """Test manifest-based questionnaire discovery"""
+
+    ENTRY = {"id": "X.fr", "category": "auto", "module": "my_instruments.x", "class": "X", "name": "X"}
+
+    def test_manifest_matches_live_metadata(self, registry):
+        """Test the built-in manifest is in sync with each questionnaire's metadata"""
+        from api.discovery import LISTING_FIELDS, read_manifest
+
+        for descriptor in read_manifest("questionnaires"):
+            live = descriptor.load().get_metadata()
+            assert descriptor.metadata == {key: live.get(key) for key in LISTING_FIELDS}, descriptor.questionnaire_id
+            assert descriptor.questionnaire_id in registry.questionnaire_ids(descriptor.category)
+
+    def test_listing_loads_nothing(self):
+        """Test listings are rendered from manifest metadata alone"""
+        from api.dependencies import QuestionnaireRegistry
+
+        lazy = QuestionnaireRegistry()
+        items = json.loads(lazy.get_listing("hetero").body)
+        assert {item["id"] for item in items} == set(lazy.questionnaire_ids("hetero"))
+        assert not any(lazy.is_loaded("hetero", q_id) for q_id in lazy.questionnaire_ids("hetero"))
+
+    def test_invalid_entries(self):
+        """Test malformed manifest entries are rejected"""
+        from api.discovery import ManifestError, parse_manifest
+
+        with pytest.raises(ManifestError, match="missing module"):
+            parse_manifest({"questionnaires": [{**self.ENTRY, "module": ""}]}, "test")
+        with pytest.raises(ManifestError, match="unknown category"):
+            parse_manifest({"questionnaires": [{**self.ENTRY, "category": "other"}]}, "test")
+
+    def test_plugin_manifests(self, monkeypatch):
+        """Test entry point manifests are added after the built-in one, without duplicates"""
+        from api import discovery
+
+        plugin = discovery.parse_manifest({"questionnaires": [self.ENTRY]}, "test")
+        builtin = discovery.read_manifest("questionnaires")
+        manifests = {"questionnaires": builtin, "my_instruments": plugin, "clash": builtin[:1]}
+
+        class FakeEntryPoint:
+            def __init__(self, value):
+                self.value = value
+
+        monkeypatch.setattr(discovery, "read_manifest", manifests.__getitem__)
+        monkeypatch.setattr(
+            discovery.importlib_metadata, "entry_points",
+            lambda group: [FakeEntryPoint("my_instruments")]
+        )
+        descriptors = discovery.discover_questionnaires()
+        assert descriptors[-1].questionnaire_id == "X.fr"
+        assert len(descriptors) == len(builtin) + 1
+
+        monkeypatch.setattr(
+            discovery.importlib_metadata, "entry_points",
+            lambda group: [FakeEntryPoint("clash")]
+        )
+        with pytest.raises(discovery.ManifestError, match="already provided"):
+            discovery.discover_questionnaires()
+
+
+class TestProductionProfile:
+    """Test the multi-worker gunicorn profile"""
+
+    def test_preloads_registry_before_fork(self, monkeypatch):
+        """Test the profile preloads the app and every questionnaire in the master"""
+        import os
+        import runpy
+
+        monkeypatch.setenv("WEB_CONCURRENCY", "3")
+        # The profile sets defaults in os.environ: restore it for the tests that follow
+        saved = dict(os.environ)
+        try:
+            os.environ.pop("QUESTIONNAIRES_PRELOAD_QUESTIONNAIRES", None)
+            os.environ.pop("QUESTIONNAIRES_METRICS_DIR", None)
+            config = runpy.run_path(os.path.join(os.path.dirname(os.path.dirname(__file__)), "gunicorn.conf.py"))
+            assert config["preload_app"] is True
+            assert config["workers"] == 3
+            assert config["worker_class"] == "uvicorn.workers.UvicornWorker"
+            assert os.environ["QUESTIONNAIRES_PRELOAD_QUESTIONNAIRES"] == "1"
+            assert os.environ["QUESTIONNAIRES_METRICS_DIR"]
+        finally:
+            os.environ.clear()
+            os.environ.update(saved)
+
+
+class TestStageTiming:
+    """Test per-stage timing of the submit pipeline"""
+
+    MADRS = {"answers": {f"q{i}": 3 for i in range(1, 11)}}
+
+    @pytest.fixture
+    def server_timing(self, monkeypatch):
+        from api.config import get_settings
+        from api.timing import stage_histograms
+
+        monkeypatch.setenv("QUESTIONNAIRES_SERVER_TIMING", "1")
+        get_settings.cache_clear()
+        stage_histograms.reset()
+        yield
+        monkeypatch.delenv("QUESTIONNAIRES_SERVER_TIMING")
+        get_settings.cache_clear()
+        stage_histograms.reset()
+
+    @staticmethod
+    def _stages(response):
+        return {
+            entry.split(";")[0].strip(): float(entry.split("dur=")[1])
+            for entry in response.headers["server-timing"].split(",")
+        }
+
+    def test_disabled_by_default(self, client):
+        """Test no Server-Timing header without opting in"""
+        response = client.post("/api/hetero/questionnaires/MADRS.fr/submit", json=self.MADRS)
+        assert response.status_code == 200
+        assert "server-timing" not in response.headers
+
+    def test_server_timing_header(self, client, server_timing):
+        """Test submit responses carry the stage breakdown"""
+        response = client.post("/api/hetero/questionnaires/MADRS.fr/submit", json=self.MADRS)
+        assert response.status_code == 200
+        stages = self._stages(response)
+        assert list(stages) == ["parse", "validate", "score", "interpretation", "serialize", "encode", "total"]
+        assert sum(value for name, value in stages.items() if name != "total") <= stages["total"] * 1.01
+
+    def test_validate_and_errors_timed(self, client, server_timing):
+        """Test validate requests and failed submits are timed too"""
+        validate = client.post("/api/auto/questionnaires/QIDS-SR16.fr/validate", json={"answers": {}})
+        assert "validate" in self._stages(validate)
+        failed = client.post("/api/hetero/questionnaires/MADRS.fr/submit", json={"answers": {"q1": 99}})
+        assert failed.status_code == 400
+        assert "total" in self._stages(failed)
+
+    def test_histograms(self, client, server_timing):
+        """Test durations are aggregated per questionnaire, endpoint and stage"""
+        for _ in range(3):
+            client.post("/api/hetero/questionnaires/MADRS.fr/submit", json=self.MADRS)
+        client.post("/api/hetero/questionnaires/UNKNOWN.fr/submit", json=self.MADRS)
+        client.post("/api/hetero/questionnaires/bogus/submit", json={"answers": "malformed"})
+
+        timings = client.get("/timings").json()
+        assert list(timings) == ["hetero/MADRS.fr"]
+        total = timings["hetero/MADRS.fr"]["submit"]["total"]
+        assert total["count"] == 3
+        assert sum(total["buckets"].values()) == 3
+        assert timings["hetero/MADRS.fr"]["submit"]["interpretation"]["count"] == 3
+
+
+class TestMetrics:
+    """Test the Prometheus /metrics endpoint"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_metrics(self):
+        from api.metrics import metrics
+
+        metrics.reset()
+        yield
+        metrics.reset()
+
+    @staticmethod
+    def _samples(text):
+        samples = {}
+        for line in text.splitlines():
+            if line and not line.startswith("#"):
+                name, value = line.rsplit(" ", 1)
+                samples[name] = float(value)
+        return samples
+
+    def test_exposition_format(self, client):
+        """Test /metrics is served as Prometheus text with HELP/TYPE lines"""
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE questionnaires_http_requests_total counter" in response.text
+        assert "# TYPE questionnaires_http_request_duration_seconds histogram" in response.text
+
+    def test_requests_and_outcomes(self, client):
+        """Test requests, errors and validation failures are counted per questionnaire"""
+        answers = {f"q{i}": 1 for i in range(1, 11)}
+        client.post("/api/hetero/questionnaires/MADRS.fr/submit", json={"answers": answers})
+        client.post("/api/hetero/questionnaires/MADRS.fr/submit", json={"answers": {"q1": 99}})
+        client.post("/api/auto/questionnaires/QIDS-SR16.fr/validate", json={"answers": {}})
+        client.post("/api/hetero/questionnaires/MADRS.fr/submit-batch", json={"items": [{"answers": answers}, {"answers": {}}]})
+        client.get("/api/auto/questionnaires/UNKNOWN.fr")
+
+        samples = self._samples(client.get("/metrics").text)
+        labels = 'category="hetero",questionnaire_id="MADRS.fr",endpoint="submit"'
+        assert samples[f'questionnaires_http_requests_total{{{labels},status="200"}}'] == 1
+        assert samples[f'questionnaires_http_requests_total{{{labels},status="400"}}'] == 1
+        assert samples[f'questionnaires_scoring_outcomes_total{{{labels},outcome="failed"}}'] == 1
+        assert samples[f'questionnaires_http_request_duration_seconds_count{{{labels}}}'] == 2
+        assert samples[f'questionnaires_http_request_duration_seconds_bucket{{{labels},le="+Inf"}}'] == 2
+
+        batch = 'category="hetero",questionnaire_id="MADRS.fr",endpoint="submit-batch"'
+        assert samples[f'questionnaires_scoring_outcomes_total{{{batch},outcome="scored"}}'] == 1
+        assert samples[f'questionnaires_scoring_outcomes_total{{{batch},outcome="failed"}}'] == 1
+        validate = 'category="auto",questionnaire_id="QIDS-SR16.fr",endpoint="validate"'
+        assert samples[f'questionnaires_scoring_outcomes_total{{{validate},outcome="invalid"}}'] == 1
+        unknown = 'category="auto",questionnaire_id="_unknown",endpoint="structure",status="404"'
+        assert samples[f"questionnaires_http_requests_total{{{unknown}}}"] == 1
+
+    def test_profile_table_endpoint(self, client):
+        """Test profile table requests get their own endpoint label"""
+        client.get("/api/auto/questionnaires/EQ-5D-5L.fr/profiles")
+
+        samples = self._samples(client.get("/metrics").text)
+        labels = 'category="auto",questionnaire_id="EQ-5D-5L.fr",endpoint="profiles"'
+        assert samples[f'questionnaires_http_requests_total{{{labels},status="200"}}'] == 1
+        assert samples[f'questionnaires_http_request_duration_seconds_count{{{labels}}}'] == 1
+
+    def test_unknown_ids_share_one_label(self, client):
+        """Test made-up ids are labelled _unknown even when rejected before the handler (422)"""
+        for index in range(3):
+            response = client.post(f"/api/auto/questionnaires/bogus{index}/submit", json={"answers": "malformed"})
+            assert response.status_code == 422
+
+        text = client.get("/metrics").text
+        assert "bogus" not in text
+        unknown = 'category="auto",questionnaire_id="_unknown",endpoint="submit",status="422"'
+        assert self._samples(text)[f"questionnaires_http_requests_total{{{unknown}}}"] == 3
+
+    def test_multi_worker_aggregation(self, tmp_path):
+        """Test snapshots written by several workers are summed"""
+        import json as json_module
+        from api.metrics import collect, metrics, render_prometheus
+
+        labels = ["auto", "QIDS-SR16.fr", "submit", "200"]
+        other_worker = {"counters": [["questionnaires_http_requests_total", labels, 5]], "histograms": []}
+        (tmp_path / "metrics-1.json").write_text(json_module.dumps(other_worker))
+        metrics.inc("questionnaires_http_requests_total", tuple(labels), 2)
+
+        samples = self._samples(render_prometheus(collect(str(tmp_path))))
+        key = 'questionnaires_http_requests_total{category="auto",questionnaire_id="QIDS-SR16.fr",endpoint="submit",status="200"}'
+        assert samples[key] == 7
+
+
+class TestProfiling:
+    """Test opt-in cProfile profiling of selected requests"""
+
+    MADRS = {"answers": {f"q{i}": 3 for i in range(1, 11)}}
+
+    @pytest.fixture
+    def profiling(self, monkeypatch, tmp_path):
+        from api.config import get_settings
+
+        def configure(**settings):
+            monkeypatch.setenv("QUESTIONNAIRES_PROFILE_DIR", str(tmp_path))
+            for name, value in settings.items():
+                monkeypatch.setenv(f"QUESTIONNAIRES_{name.upper()}", value)
+            get_settings.cache_clear()
+            return tmp_path
+
+        yield configure
+        monkeypatch.undo()
+        get_settings.cache_clear()
+
+    def test_disabled_by_default(self, client, profiling):
+        """Test nothing is profiled without a trigger"""
+        directory = profiling()
+        client.post("/api/hetero/questionnaires/MADRS.fr/submit", json=self.MADRS)
+        assert list(directory.iterdir()) == []
+
+    def test_questionnaire_and_header_triggers(self, client, profiling):
+        """Test requests for listed questionnaires, or carrying the header, are profiled"""
+        directory = profiling(profile_questionnaires="QIDS-SR16.fr, MADRS.fr", profile_header="X-Profile")
+        client.post("/api/hetero/questionnaires/MADRS.fr/submit", json=self.MADRS)
+        client.post("/api/auto/questionnaires/MDQ.fr/validate", json={"answers": {}})
+        client.post("/api/auto/questionnaires/MDQ.fr/validate", json={"answers": {}}, headers={"X-Profile": "1"})
+        client.post("/api/hetero/questionnaires/UNKNOWN.fr/submit", json=self.MADRS, headers={"X-Profile": "1"})
+
+        names = sorted(path.name for path in directory.iterdir())
+        assert len(names) == 2
+        assert any("-hetero-MADRS.fr-submit-" in name for name in names)
+        assert any("-auto-MDQ.fr-validate-" in name for name in names)
+
+    def test_profile_limited_to_packages(self, client, profiling):
+        """Test written profiles load with pstats and only keep package code and its direct callees"""
+        import os
+        import pstats
+
+        directory = profiling(profile_sample_rate="1")
+        client.post("/api/hetero/questionnaires/MADRS.fr/submit", json=self.MADRS)
+        (path,) = directory.iterdir()
+
+        stats = pstats.Stats(str(path)).stats
+        packages = tuple(os.path.join(os.path.dirname(os.path.dirname(__file__)), name) for name in ("api", "questionnaires"))
+        assert any(key[2] == "calculate_score" for key in stats)
+        for key, (cc, nc, tt, ct, callers) in stats.items():
+            if not os.path.abspath(key[0]).startswith(packages):
+                assert callers and all(os.path.abspath(caller[0]).startswith(packages) for caller in callers)
+
+    def test_rotation(self, client, profiling):
+        """Test only the newest profile_max_files profiles are kept"""
+        directory = profiling(profile_sample_rate="1", profile_max_files="2")
+        for _ in range(4):
+            client.post("/api/hetero/questionnaires/MADRS.fr/submit-batch", json={"items": [self.MADRS]})
+        assert len(list(directory.iterdir())) == 2
+
+
+class TestSlowRequestLog:
+    """Test the log of validate/submit requests over the latency budget"""
+
+    PSQI = {"answers": {"q1": "23:15", "q2": 20, "q3": "07h00", "q4": 7.5, "q6": 1}}
+
+    @pytest.fixture
+    def budget(self, monkeypatch):
+        from api.config import get_settings
+
+        def configure(milliseconds):
+            monkeypatch.setenv("QUESTIONNAIRES_SLOW_REQUEST_MS", milliseconds)
+            get_settings.cache_clear()
+
+        yield configure
+        monkeypatch.undo()
+        get_settings.cache_clear()
+
+    @staticmethod
+    def _records(caplog):
+        return [json.loads(record.getMessage()) for record in caplog.records if record.name == "api.slow_requests"]
+
+    def test_slow_request_logged_without_values(self, client, budget, caplog):
+        """Test requests over budget log stage timings and answer shapes, never values"""
+        budget("0")
+        response = client.post("/api/auto/questionnaires/PSQI.fr/validate", json=self.PSQI)
+
+        (record,) = self._records(caplog)
+        assert record["questionnaire_id"] == "PSQI.fr"
+        assert record["endpoint"] == "validate"
+        assert record["response_bytes"] == len(response.content)
+        assert {"parse", "validate", "total"} <= set(record["stages"])
+        assert record["answers"] == 5
+        assert record["shape"] == {"q1": "str(9:9)", "q2": "int", "q3": "str(9a9)", "q4": "float", "q6": "int"}
+        for value in ("23:15", "07h00", "7.5"):
+            assert value not in json.dumps(record)
+
+    def test_batch_shapes(self, client, budget, caplog):
+        """Test batches report the number of answer sets and distinct shapes"""
+        budget("0")
+        items = [self.PSQI, self.PSQI, {"answers": {"q1": "11pm"}}]
+        client.post("/api/auto/questionnaires/PSQI.fr/submit-batch", json={"items": items})
+
+        (record,) = self._records(caplog)
+        assert record["answer_sets"] == 3
+        assert record["distinct_shapes"] == 2
+
+    def test_fast_and_unknown_requests_not_logged(self, client, budget, caplog):
+        """Test requests within budget, and unknown questionnaires, are not logged"""
+        budget("60000")
+        client.post("/api/auto/questionnaires/PSQI.fr/validate", json=self.PSQI)
+        budget("0")
+        client.post("/api/auto/questionnaires/UNKNOWN.fr/validate", json=self.PSQI)
+        assert self._records(caplog) == []
+
+    def test_shape_fingerprint(self):
+        """Test answer sets with the same pattern share a fingerprint"""
+        from api.slowlog import answer_shape, shape_fingerprint
+
+        first = answer_shape({"q1": "22:30", "q2": 1, "q3": ["a", "b"]})
+        second = answer_shape({"q1": "07:05", "q2": 3, "q3": ["c", "d"]})
+        assert first == {"q1": "str(9:9)", "q2": "int", "q3": "list[2]"}
+        assert shape_fingerprint(first) == shape_fingerprint(second)
+        assert shape_fingerprint(first) != shape_fingerprint(answer_shape({"q1": "22h30", "q2": 1, "q3": []}))
+
+
+class TestSyntheticAnswers:
+    """Test answer sets generated from questionnaire definitions"""
+
+    @staticmethod
+    def _questionnaires(registry):
+        for category in ("auto", "hetero"):
+            for questionnaire_id in registry.questionnaire_ids(category):
+                yield questionnaire_id, registry.get_adapter(category, questionnaire_id)
+
+    def test_valid_sets_validate_and_score(self, registry):
+        """Test every generated valid set passes validation and scores, for every questionnaire"""
+        from api.schemas import AnswersRequest
+        from api.synthetic import AnswerGenerator
+
+        for questionnaire_id, adapter in self._questionnaires(registry):
+            for submission in AnswerGenerator(adapter.questionnaire, seed=0).valid(50):
+                request = AnswersRequest(**submission)
+                assert adapter.validate_submission(request)["valid"], (questionnaire_id, submission)
+                adapter.score_submission(request)
+
+    def test_invalid_sets_rejected(self, registry):
+        """Test every generated invalid set fails validation or scoring"""
+        from api.schemas import AnswersRequest
+        from api.synthetic import AnswerGenerator
+
+        for _, adapter in self._questionnaires(registry):
+            for submission, _ in AnswerGenerator(adapter.questionnaire, seed=0).invalid(50):
+                request = AnswersRequest(**submission)
+                if adapter.validate_submission(request)["valid"]:
+                    with pytest.raises(Exception):
+                        adapter.score_submission(request)
+
+    def test_branching_rules(self, registry):
+        """Test hidden questions are left unanswered"""
+        from api.synthetic import AnswerGenerator
+
+        etat = AnswerGenerator(registry.get_questionnaire("hetero", "EtatPatient.fr"), seed=0, optional_rate=1.0)
+        for submission in etat.valid(50):
+            answers = submission["answers"]
+            assert ("dep_insomnia" in answers) == (answers["dep_sleep"] == 1)
+
+        prise_m = AnswerGenerator(registry.get_questionnaire("auto", "PRISE-M.fr"), seed=0)
+        for submission in prise_m.valid(50):
+            assert ("q20" in submission["answers"]) == (submission["demographics"]["gender"] == "F")
+
+        cgi = AnswerGenerator(registry.get_questionnaire("hetero", "CGI.fr"), seed=0)
+        for submission in cgi.valid(50):
+            assert ("cgi02" in submission["answers"]) == (submission["visit_type"] == "followup")
+
+    def test_seed_reproducible(self, registry):
+        """Test the same seed yields the same sequence"""
+        from api.synthetic import AnswerGenerator
+
+        psqi = registry.get_questionnaire("auto", "PSQI.fr")
+        assert list(AnswerGenerator(psqi, seed=3).valid(5)) == list(AnswerGenerator(psqi, seed=3).valid(5))
+
+    def test_ndjson_feeds_submit_stream(self, client, registry):
+        """Test NDJSON records score as valid or fail as invalid, matched by id"""
+        import io
+        from api.synthetic import AnswerGenerator, write_ndjson
+
+        stream = io.StringIO()
+        generator = AnswerGenerator(registry.get_questionnaire("auto", "MDQ.fr"), seed=0)
+        write_ndjson(generator, stream, count=40, invalid_rate=0.5)
+
+        response = client.post("/api/auto/questionnaires/MDQ.fr/submit-stream", content=stream.getvalue())
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert len(records) == 40
+        assert {r["success"] for r in records} == {True, False}
+        assert all(r["success"] == r["id"].startswith("valid-") for r in records)
+
+
+class TestFootprint:
+    """Test the import-time and memory footprint report"""
+
+    def test_probe_in_fresh_interpreter(self):
+        """Test one questionnaire is measured in a child interpreter, class tables included"""
+        from api.footprint import run_probe
+
+        row = run_probe("probe('questionnaires.auto.eq5del', 'EQ5D5L')")
+        assert row["import_ms"] > 0
+        assert row["questions"] == 6
+        # The value set is packed and only read on first scoring
+        assert row["largest_table"] == "EQ5D5L.DIMENSIONS"
+        assert 0 < row["largest_table_kib"] < row["instance_kib"]
+
+    def test_deep_size_skips_code(self):
+        """Test deep sizes follow data but not functions, classes or modules"""
+        from api.footprint import deep_size
+
+        class Holder:
+            def method(self):
+                return json
+
+        holder = Holder()
+        holder.table = {"key": ["a" * 1000]}
+        size, counts = deep_size(holder)
+        assert size > 1000
+        assert counts["Holder"] == 1
+        assert "function" not in counts and "module" not in counts
+
+    def test_compare_reports(self):
+        """Test growth beyond both the threshold and the noise floor is a regression"""
+        from api.footprint import compare_reports
+
+        baseline = {"auto/X.fr": {"import_ms": 10.0, "instance_kib": 50.0}}
+        assert compare_reports({"auto/X.fr": {"import_ms": 10.9, "instance_kib": 80.0}}, baseline, 20) == [
+            "auto/X.fr instance_kib: 50.00 -> 80.00"
+        ]
+        assert compare_reports({"auto/X.fr": {"import_ms": 11.5, "instance_kib": 50.0}}, baseline, 20) == []
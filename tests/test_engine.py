@@ -0,0 +1,196 @@
+"""
+Tests for the shared scoring engine (declarative scale specifications)
+"""
+
+import random
+
+import pytest
+from api.dependencies import get_registry
+from api.synthetic import AnswerGenerator
+from questionnaires.engine import Band, Group, ScaleSpec, band_table, bands_of, compile_spec, item_ids
+
+
+SPEC = ScaleSpec(
+    items=item_ids(6),
+    min_value=1,
+    max_value=4,
+    reverse=frozenset({"q2", "q5"}),
+    groups=(
+        Group("a", ("q1", "q2", "q3")),
+        Group("b", ("q4", "q5", "q6"), "mean"),
+        Group("peak", ("q1", "q4"), "max"),
+        Group("single", ("q6",))
+    ),
+    bands=(Band(6, 10, "low"), Band(11, 18, "medium"), Band(19, 24, "high"))
+)
+
+
+class TestCompiledScale:
+    """Test validation and scoring of a compiled specification."""
+
+    def test_reverse_scoring(self):
+        """Test reverse items are recoded as min + max - value."""
+        scale = compile_spec(SPEC)
+        values = scale.values({f"q{i}": i % 4 + 1 for i in range(1, 7)})
+        assert values == [2, 3, 4, 1, 2, 3]
+        assert scale.score(values) == [2, 2, 4, 1, 3, 3]
+        assert scale.reversed == (False, True, False, False, True, False)
+
+    def test_group_aggregations(self):
+        """Test sum, mean and max groups."""
+        scale = compile_spec(SPEC)
+        groups = scale.group_scores([2, 2, 4, 1, 3, 3])
+        assert groups == {"a": 8, "b": 7 / 3.0, "peak": 2, "single": 3}
+
+    def test_bands(self):
+        """Test band lookup, including scores outside every band."""
+        scale = compile_spec(SPEC)
+        assert scale.band(6) == "low"
+        assert scale.band(10) == "low"
+        assert scale.band(11) == "medium"
+        assert scale.band(24) == "high"
+        assert scale.band(5) is None
+        assert scale.band(25, "out") == "out"
+
+    def test_errors(self):
+        """Test missing, non-integer and out-of-range answers are reported in order."""
+        scale = compile_spec(SPEC._replace(range_hint=" (A=1)"))
+        assert scale.errors({f"q{i}": 1 for i in range(1, 7)}) == []
+        assert scale.errors({"q1": 1.0, "q2": 5, "q3": 1, "q4": 1}) == [
+            "Items manquants: q5, q6",
+            "q1: la valeur doit être un entier (reçu: float)",
+            "q2: la valeur doit être entre 1 et 4 (A=1) (reçu: 5)"
+        ]
+
+    def test_booleans_accepted_like_integers(self):
+        """Test booleans pass validation as the hand-written validators allowed."""
+        scale = compile_spec(SPEC)
+        assert scale.errors({**{f"q{i}": 2 for i in range(1, 7)}, "q1": True}) == []
+
+    def test_invalid_specs(self):
+        """Test unknown group items or aggregations and overlapping bands are rejected."""
+        with pytest.raises(ValueError):
+            compile_spec(SPEC._replace(groups=(Group("x", ("q9",)),)))
+        with pytest.raises(ValueError):
+            compile_spec(SPEC._replace(groups=(Group("x", ("q1",), "median"),)))
+        with pytest.raises(ValueError):
+            compile_spec(SPEC._replace(bands=(Band(0, 10, "a"), Band(10, 20, "b"))))
+
+    def test_band_table_from_cutoffs(self):
+        """Test (low, high, label) cutoff lists convert to band tables."""
+        table = band_table([(5, 5, "none"), (6, 7, "low"), (8, 25, "high")])
+        assert [table.lookup(score) for score in (5, 6, 7, 8, 25, 26)] == ["none", "low", "low", "high", "high", None]
+
+
+class TestScoreBatch:
+    """Test vectorized batch scoring against the scalar scorer."""
+
+    def test_matches_scalar_scoring(self):
+        """Test item, group and total scores and band codes equal the per-row results."""
+        np = pytest.importorskip("numpy")
+        scale = compile_spec(SPEC)
+        rng = random.Random(0)
+        rows = [[rng.randint(1, 4) for _ in range(6)] for _ in range(200)]
+        batch = scale.score_batch(np.array(rows))
+        assert batch.valid.all()
+        for index, row in enumerate(rows):
+            scored = scale.score(row)
+            assert batch.scored[index].tolist() == scored
+            assert batch.total[index] == sum(scored)
+            assert batch.severity_labels[batch.severity[index]] == scale.band(sum(scored))
+            for name, score in scale.group_scores(scored).items():
+                assert batch.groups[name][index] == pytest.approx(score)
+
+    def test_invalid_rows_flagged(self):
+        """Test out-of-range, non-integral and missing (NaN) answers invalidate their row only."""
+        np = pytest.importorskip("numpy")
+        scale = compile_spec(SPEC)
+        batch = scale.score_batch([
+            [1, 1, 1, 1, 1, 1],
+            [1, 1, 1, 1, 1, 5],
+            [1, 1, 1.5, 1, 1, 1],
+            [1, np.nan, 1, 1, 1, 1]
+        ])
+        assert batch.valid.tolist() == [True, False, False, False]
+        assert batch.severity.tolist()[1:] == [-1, -1, -1]
+
+    def test_columnar_input(self):
+        """Test a mapping of item columns scores like the equivalent matrix, and missing items raise."""
+        np = pytest.importorskip("numpy")
+        scale = compile_spec(SPEC)
+        rows = np.array([[1, 2, 3, 4, 1, 2], [4, 3, 2, 1, 4, 3]])
+        batch = scale.score_batch({item: rows[:, index] for index, item in enumerate(scale.items)})
+        assert batch.total.tolist() == scale.score_batch(rows).total.tolist()
+        with pytest.raises(ValueError, match="Items manquants: q6"):
+            scale.score_batch({item: rows[:, index] for index, item in enumerate(scale.items[:5])})
+        with pytest.raises(ValueError):
+            scale.score_batch(rows[:, :5])
+
+    def test_item_maxima_and_group_totals(self):
+        """Test per-item maxima in validation and reverse scoring, and totals summed over groups."""
+        np = pytest.importorskip("numpy")
+        scale = compile_spec(ScaleSpec(
+            items=item_ids(3),
+            min_value=0,
+            max_value=4,
+            reverse=frozenset({"q2"}),
+            item_max=(("q2", 8),),
+            groups=(Group("a", ("q1", "q2"), "max", bands_of([(0, 4, "low"), (5, 8, "high")])), Group("b", ("q3",))),
+            total="groups"
+        ))
+        assert scale.errors({"q1": 4, "q2": 8, "q3": 0}) == []
+        assert scale.errors({"q1": 5, "q2": 9, "q3": 0}) == [
+            "q1: la valeur doit être entre 0 et 4 (reçu: 5)",
+            "q2: la valeur doit être entre 0 et 8 (reçu: 9)"
+        ]
+        batch = scale.score_batch(np.array([[4, 8, 1], [1, 2, 3]]))
+        assert batch.scored.tolist() == [[4, 0, 1], [1, 6, 3]]
+        assert batch.groups["a"].tolist() == [4, 6]
+        assert batch.total.tolist() == [5, 9]
+        assert batch.group_severity["a"].tolist() == [0, 1]
+        assert scale.group_band("a", 6) == "high"
+
+    def test_mean_of_group_means(self):
+        """Test the group_mean total on BIS-10 (overall impulsivity is the mean of the subscale means)."""
+        np = pytest.importorskip("numpy")
+        questionnaire = get_registry().get_questionnaire("auto", "BIS10.fr")
+        answer_sets = [submission["answers"] for submission in AnswerGenerator(questionnaire, seed=0).valid(100)]
+        batch = questionnaire.score_batch([[answers[item] for item in questionnaire.SCALE.items] for answers in answer_sets])
+        assert batch.valid.all()
+        for index, answers in enumerate(answer_sets):
+            result = questionnaire.calculate_score(answers)
+            assert batch.total[index] == pytest.approx(result.overall_impulsivity, abs=0.005)
+            for name, subscale in result.subscales.items():
+                assert batch.groups[name][index] == pytest.approx(subscale.mean_score, abs=0.005)
+        with pytest.raises(ValueError, match="Unknown total"):
+            compile_spec(SPEC._replace(total="median"))
+
+    @pytest.mark.parametrize("category,questionnaire_id", [
+        ("auto", "STAI-YA.fr"), ("auto", "CTQ.fr"), ("auto", "QIDS-SR16.fr"), ("auto", "AQ12.fr"),
+        ("auto", "ALS-Short.fr"), ("hetero", "MADRS.fr"), ("hetero", "YMRS.fr")
+    ])
+    def test_instruments_match_calculate_score(self, category, questionnaire_id):
+        """Test batch totals, subscales and severities equal calculate_score() on generated answers."""
+        np = pytest.importorskip("numpy")
+        questionnaire = get_registry().get_questionnaire(category, questionnaire_id)
+        answer_sets = [submission["answers"] for submission in AnswerGenerator(questionnaire, seed=0).valid(100)]
+        batch = questionnaire.score_batch({
+            item: np.array([answers[item] for answers in answer_sets]) for item in questionnaire.SCALE.items
+        })
+        assert batch.valid.all()
+        # ALS-Short reports means rounded to 2 decimals
+        tolerance = 0.01
+        for index, answers in enumerate(answer_sets):
+            result = questionnaire.calculate_score(answers)
+            result = result if isinstance(result, dict) else vars(result)
+            assert batch.total[index] == pytest.approx(result["total_score"], abs=tolerance)
+            subscales = result.get("subscale_scores") or result.get("domain_scores") or {}
+            for name, score in subscales.items():
+                if isinstance(score, dict):
+                    label = batch.group_severity_labels[name][batch.group_severity[name][index]]
+                    assert label == score["severity"]
+                    score = score["score"]
+                assert batch.groups[name][index] == pytest.approx(score, abs=tolerance)
+            if "severity" in result:
+                label = batch.severity_labels[batch.severity[index]]
+                assert result["severity"] in (label if isinstance(label, tuple) else (label,))
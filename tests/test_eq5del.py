@@ -556,5 +556,247 @@ class TestEQ5D5LIntegration:
         assert result.profile == "55555"
 
 
+
+class TestEQ5D5LValueSet:
+    """Test the packed France value set and its profile codes"""
+    
+    def setup_method(self):
+        """Setup test fixture"""
+        from questionnaires.auto.eq5del.value_set import load_value_set
+        self.value_set = load_value_set("FR")
+    
+    def test_profile_codes(self):
+        """Test base-5 codes follow the order of the profile strings"""
+        from questionnaires.auto.eq5del.value_set import PROFILES, code_of, profile_code, profile_of
+        
+        assert profile_code((1, 1, 1, 1, 1)) == 0
+        assert profile_code((5, 5, 5, 5, 5)) == PROFILES - 1
+        assert code_of("21341") == profile_code((2, 1, 3, 4, 1)) == 625 + 50 + 15
+        assert [profile_of(code) for code in range(PROFILES)] == sorted(profile_of(code) for code in range(PROFILES))
+        assert all(code_of(profile_of(code)) == code for code in range(PROFILES))
+    
+    def test_known_utilities(self):
+        """Test utilities of reference profiles (France crosswalk)"""
+        expected = {"11111": 1.0, "21341": 0.474, "12345": 0.116, "33333": 0.275, "54321": -0.031, "55555": -0.53}
+        for profile, utility in expected.items():
+            assert self.value_set.lookup_profile(profile) == utility
+            assert self.value_set.lookup([int(digit) for digit in profile]) == utility
+    
+    def test_packed_resource_round_trip(self):
+        """Test the packed form is 3,125 int16 values and round-trips through a mapping"""
+        from questionnaires.auto.eq5del.value_set import PROFILES, ValueSet, profile_of
+        
+        data = self.value_set.to_bytes()
+        assert len(data) == 2 * PROFILES
+        mapping = {profile_of(code): self.value_set.utility(code) for code in range(PROFILES)}
+        assert ValueSet.from_mapping("FR", mapping).to_bytes() == data
+        with pytest.raises(ValueError):
+            ValueSet.from_mapping("FR", {**mapping, "11112": 0.9295})
+        with pytest.raises(ValueError):
+            ValueSet.from_bytes("FR", data[:-2])
+    
+    def test_vectorized_lookup(self):
+        """Test lookup_many matches single lookups and rejects invalid levels"""
+        np = pytest.importorskip("numpy")
+        levels = np.array([[1, 1, 1, 1, 1], [2, 1, 3, 4, 1], [5, 5, 5, 5, 5], [3, 2, 5, 1, 4]])
+        assert self.value_set.lookup_many(levels).tolist() == [self.value_set.lookup(row) for row in levels.tolist()]
+        with pytest.raises(ValueError):
+            self.value_set.lookup_many([[0, 1, 1, 1, 1]])
+        with pytest.raises(ValueError):
+            self.value_set.lookup_many([[1, 1, 1, 1]])
+
+
+class TestEQ5D5LValueSetRegistry:
+    """Test value set selection, registration and on-demand loading"""
+    
+    ANSWERS = {"q1": 2, "q2": 1, "q3": 3, "q4": 4, "q5": 1, "vas": 75}
+    
+    @pytest.fixture(autouse=True)
+    def registry(self, monkeypatch, tmp_path):
+        """Register a test value set (the France utilities, negated) for the duration of a test"""
+        from questionnaires.auto.eq5del import value_set
+        
+        monkeypatch.setattr(value_set, "_REGISTERED", {})
+        france = value_set.load_value_set("FR")
+        path = tmp_path / "XT.bin"
+        path.write_bytes(value_set.ValueSet("XT", [-utility for utility in france.thousandths]).to_bytes())
+        value_set.register_value_set("XT", path)
+        self.eq5d = EQ5D5L()
+        yield value_set
+        value_set.load_value_set.cache_clear()
+    
+    def test_default_value_set(self):
+        """Test the France value set is used when none is requested"""
+        result = self.eq5d.calculate_score(self.ANSWERS)
+        assert result.index_value == 0.474
+        assert result.index_values is None
+        assert "Index d'utilité (France): 0.474" in result.interpretation
+    
+    def test_several_value_sets(self):
+        """Test one call computes the index under each requested value set"""
+        result = self.eq5d.calculate_score(self.ANSWERS, value_set=["XT", "FR"])
+        assert result.index_value == -0.474
+        assert result.index_values == {"XT": -0.474, "FR": 0.474}
+        assert "Index d'utilité (XT): -0.474" in result.interpretation
+        assert self.eq5d.calculate_score(self.ANSWERS, value_set="FR").index_values == {"FR": 0.474}
+    
+    def test_unknown_value_set(self):
+        """Test unknown value sets are rejected with the available ones"""
+        with pytest.raises(EQ5D5LError, match="disponibles: FR, XT"):
+            self.eq5d.calculate_score(self.ANSWERS, value_set=["FR", "../FR"])
+        with pytest.raises(EQ5D5LError):
+            self.eq5d.calculate_score(self.ANSWERS, value_set=[])
+    
+    def test_only_used_value_sets_loaded(self, registry):
+        """Test value sets are listed without loading, and loaded (memory-mapped) on first use"""
+        registry.load_value_set.cache_clear()
+        assert registry.available_value_sets() == ("FR", "XT")
+        assert self.eq5d.get_metadata()["value_sets"] == ["FR", "XT"]
+        assert registry.load_value_set.cache_info().currsize == 0
+        self.eq5d.calculate_score(self.ANSWERS)
+        assert registry.load_value_set.cache_info().currsize == 1
+        self.eq5d.calculate_score(self.ANSWERS, value_set=["FR", "XT"])
+        assert registry.load_value_set.cache_info().currsize == 2
+        assert isinstance(registry.load_value_set("XT").thousandths, memoryview)
+    
+    def test_register_rejects_invalid_files(self, registry, tmp_path):
+        """Test registration needs an existing file, and loading a packed value set"""
+        with pytest.raises(FileNotFoundError):
+            registry.register_value_set("XM", tmp_path / "missing.bin")
+        path = tmp_path / "XS.bin"
+        path.write_bytes(b"\x00" * 10)
+        registry.register_value_set("XS", path)
+        with pytest.raises(ValueError):
+            registry.load_value_set("XS")
+
+
+
+class TestEQ5D5LBatch:
+    """Test vectorized scoring of many respondents"""
+    
+    def setup_method(self):
+        """Setup test fixture"""
+        self.np = pytest.importorskip("numpy")
+        self.eq5d = EQ5D5L()
+    
+    def test_matches_calculate_score(self):
+        """Test every health state scores as with calculate_score()"""
+        from questionnaires.auto.eq5del.value_set import PROFILES, profile_of
+        
+        profiles = [profile_of(code) for code in range(PROFILES)]
+        rows = [[int(digit) for digit in profile] + [code % 101] for code, profile in enumerate(profiles)]
+        batch = self.eq5d.score_batch(self.np.array(rows))
+        assert batch.valid.all()
+        assert batch.profile_codes.tolist() == list(range(PROFILES))
+        for code in range(0, PROFILES, 7):
+            result = self.eq5d.calculate_score(dict(zip(EQ5D5L.ITEMS, rows[code])))
+            assert profile_of(int(batch.profile_codes[code])) == result.profile
+            assert batch.index_value[code] == result.index_value
+            assert batch.vas_score[code] == result.vas_score
+            assert batch.dimensions[code].tolist() == list(result.dimensions.values())
+    
+    def test_columns_and_invalid_rows(self):
+        """Test columnar input, and rows failing validation flagged with NaN index values"""
+        columns = {
+            "q1": [2, 6, 1, float("nan")], "q2": [1, 1, 1, 1], "q3": [3, 1, 1, 1],
+            "q4": [4, 1, 1, 1], "q5": [1, 1, 1, 1], "vas": [75, 50, 101, 50]
+        }
+        batch = self.eq5d.score_batch(columns, value_set=["FR"])
+        assert batch.valid.tolist() == [True, False, False, False]
+        assert batch.profile_codes.tolist() == [690, -1, -1, -1]
+        assert batch.index_values["FR"][0] == 0.474
+        assert self.np.isnan(batch.index_value[1:]).all()
+        with pytest.raises(ValueError):
+            self.eq5d.score_batch({"q1": [1]})
+        with pytest.raises(ValueError):
+            self.eq5d.score_batch([[1, 1, 1, 1, 1]])
+        with pytest.raises(EQ5D5LError):
+            self.eq5d.score_batch([[1, 1, 1, 1, 1, 50]], value_set="ZZ")
+
+
+class TestEQ5D5LProfileTable:
+    """Test the per-profile values precomputed for all 3,125 profiles"""
+    
+    def setup_method(self):
+        """Setup test fixture"""
+        from questionnaires.auto.eq5del.eq5del import profile_table
+        self.eq5d = EQ5D5L()
+        self.table = profile_table()
+    
+    def test_rows_match_profiles(self):
+        """Test counts, sums and descriptions of every profile"""
+        from questionnaires.auto.eq5del.value_set import PROFILES, profile_of
+        
+        for code in range(PROFILES):
+            levels = [int(digit) for digit in profile_of(code)]
+            row = self.table.row(code)
+            assert row["levels"] == levels
+            assert row["problems"] == sum(1 for level in levels if level > 1)
+            assert row["severe"] == sum(1 for level in levels if level >= 4)
+            assert row["level_sum"] == sum(levels)
+            assert row["misery_index"] == sum(levels) - 5
+            assert self.table.describe(code) == {
+                name: texts[level - 1] for (name, texts), level in zip(EQ5D5L.DIMENSIONS, levels)
+            }
+    
+    def test_interpretation_fragments(self):
+        """Test the profile sentence of the interpretation is read from the table"""
+        from questionnaires.auto.eq5del.value_set import code_of
+        
+        assert len(self.table.fragments) == 12
+        assert self.table.row(code_of("11111"))["interpretation"].startswith("État de santé optimal")
+        assert self.table.fragment(code_of("55555")).startswith("État de santé le plus défavorable")
+        assert self.table.fragment(code_of("21341")) == "1 dimension(s) avec problèmes sévères ou extrêmes. "
+        assert self.table.fragment(code_of("21231")) == "3 dimension(s) avec problèmes. "
+        result = self.eq5d.calculate_score({"q1": 2, "q2": 1, "q3": 2, "q4": 3, "q5": 1, "vas": 60})
+        assert "3 dimension(s) avec problèmes. " in result.interpretation
+    
+    def test_get_profile_table(self):
+        """Test the full table adds the utility index of each profile"""
+        table = self.eq5d.get_profile_table()
+        assert table["value_set"] == "FR"
+        assert list(table["dimensions"]) == [name for name, _ in EQ5D5L.DIMENSIONS]
+        assert len(table["profiles"]) == 3125
+        assert table["profiles"][0]["index_value"] == 1.0
+        assert table["profiles"][690]["profile"] == "21341"
+        assert table["profiles"][690]["index_value"] == 0.474
+        with pytest.raises(EQ5D5LError):
+            self.eq5d.get_profile_table("ZZ")
+
+
+class TestEQ5DCompatibility:
+    """Test the former questionnaires.auto.eq5d interface over the single implementation"""
+    
+    ANSWERS = {"q1": 2, "q2": 1, "q3": 3, "q4": 4, "q5": 1, "vas": 75}
+    
+    def test_same_questionnaire(self):
+        """Test both import paths share questions, validation, errors and profile descriptions"""
+        from questionnaires.auto import eq5d
+        
+        legacy = eq5d.EQ5D5L()
+        assert isinstance(legacy, EQ5D5L)
+        assert eq5d.EQ5D5LError is EQ5D5LError
+        assert eq5d.ValidationResult is ValidationResult
+        assert legacy.get_full_questionnaire() == EQ5D5L().get_full_questionnaire()
+        assert legacy.calculate_profile(self.ANSWERS) == "21341"
+        assert legacy.get_profile_description("55555") == EQ5D5L().get_profile_description("55555")
+        with pytest.raises(EQ5D5LError):
+            legacy.calculate_score({"q1": 2})
+    
+    def test_former_result_shape(self):
+        """Test the former result shape, now with the utility index"""
+        from questionnaires.auto.eq5d import EQ5D5L as LegacyEQ5D5L, ScoreResult as LegacyScoreResult
+        
+        result = LegacyEQ5D5L().calculate_score(self.ANSWERS)
+        assert isinstance(result, LegacyScoreResult)
+        assert result.profile == "21341"
+        assert result.vas_score == 75
+        assert result.index_value == 0.474
+        assert result.dimension_scores == {
+            "mobility": 2, "self_care": 1, "usual_activities": 3, "pain_discomfort": 4, "anxiety_depression": 1
+        }
+        assert result.interpretation == EQ5D5L().calculate_score(self.ANSWERS).interpretation
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
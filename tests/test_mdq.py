@@ -198,6 +198,15 @@ class TestMDQValidation:
         assert validation.valid is False
         assert "Q3" in validation.errors[0]
     
+    def test_invalid_q1_value_type(self):
+        """Test validation reports non-integer Q1 values instead of failing"""
+        answers = {f"q1_{i}": 0 for i in range(1, 14)}
+        answers['q1_5'] = "oui"
+        validation = self.mdq.validate_answers(answers)
+        
+        assert validation.valid is False
+        assert "Q1 items" in validation.errors[0]
+    
     def test_warning_q3_impact_with_no_symptoms(self):
         """Test warning when Q3 indicates problem but no Q1 symptoms"""
         answers = {f"q1_{i}": 0 for i in range(1, 14)}  # All no
@@ -260,6 +269,16 @@ class TestMDQScreening:
         assert result.q1_total == 6
         assert result.screening_result == "NEGATIF"
     
+    def test_screening_hidden_q2_q3_omitted(self):
+        """Test screening when Q2 and Q3 are hidden (<2 symptoms) and not answered"""
+        answers = {f"q1_{i}": 1 if i == 1 else 0 for i in range(1, 14)}
+        
+        result = self.mdq.calculate_screening(answers)
+        
+        assert result.q1_total == 1
+        assert result.q2_concurrent is False
+        assert result.screening_result == "NEGATIF"
+    
     def test_screening_negative_no_concurrence(self):
         """Test negative screening with symptoms but no concurrence"""
         answers = {f"q1_{i}": 1 for i in range(1, 11)}  # 10 symptoms
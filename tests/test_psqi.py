@@ -0,0 +1,145 @@
+"""
+Tests for PSQI (Pittsburgh Sleep Quality Index)
+Time field parsing, validation and batch scoring
+"""
+
+import pytest
+from questionnaires.auto.psqi import PSQI, PSQIError
+from questionnaires.auto.psqi.times import (
+    MALFORMED,
+    OUT_OF_RANGE,
+    parse_clock,
+    parse_clock_column,
+    parse_sleep_hours,
+    parse_sleep_times
+)
+
+
+ANSWERS = {
+    "q1": "23:15", "q2": 20, "q3": "07:00", "q4": "6:30",
+    "q6": 1, "q7": 0, "q8": 1, "q9": 1,
+    **{f"q5{c}": 1 for c in "abcdefghij"}
+}
+
+
+class TestPSQITimeParsing:
+    """Test the time field parser shared by validation and scoring."""
+
+    def test_parse_clock(self):
+        """Test HH:MM clock times to minutes since midnight."""
+        assert parse_clock("00:00") == 0
+        assert parse_clock("23:15") == 23 * 60 + 15
+        assert parse_clock("23:59") == 1439
+        assert parse_clock("24:00") == OUT_OF_RANGE
+        assert parse_clock("12:60") == OUT_OF_RANGE
+        for value in ("7:00", "0700", "07h00", "07:00\n", " 7:00", "aa:bb", "", None, 2230):
+            assert parse_clock(value) == MALFORMED, value
+
+    def test_parse_sleep_hours(self):
+        """Test hours of sleep as H:MM, HH:MM or a number."""
+        assert parse_sleep_hours("6:30") == 6.5
+        assert parse_sleep_hours("07:45") == 7.75
+        assert parse_sleep_hours("6.5") == 6.5
+        assert parse_sleep_hours(" 7 ") == 7.0
+        assert parse_sleep_hours("+6.5") == 6.5
+        assert parse_sleep_hours(".5") == 0.5
+        assert parse_sleep_hours("7.") == 7.0
+        assert parse_sleep_hours("7e-1") == 0.7
+        assert parse_sleep_hours(7) == 7.0
+        assert parse_sleep_hours(-1) == -1.0
+        for value in ("-3", "abc", ".", "+", "7:3a", "7e", "7.5.1", "1_0", "nan", "inf", "٧", "7:30\n", None, [7]):
+            assert parse_sleep_hours(value) is None, value
+
+    def test_parse_sleep_times(self):
+        """Test one submission's time fields are parsed into one tuple."""
+        times = parse_sleep_times(ANSWERS)
+        assert times.bedtime == 23 * 60 + 15
+        assert times.waketime == 7 * 60
+        assert times.sleep_hours == 6.5
+        assert times.time_in_bed_hours == 7.75
+        missing = parse_sleep_times({"q1": "23:00"})
+        assert missing.waketime == MALFORMED
+        assert missing.sleep_hours is None
+        assert missing.time_in_bed_hours is None
+
+    def test_parse_clock_column(self):
+        """Test a column of clock times parses like parse_clock()."""
+        pytest.importorskip("numpy")
+        values = ["23:15", "07:00", "24:00", "7:00", "07:000", "", "ab:cd", "00:00", "12:60"]
+        assert parse_clock_column(values).tolist() == [parse_clock(value) for value in values]
+        assert parse_clock_column(["", "1"]).tolist() == [MALFORMED, MALFORMED]
+        with pytest.raises(ValueError):
+            parse_clock_column([["23:15"]])
+
+
+class TestPSQIValidation:
+    """Test validation and scoring messages for the time fields."""
+
+    def setup_method(self):
+        """Setup test fixture."""
+        self.psqi = PSQI()
+
+    def test_time_errors(self):
+        """Test malformed and out-of-range clock times, and invalid sleep hours."""
+        result = self.psqi.validate_answers({**ANSWERS, "q1": "11pm", "q3": "25:00", "q4": "-3"})
+        assert result.errors == [
+            "q1: Format HH:MM attendu (reçu: '11pm')",
+            "q3: Heure invalide: '25:00'",
+            "q4 invalide (attendu HH:MM ou nombre d'heures), reçu: '-3'"
+        ]
+        assert self.psqi.validate_answers({**ANSWERS, "q4": -1}).errors == ["q4 (heures de sommeil) doit être >= 0"]
+
+    def test_time_in_bed_warnings(self):
+        """Test implausible times in bed are flagged."""
+        short = self.psqi.validate_answers({**ANSWERS, "q1": "05:00", "q3": "07:00"})
+        assert short.valid and short.warnings[0].startswith("Temps au lit très court (2.0h)")
+        with pytest.raises(PSQIError, match="Temps au lit nul"):
+            self.psqi.calculate_score({**ANSWERS, "q1": "07:00", "q3": "07:00"})
+
+    def test_score(self):
+        """Test the scores derived from the time fields."""
+        result = self.psqi.calculate_score(ANSWERS)
+        assert result.time_in_bed_hours == 7.75
+        assert result.sleep_hours == 6.5
+        assert result.sleep_efficiency_pct == pytest.approx(6.5 / 7.75 * 100)
+        assert result.components["duration"].score == 1
+        assert result.components["efficiency"].score == 1
+
+
+class TestPSQIBatch:
+    """Test vectorized scoring of many respondents."""
+
+    def setup_method(self):
+        """Setup test fixture."""
+        self.np = pytest.importorskip("numpy")
+        self.psqi = PSQI()
+
+    def test_matches_calculate_score(self):
+        """Test batch scores equal calculate_score() for generated answer sets."""
+        from api.synthetic import AnswerGenerator
+
+        answer_sets = [submission["answers"] for submission in AnswerGenerator(self.psqi, seed=4).valid(300)]
+        batch = self.psqi.score_batch({item: [answers[item] for answers in answer_sets] for item in PSQI.ITEMS})
+        assert batch.valid.all()
+        for index, answers in enumerate(answer_sets):
+            result = self.psqi.calculate_score(answers)
+            assert batch.total[index] == result.total_score
+            assert {name: int(scores[index]) for name, scores in batch.components.items()} == {
+                name: component.score for name, component in result.components.items()
+            }
+            assert batch.sleep_efficiency_pct[index] == result.sleep_efficiency_pct
+            assert batch.time_in_bed_hours[index] == result.time_in_bed_hours
+
+    def test_invalid_rows(self):
+        """Test rows failing validation are flagged, and numeric q4 columns."""
+        columns = {item: [ANSWERS[item]] * 4 for item in PSQI.ITEMS}
+        columns["q1"] = ["23:15", "24:00", "23:15", "07:00"]
+        columns["q3"] = ["07:00", "07:00", "07:00", "07:00"]
+        columns["q4"] = [6.5, 6.5, -1.0, 6.5]
+        batch = self.psqi.score_batch(columns)
+        assert batch.valid.tolist() == [True, False, False, False]
+        assert batch.total.tolist()[1:] == [-1, -1, -1]
+        assert self.np.isnan(batch.sleep_hours[1:]).all()
+        assert batch.total[0] == self.psqi.calculate_score(ANSWERS).total_score
+        with pytest.raises(ValueError):
+            self.psqi.score_batch({"q1": ["23:15"]})